@@ -0,0 +1,96 @@
+"""
+Micro-benchmark: full item paint vs. low-zoom proxies on a 5,000 button scene.
+
+Usage:
+  python benchmarks/bench_canvas_lod.py [-n BUTTONS] [-f FRAMES]
+
+Lays BUTTONS buttons out in a grid and renders the whole scene FRAMES times
+at several zoom levels, once with full painting forced at every scale and
+once with the level-of-detail proxies enabled.  Each frame uses a slightly
+different zoom so cached item pixmaps do not simply get reused, as happens
+during a continuous zoom gesture.  Runs offscreen unless ``QT_QPA_PLATFORM``
+is set.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+import uuid
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QPointF, QRectF, Qt  # noqa: E402
+from PyQt6.QtGui import QImage, QPainter  # noqa: E402
+from PyQt6.QtWidgets import QApplication, QGraphicsScene  # noqa: E402
+
+from components.screen import graphics_items  # noqa: E402
+from components.screen.render_cache import render_cache  # noqa: E402
+from tools import button as button_tool  # noqa: E402
+from utils import constants  # noqa: E402
+
+ZOOMS = (0.1, 0.25, 0.5, 1.0)
+VIEW_W, VIEW_H = 1600, 900
+
+
+def _scene(count: int) -> QGraphicsScene:
+    scene = QGraphicsScene()
+    cols = 100
+    for i in range(count):
+        props = button_tool.get_default_properties()
+        props["size"] = {"width": 100, "height": 40}
+        props["text_value"] = f"B{i}"
+        item = graphics_items.ButtonItem(
+            {
+                "instance_id": str(uuid.uuid4()),
+                "tool_type": constants.ToolType.BUTTON,
+                "properties": props,
+            }
+        )
+        item.setPos(QPointF((i % cols) * 110, (i // cols) * 50))
+        scene.addItem(item)
+    return scene
+
+
+def _render(scene: QGraphicsScene, zoom: float, frames: int) -> float:
+    image = QImage(VIEW_W, VIEW_H, QImage.Format.Format_ARGB32_Premultiplied)
+    start = time.perf_counter()
+    for f in range(frames):
+        z = zoom * (1.0 + f * 0.01)
+        source = QRectF(0, 0, VIEW_W / z, VIEW_H / z)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        scene.render(painter, QRectF(image.rect()), source)
+        painter.end()
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=5000, help="number of buttons")
+    parser.add_argument("-f", type=int, default=10, help="frames per zoom level")
+    args = parser.parse_args(argv)
+
+    _app = QApplication.instance() or QApplication(sys.argv)
+    scene = _scene(args.n)
+    threshold = graphics_items.LOD_PROXY_THRESHOLD
+
+    print(f"{'zoom':>6} {'full ms/frame':>14} {'lod ms/frame':>13} {'speedup':>8}")
+    for zoom in ZOOMS:
+        graphics_items.LOD_PROXY_THRESHOLD = 0.0
+        render_cache.clear()
+        full = _render(scene, zoom, args.f) / args.f * 1e3
+        graphics_items.LOD_PROXY_THRESHOLD = threshold
+        render_cache.clear()
+        lod = _render(scene, zoom, args.f) / args.f * 1e3
+        print(f"{zoom:6.2f} {full:14.1f} {lod:13.1f} {full / lod:7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+"""
+Micro-benchmark: generated vs. cached runtime button stylesheets.
+
+Usage:
+  python benchmarks/bench_qss.py [-n BUTTONS] [-r ROUNDS] [-s STYLES]
+
+Creates BUTTONS push buttons in one parent and restyles all of them ROUNDS
+times, cycling through STYLES distinct styles.  The old path generates CSS
+for every restyle; the new path takes the cached rule.  Both set the rule
+with ``setStyleSheet`` per button, as the runtime does.
+Runs offscreen unless ``QT_QPA_PLATFORM`` is set.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QPushButton, QWidget  # noqa: E402
+
+from tools.button import qss  # noqa: E402
+from tools.button.conditional_style import FrozenStyle  # noqa: E402
+
+
+def _styles(count: int):
+    return [
+        FrozenStyle.of(
+            {
+                "background_color": f"#{(i * 40) % 256:02x}60{(255 - i * 40) % 256:02x}",
+                "text_color": "#ffffff",
+                "border_width": 2,
+                "border_color": "#202020",
+                "border_radius": 10 + i,
+                "font_size": 30,
+                "bold": bool(i % 2),
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def _buttons(count: int):
+    parent = QWidget()
+    buttons = []
+    for i in range(count):
+        b = QPushButton(f"B{i}", parent)
+        b.setGeometry((i % 25) * 82, (i // 25) * 42, 80, 40)
+        buttons.append(b)
+    parent.resize(25 * 82, (count // 25 + 1) * 42)
+    parent.show()
+    return parent, buttons
+
+
+def _per_widget(buttons, styles, rounds, app) -> float:
+    start = time.perf_counter()
+    for r in range(rounds):
+        for i, b in enumerate(buttons):
+            props = styles[(i + r) % len(styles)]
+            # Uncached generation, as every style change used to do
+            rule = qss._build_rule(props, b.width(), b.height())
+            b.setStyleSheet(f"QPushButton{{{rule}}}")
+        app.processEvents()
+    return time.perf_counter() - start
+
+
+def _cached(buttons, styles, rounds, app) -> float:
+    start = time.perf_counter()
+    for r in range(rounds):
+        for i, b in enumerate(buttons):
+            props = styles[(i + r) % len(styles)]
+            rule = qss.runtime_rule(props, b.width(), b.height())
+            b.setStyleSheet(f"QPushButton{{{rule}}}")
+        app.processEvents()
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=500, help="number of buttons")
+    parser.add_argument("-r", type=int, default=20, help="restyle rounds")
+    parser.add_argument("-s", type=int, default=4, help="distinct styles")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    styles = _styles(max(1, args.s))
+
+    _parent_old, old_buttons = _buttons(args.n)
+    old = _per_widget(old_buttons, styles, args.r, app)
+    _parent_new, new_buttons = _buttons(args.n)
+    new = _cached(new_buttons, styles, args.r, app)
+
+    restyles = args.n * args.r
+    print(f"{'path':24} {'total ms':>10} {'us/restyle':>11}")
+    print(f"{'generated rules':24} {old * 1e3:10.1f} {old / restyles * 1e6:11.1f}")
+    print(f"{'cached rules':24} {new * 1e3:10.1f} {new / restyles * 1e6:11.1f}")
+    print(f"speedup: {old / new:.1f}x  ({qss.cache_info()['runtime_rules']} cached rules)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
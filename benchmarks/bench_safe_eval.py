@@ -0,0 +1,59 @@
+"""
+Micro-benchmark: compiled safe_eval vs. the tree-walking interpreter.
+
+Usage:
+  python benchmarks/bench_safe_eval.py [-n ITERATIONS]
+
+Both evaluators are first cross-checked on every sample expression, then
+timed per call with warm caches.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from tools.button.conditional_style.safe_eval import _interpret, _safe_eval  # noqa: E402
+
+VARIABLES = {"Temp": 72.5, "Speed": 40, "MotorRun": True, "Mode": 2, "Level": 0}
+
+EXPRESSIONS = [
+    "Temp > 80",
+    "MotorRun and Speed >= 30",
+    "0 < Speed <= 100 and not (Mode == 3)",
+    "(Temp - 32) * 5 / 9 > 20 or Level % 2 == 1",
+    "Unknown > 1",
+    "Speed / Level",
+    "abs(Speed)",
+]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=100_000, help="iterations per expression")
+    args = parser.parse_args(argv)
+
+    for expr in EXPRESSIONS:
+        expected, got = _interpret(expr, VARIABLES), _safe_eval(expr, VARIABLES)
+        # Unsupported constructs are now rejected up front, so only
+        # successful results must match exactly.
+        if expected[1] is None and expected != got:
+            print(f"MISMATCH {expr!r}: interpreter={expected} compiled={got}")
+            return 1
+
+    print(f"{'expression':45} {'interp us':>10} {'compiled us':>12} {'speedup':>8}")
+    for expr in EXPRESSIONS:
+        old = timeit.timeit(lambda: _interpret(expr, VARIABLES), number=args.n) / args.n * 1e6
+        new = timeit.timeit(lambda: _safe_eval(expr, VARIABLES), number=args.n) / args.n * 1e6
+        print(f"{expr:45} {old:10.2f} {new:12.2f} {old / new:7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
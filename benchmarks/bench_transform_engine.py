@@ -0,0 +1,101 @@
+"""
+Micro-benchmark: align/distribute/match-size/grid on a large selection.
+
+Usage:
+  python benchmarks/bench_transform_engine.py [-n ITEMS] [-r ROUNDS]
+
+Builds a screen with ITEMS buttons, selects all of them and times each
+transform engine operation end to end: computing the new geometry, building
+the undo command and applying it to the screen data.  Canvas item updates
+are not included; they follow from the command's children delta.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from components.screen import transform_engine as te  # noqa: E402
+from services.screen_data_service import screen_service  # noqa: E402
+from tools import button as button_tool  # noqa: E402
+from utils import constants  # noqa: E402
+
+OPERATIONS = [
+    ("align left", te.align, ("left",)),
+    ("align middle", te.align, ("middle",)),
+    ("distribute x", te.distribute, ("x",)),
+    ("match size", te.match_size, ("both",)),
+    ("grid arrange", te.grid_arrange, ()),
+]
+
+
+def _screen(count: int):
+    rng = random.Random(1)
+    children = []
+    for _ in range(count):
+        props = button_tool.get_default_properties()
+        props["position"] = {"x": rng.randrange(0, 1800), "y": rng.randrange(0, 1000)}
+        props["size"] = {"width": rng.randrange(40, 160), "height": rng.randrange(20, 80)}
+        children.append(
+            {
+                "instance_id": str(uuid.uuid4()),
+                "tool_type": constants.ToolType.BUTTON,
+                "properties": props,
+            }
+        )
+    screen_id = screen_service._perform_add_screen({"type": "base", "number": 1, "children": children})
+    return screen_id, children
+
+
+def _geometry(children) -> te.SelectionGeometry:
+    geometry = te.SelectionGeometry()
+    for child in children:
+        props = child["properties"]
+        geometry.ids.append(child["instance_id"])
+        geometry.x.append(float(props["position"]["x"]))
+        geometry.y.append(float(props["position"]["y"]))
+        geometry.w.append(float(props["size"]["width"]))
+        geometry.h.append(float(props["size"]["height"]))
+    return geometry
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=1000, help="selected items")
+    parser.add_argument("-r", type=int, default=20, help="rounds per operation")
+    args = parser.parse_args(argv)
+
+    screen_id, children = _screen(args.n)
+    print(f"{'operation':14} {'compute ms':>11} {'command ms':>11} {'apply ms':>9}")
+    for name, operation, op_args in OPERATIONS:
+        compute = command = apply = 0.0
+        for _ in range(args.r):
+            before = _geometry(children)
+            t0 = time.perf_counter()
+            after = operation(before, *op_args)
+            t1 = time.perf_counter()
+            cmd = te.command_for(screen_id, before, after)
+            t2 = time.perf_counter()
+            if cmd is not None:
+                cmd.redo()
+            t3 = time.perf_counter()
+            if cmd is not None:
+                cmd.undo()
+            compute += t1 - t0
+            command += t2 - t1
+            apply += t3 - t2
+        r = args.r / 1e3
+        print(f"{name:14} {compute / r:11.2f} {command / r:11.2f} {apply / r:9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
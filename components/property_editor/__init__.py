@@ -109,11 +109,14 @@ class PropertyEditor(QWidget):
 
         pos = selection_data.get("position") or selection_data.get("properties", {}).get("position", {})
         size = selection_data.get("properties", {}).get("size", {})
-        x = int(pos.get("x", 0) or 0)
-        y = int(pos.get("y", 0) or 0)
-        w = int(size.get("width", 0) or 0)
-        h = int(size.get("height", 0) or 0)
+        self._set_geometry_values(
+            int(pos.get("x", 0) or 0),
+            int(pos.get("y", 0) or 0),
+            int(size.get("width", 0) or 0),
+            int(size.get("height", 0) or 0),
+        )
 
+    def _set_geometry_values(self, x: int, y: int, w: int, h: int) -> None:
         self.geometry_form.setDisabled(False)
         self._block_geometry_signals(True)
         self.x_spin.setValue(x)
@@ -308,6 +311,24 @@ class PropertyEditor(QWidget):
             self.editor_stack.setCurrentWidget(self.basic_editor)
             self._update_geometry_fields(selection_data)
 
+    @pyqtSlot(str, object)
+    def update_selection_geometry(self, parent_id: str, geometry: object) -> None:
+        """Reflect live drag/resize geometry ``{instance_id: (x, y, w, h)}``.
+
+        Only the fields change; the object's properties are reloaded once the
+        drag is committed.
+        """
+        if self._is_editing or parent_id != self.current_parent_id:
+            return
+        geom = geometry.get(self.current_object_id) if isinstance(geometry, dict) else None
+        if geom is None:
+            return
+        x, y, w, h = (int(v) for v in geom)
+        if self.button_editor is not None and self.editor_stack.currentWidget() is self.button_editor:
+            self.button_editor.update_geometry(x, y, w, h)
+        else:
+            self._set_geometry_values(x, y, w, h)
+
     def set_active_tool(self, tool_id) -> None:  # compatibility stub
         pass
 
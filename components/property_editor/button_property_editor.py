@@ -19,6 +19,7 @@ from services.command_history_service import command_history_service
 from services.commands import UpdateChildPropertiesCommand, MoveChildCommand
 from services.data_context import data_context
 from services.screen_data_service import screen_service
+from services.style_data_service import style_data_service
 from utils.editing_guard import EditingGuard
 from utils import constants
 
@@ -376,6 +377,7 @@ class ButtonTreePropertyEditor(QWidget):
         self._setup_ui()
         
         data_context.screens_changed.connect(self._handle_screen_event)
+        style_data_service.style_applied.connect(self._on_style_applied)
     
     def _setup_ui(self) -> None:
         """Set up the UI components."""
@@ -945,6 +947,12 @@ class ButtonTreePropertyEditor(QWidget):
                         if child and f"{category.text(0)}.{child.text(0)}" in expanded_items:
                             child.setExpanded(True)
     
+    def update_geometry(self, x: int, y: int, w: int, h: int) -> None:
+        """Show a live position/size while the object is dragged on the canvas."""
+        self.current_position = {"x": x, "y": y}
+        self.current_size = {"width": w, "height": h}
+        self._update_property_values()
+
     def _update_property_values(self) -> None:
         """Update all property values in the tree."""
         if self._blocked:
@@ -1205,6 +1213,10 @@ class ButtonTreePropertyEditor(QWidget):
         if event.get("action") == "screen_modified":
             self._on_screen_modified(event.get("screen_id", ""))
     
+    def _on_style_applied(self, style_id: str, affected: dict) -> None:
+        if self.current_object_id in affected.get(self.current_parent_id, ()):
+            self._on_screen_modified(self.current_parent_id)
+
     def _on_screen_modified(self, screen_id: str) -> None:
         # Clear selection if editing is happening or screen ID doesn't match
         if self._is_editing or screen_id != self.current_parent_id:
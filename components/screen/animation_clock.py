@@ -0,0 +1,138 @@
+# components/screen/animation_clock.py
+"""
+Single shared clock for canvas item animations.
+
+One timer advances every registered item together instead of a timer per
+item.  On each tick, items that are hidden, detached or outside every
+visible view are skipped; the rest get :meth:`advance_animation` with the
+clock time and are repainted (their bounding rect only) when it reports a
+visible change.  Items quantize their animation phase, so most ticks
+change nothing and cached frames can be reused.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List
+import weakref
+
+from PyQt6.QtCore import QElapsedTimer, QObject, QTimer, Qt
+
+DEFAULT_FPS = 30
+# Intervals kept for frame pacing statistics
+_PACING_WINDOW = 120
+
+
+@dataclass(slots=True)
+class FramePacingStats:
+    frames: int = 0
+    target_interval_ms: float = 0.0
+    mean_interval_ms: float = 0.0
+    max_interval_ms: float = 0.0
+    jitter_ms: float = 0.0
+    late_frames: int = 0
+    animated_items: int = 0
+    repainted_items: int = 0
+    skipped_items: int = 0
+
+
+class AnimationClock(QObject):
+    """Drive all animated items from one timer.
+
+    Registered items must implement ``advance_animation(t: float) -> bool``
+    (``t`` in seconds, returns ``True`` if the item needs a repaint).  The
+    timer only runs while at least one item is registered.
+    """
+
+    def __init__(self, fps: int = DEFAULT_FPS):
+        super().__init__()
+        self._items: "weakref.WeakSet" = weakref.WeakSet()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        self._clock = QElapsedTimer()
+        self._last_ms = None
+        self._intervals: Deque[float] = deque(maxlen=_PACING_WINDOW)
+        self._frames = 0
+        self._late = 0
+        self._repainted = 0
+        self._skipped = 0
+        self.set_fps(fps)
+
+    def set_fps(self, fps: int):
+        self._interval_ms = max(1, int(round(1000 / max(1, fps))))
+        self._timer.setInterval(self._interval_ms)
+
+    def now(self) -> float:
+        """Clock time in seconds (0 while stopped)."""
+        return self._clock.elapsed() / 1000.0 if self._clock.isValid() else 0.0
+
+    def register(self, item):
+        self._items.add(item)
+        if not self._timer.isActive():
+            if not self._clock.isValid():
+                self._clock.start()
+            self._last_ms = None
+            self._timer.start()
+
+    def unregister(self, item):
+        self._items.discard(item)
+        if not self._items and self._timer.isActive():
+            self._timer.stop()
+
+    def stats(self) -> FramePacingStats:
+        intervals = list(self._intervals)
+        mean = sum(intervals) / len(intervals) if intervals else 0.0
+        jitter = (
+            (sum((i - mean) ** 2 for i in intervals) / len(intervals)) ** 0.5
+            if intervals
+            else 0.0
+        )
+        return FramePacingStats(
+            frames=self._frames,
+            target_interval_ms=float(self._interval_ms),
+            mean_interval_ms=mean,
+            max_interval_ms=max(intervals, default=0.0),
+            jitter_ms=jitter,
+            late_frames=self._late,
+            animated_items=len(self._items),
+            repainted_items=self._repainted,
+            skipped_items=self._skipped,
+        )
+
+    def _tick(self):
+        now_ms = self._clock.elapsed()
+        if self._last_ms is not None:
+            interval = float(now_ms - self._last_ms)
+            self._intervals.append(interval)
+            if interval > self._interval_ms * 1.5:
+                self._late += 1
+        self._last_ms = now_ms
+        self._frames += 1
+        t = now_ms / 1000.0
+
+        # Visible scene area per scene, computed once per tick
+        viewports: Dict[int, List] = {}
+        for item in list(self._items):
+            scene = item.scene()
+            if scene is None or not item.isVisible():
+                self._skipped += 1
+                continue
+            rects = viewports.get(id(scene))
+            if rects is None:
+                rects = [
+                    view.mapToScene(view.viewport().rect()).boundingRect()
+                    for view in scene.views()
+                    if view.isVisible()
+                ]
+                viewports[id(scene)] = rects
+            bounds = item.sceneBoundingRect()
+            if not any(bounds.intersects(r) for r in rects):
+                self._skipped += 1
+                continue
+            if item.advance_animation(t):
+                self._repainted += 1
+                item.update()
+
+
+# Shared by every design canvas; runtime widgets do not use canvas items
+animation_clock = AnimationClock()
@@ -18,11 +18,10 @@ from PyQt6.QtGui import (
     QDragEnterEvent,
     QDropEvent,
     QPen,
-    QPainterPath,
     QCursor,
     QBrush,
 )
-from PyQt6.QtCore import Qt, QPoint, QPointF, pyqtSignal, QRectF, QRect, QEvent, QLineF, QTimer, QElapsedTimer
+from PyQt6.QtCore import Qt, QPoint, QPointF, pyqtSignal, QRectF, QRect, QEvent, QLineF
 import copy
 import uuid
 
@@ -30,7 +29,7 @@ from utils.icon_manager import IconManager
 from services.screen_data_service import screen_service
 from services.clipboard_service import clipboard_service
 from services.command_history_service import command_history_service
-from services.commands import MoveChildCommand, RemoveChildCommand, AddChildCommand, UpdateChildPropertiesCommand, BulkUpdateChildPropertiesCommand, BulkMoveChildCommand
+from services.commands import MoveChildCommand, AddChildCommand, BulkAddChildrenCommand, BulkRemoveChildrenCommand, UpdateChildPropertiesCommand, BulkUpdateChildPropertiesCommand, BulkMoveChildCommand
 from services.settings_service import settings_service
 from services.style_data_service import style_data_service
 from tools import (
@@ -42,6 +41,12 @@ from .graphics_items import (
     EmbeddedScreenItem,
     BaseGraphicsItem,
 )
+from .snap_index import SnapIndex
+from .spatial_index import GridIndex, subtract
+from .drag_session import DragSession
+from .frame_scheduler import FrameScheduler, FrameTimeStats
+from .screen_layers import screen_layers
+from . import transform_engine
 from ..transform_handler import TransformHandler, HandleItem
 from utils import constants
 
@@ -57,6 +62,8 @@ class DesignCanvas(QGraphicsView):
     mouse_moved_on_scene = pyqtSignal(QPointF)
     mouse_left_scene = pyqtSignal()
     selection_dragged = pyqtSignal(dict)
+    # {instance_id: (x, y, w, h)} while items are dragged or resized
+    selection_geometry_changed = pyqtSignal(str, object)
     zoom_changed = pyqtSignal(float)
     
     def __init__(self, screen_id, parent=None):
@@ -70,10 +77,15 @@ class DesignCanvas(QGraphicsView):
         # Zoom is disabled; keep view scale fixed at 1.0
         self._rubber_band_origin = None
         self._rubber_band_rect = QRect()
+        # Items fully inside the band, kept current per frame and highlighted
+        # as a preview of the selection applied on release
+        self._band_index = None
+        self._band_hits = set()
+        self._band_scene_rect = QRectF()
 
         self._drag_mode = None
         self._resize_handle = None
-        self._start_selection_states = {}
+        self._drag_session = None
         # Track both snapped and raw cursor positions separately.  The raw
         # position is used for drag deltas so that snapping does not shift the
         # cursor-to-item offset during a move/resize.
@@ -89,19 +101,14 @@ class DesignCanvas(QGraphicsView):
         self.page_item = QGraphicsRectItem()
         self._initial_centered = False
 
-        # Track items currently visible/hidden on the scene
-        self._visible_items = set()
-        self._hidden_items = set()
-
-        # Throttle expensive visibility updates
-        self._visible_update_timer = QTimer(self)
-        self._visible_update_timer.setSingleShot(True)
-        self._visible_update_timer.timeout.connect(self.update_visible_items)
-
         # Visual drop effect removed per request
 
+        # The page is painted by drawBackground (and cached with the rest of
+        # the background); the item only carries its rect and brush
         self.page_item.setZValue(-1)
+        self.page_item.setVisible(False)
         self.scene.addItem(self.page_item)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
 
         # Selection transform handler
         self.transform_handler.setZValue(999)
@@ -111,6 +118,10 @@ class DesignCanvas(QGraphicsView):
         self.snap_to_objects = settings_service.get_value("snap_to_objects", True)
         self.snap_lines_visible = settings_service.get_value("snap_lines_visible", True)
         self._snap_lines = []
+        # Snap lines of unselected items; rebuilt lazily after the selection
+        # changes and kept current incrementally while items sync
+        self._snap_index = SnapIndex()
+        self._snap_index_valid = False
 
         # Preview styling for snap lines and selection rubber band
         self._update_preview_style()
@@ -132,6 +143,8 @@ class DesignCanvas(QGraphicsView):
         # Center the canvas within the viewport when it is smaller than
         # the view, like Photoshop's pasteboard behavior.
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Pointer moves and their repaints are applied once per frame
+        self._frame_scheduler = FrameScheduler(self.viewport(), self._on_pointer_frame, parent=self)
         self.viewport().installEventFilter(self)
 
         self.scene.selectionChanged.connect(self._on_selection_changed)
@@ -139,14 +152,15 @@ class DesignCanvas(QGraphicsView):
         self.update_screen_data()
 
         style_data_service.styles_changed.connect(self._on_styles_changed)
+        style_data_service.style_applied.connect(self._on_style_applied)
+        screen_layers.invalidated.connect(self._on_screen_layer_invalidated)
 
-        # Frame throttling (~60 fps)
-        self._frame_timer = QElapsedTimer()
-        self._frame_timer.start()
-        
     def drawBackground(self, painter: QPainter, rect: QRectF):
-        """Draw the scene background without grid lines."""
+        """Draw the pasteboard and the page; Qt caches the result."""
         super().drawBackground(painter, rect)
+        page_rect = self.page_item.rect()
+        if page_rect.intersects(rect):
+            painter.fillRect(page_rect.intersected(rect), self.page_item.brush())
 
     # --- Utilities ---------------------------------------------------------
     def _remove_item_safely(self, item: QGraphicsItem | None):
@@ -171,30 +185,9 @@ class DesignCanvas(QGraphicsView):
 
 
     def eventFilter(self, source, event):
+        # Button-less mouse moves reach mouseMoveEvent through mouse tracking
         if event.type() == QEvent.Type.HoverMove:
-            # Throttle hover computations
-            if self._frame_timer.isValid() and self._frame_timer.elapsed() < 16:
-                return False
-            self._frame_timer.restart()
-            pos = event.position().toPoint()
-            self._last_mouse_scene_pos = self._snap_position(self.mapToScene(pos))
-            item = self.itemAt(pos)
-            if isinstance(item, HandleItem):
-                # Show the handle's cursor while hovering over a corner
-                self.viewport().setCursor(item.cursor())
-            else:
-                self.viewport().setCursor(QCursor(Qt.CursorShape.ArrowCursor))
-        elif event.type() == QEvent.Type.MouseMove and event.buttons() == Qt.MouseButton.NoButton:
-            if self._frame_timer.isValid() and self._frame_timer.elapsed() < 16:
-                return False
-            self._frame_timer.restart()
-            pos = event.pos()
-            self._last_mouse_scene_pos = self._snap_position(self.mapToScene(pos))
-            item = self.itemAt(pos)
-            if isinstance(item, HandleItem):
-                self.viewport().setCursor(item.cursor())
-            else:
-                self.viewport().setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+            self._frame_scheduler.post_pointer(event.position().toPoint())
         return False
 
 
@@ -211,48 +204,57 @@ class DesignCanvas(QGraphicsView):
             self.viewport().setCursor(QCursor(Qt.CursorShape.CrossCursor))
 
     def _snap_position(self, pos: QPointF) -> QPointF:
+        previous = list(self._snap_lines)
         self._snap_lines.clear()
         snapped = QPointF(pos.x(), pos.y())
         if self.snap_to_objects:
             snapped = self._snap_to_objects(snapped)
-        if self.snap_lines_visible:
-            self.viewport().update()
+        if self.snap_lines_visible and self._snap_lines != previous:
+            # Repaint only where a line disappeared or appeared
+            for line in previous + self._snap_lines:
+                self._frame_scheduler.invalidate(self._line_viewport_rect(line))
         return snapped
 
+    def _line_viewport_rect(self, line: QLineF) -> QRect:
+        rect = QRectF(line.p1(), line.p2()).normalized()
+        return self.mapFromScene(rect).boundingRect().adjusted(-2, -2, 2, 2)
+
+    def _ensure_snap_index(self):
+        if self._snap_index_valid:
+            return
+        self._snap_index.rebuild(
+            (instance_id, item.sceneBoundingRect())
+            for instance_id, item in self._item_map.items()
+            if not item.isSelected()
+        )
+        self._snap_index_valid = True
+
+    def _update_snap_index(self, instance_id, item):
+        """Keep one item's snap lines current after it changed."""
+        if not self._snap_index_valid:
+            return
+        if item is None or item.isSelected():
+            self._snap_index.discard(instance_id)
+        else:
+            self._snap_index.update(instance_id, item.sceneBoundingRect())
+
     def _snap_to_objects(self, pos: QPointF) -> QPointF:
+        self._ensure_snap_index()
         threshold = 5 / self.transform().m11()
         page_rect = self.page_item.rect()
-        snap_x = pos.x()
-        snap_y = pos.y()
-        best_dx = threshold
-        best_dy = threshold
-        snap_line_x = None
-        snap_line_y = None
-
-        for item in self.scene.items():
-            if item is self.page_item or item in self.scene.selectedItems():
-                continue
-            rect = item.sceneBoundingRect()
-            for x_val in (rect.left(), rect.center().x(), rect.right()):
-                dx = abs(pos.x() - x_val)
-                if dx < best_dx:
-                    best_dx = dx
-                    snap_x = x_val
-                    snap_line_x = QLineF(x_val, page_rect.top(), x_val, page_rect.bottom())
-            for y_val in (rect.top(), rect.center().y(), rect.bottom()):
-                dy = abs(pos.y() - y_val)
-                if dy < best_dy:
-                    best_dy = dy
-                    snap_y = y_val
-                    snap_line_y = QLineF(page_rect.left(), y_val, page_rect.right(), y_val)
+        x_val = self._snap_index.nearest_x(pos.x(), threshold)
+        y_val = self._snap_index.nearest_y(pos.y(), threshold)
 
         if self.snap_lines_visible:
             self._snap_lines.clear()
-            if snap_line_x:
-                self._snap_lines.append(snap_line_x)
-            if snap_line_y:
-                self._snap_lines.append(snap_line_y)
-        return QPointF(snap_x, snap_y)
+            if x_val is not None:
+                self._snap_lines.append(QLineF(x_val, page_rect.top(), x_val, page_rect.bottom()))
+            if y_val is not None:
+                self._snap_lines.append(QLineF(page_rect.left(), y_val, page_rect.right(), y_val))
+        return QPointF(
+            pos.x() if x_val is None else x_val,
+            pos.y() if y_val is None else y_val,
+        )
 
     def set_snap_to_objects(self, enabled: bool):
         self.snap_to_objects = enabled
@@ -263,45 +265,6 @@ class DesignCanvas(QGraphicsView):
             self._snap_lines.clear()
             self.viewport().update()
 
-    def update_visible_items(self):
-        """Show or hide items based on their intersection with the viewport."""
-        scene_rect = self.mapToScene(self.viewport().rect()).boundingRect()
-
-        # Items intersecting the current viewport.  Use all scene items so
-        # previously hidden ones can be restored when they re-enter.
-        visible_now = {
-            item
-            for item in self.scene.items()
-            if item.sceneBoundingRect().intersects(scene_rect)
-        }
-
-        # On first run, assume everything starts visible so off-screen items get hidden
-        if not self._visible_items and not self._hidden_items:
-            self._visible_items = set(self.scene.items())
-
-        # Show items that were hidden but now intersect the viewport
-        for item in visible_now & self._hidden_items:
-            item.setVisible(True)
-            item.setEnabled(True)
-            self._hidden_items.remove(item)
-
-        # Hide items that no longer intersect the viewport
-        for item in self._visible_items - visible_now:
-            item.setVisible(False)
-            item.setEnabled(False)
-            self._hidden_items.add(item)
-
-        # Update the set of currently visible items
-        self._visible_items = visible_now
-
-    def _schedule_visible_items_update(self):
-        """Schedule a deferred call to update_visible_items."""
-        # Start the timer only if not already active so updates fire regularly
-        # even during continuous scrolling or zooming, preventing items from
-        # remaining hidden until movement stops.
-        if not self._visible_update_timer.isActive():
-            self._visible_update_timer.start(16)
-
     def drawForeground(self, painter: QPainter, rect):
         super().drawForeground(painter, rect)
         if self.snap_lines_visible and self._snap_lines:
@@ -311,6 +274,13 @@ class DesignCanvas(QGraphicsView):
             painter.restore()
 
         if self._drag_mode == 'rubberband':
+            if self._band_hits:
+                painter.save()
+                painter.setPen(self._preview_pen)
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+                for instance_id in self._band_index.query(rect) & self._band_hits:
+                    painter.drawRect(self._band_index.rect(instance_id))
+                painter.restore()
             painter.save()
             painter.resetTransform()
             painter.setPen(self._preview_pen)
@@ -328,15 +298,9 @@ class DesignCanvas(QGraphicsView):
                 group_rect = group_rect.united(item_rect)
         return group_rect
 
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self._schedule_visible_items_update()
-
-    def scrollContentsBy(self, dx, dy):
-        super().scrollContentsBy(dx, dy)
-        self._schedule_visible_items_update()
-
     def mousePressEvent(self, event: QMouseEvent):
+        # Settle any queued hover frame before the press changes drag state
+        self._frame_scheduler.flush()
         if event.button() == Qt.MouseButton.LeftButton and self.active_tool != constants.ToolType.SELECT:
             scene_pos = self._snap_position(self.mapToScene(event.pos()))
             if self.active_tool == constants.ToolType.BUTTON:
@@ -357,23 +321,14 @@ class DesignCanvas(QGraphicsView):
             if isinstance(item, HandleItem):
                 self._resize_handle = item.role
                 self._drag_mode = 'resize'
-                self._start_selection_states.clear()
-                for sel in self.scene.selectedItems():
-                    if isinstance(sel, BaseGraphicsItem):
-                        self._start_selection_states[sel.get_instance_id()] = {
-                            'rect': sel.sceneBoundingRect(),
-                            'properties': copy.deepcopy(sel.instance_data.get('properties', {}))
-                        }
+                self._begin_drag_session()
                 event.accept()
                 return
 
             # Priority 2: Click inside existing selection box to move
             if item is self.transform_handler:
                 self._drag_mode = 'move'
-                self._start_selection_states.clear()
-                for sel in self.scene.selectedItems():
-                    if isinstance(sel, BaseGraphicsItem):
-                        self._start_selection_states[sel.get_instance_id()] = sel.pos()
+                self._begin_drag_session()
                 event.accept()
                 return
 
@@ -398,10 +353,7 @@ class DesignCanvas(QGraphicsView):
                         clicked_item.setSelected(True)
                     # Allow dragging of selected items
                     self._drag_mode = 'move'
-                    self._start_selection_states.clear()
-                    for item in self.scene.selectedItems():
-                        if isinstance(item, BaseGraphicsItem):
-                            self._start_selection_states[item.get_instance_id()] = item.pos()
+                    self._begin_drag_session()
                     event.accept()
                     return
             else:
@@ -413,20 +365,21 @@ class DesignCanvas(QGraphicsView):
                 self._drag_mode = 'rubberband'
                 self._rubber_band_origin = event.pos()
                 self._rubber_band_rect = QRect(self._rubber_band_origin, self._rubber_band_origin)
+                self._begin_band_hit_test()
                 self.viewport().update()
                 event.accept()
                 return
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent):
-        raw_scene_pos = self.mapToScene(event.pos())
-        snapped_scene_pos = self._snap_position(raw_scene_pos)
+        # Moves between frames are coalesced; the drag delta is taken from
+        # the last applied position, so none of the motion is lost
+        self._frame_scheduler.post_pointer(event.pos())
 
-        if self._frame_timer.isValid() and self._frame_timer.elapsed() < 16:
-            self.mouse_moved_on_scene.emit(snapped_scene_pos)
-            return
-
-        self._frame_timer.restart()
+    def _on_pointer_frame(self, pos: QPoint):
+        """Apply the latest pointer position; runs once per frame."""
+        raw_scene_pos = self.mapToScene(pos)
+        snapped_scene_pos = self._snap_position(raw_scene_pos)
         self.mouse_moved_on_scene.emit(snapped_scene_pos)
 
         delta = raw_scene_pos - self._raw_last_scene_pos
@@ -436,16 +389,105 @@ class DesignCanvas(QGraphicsView):
         elif self._drag_mode == 'move':
             self._perform_group_move(delta)
         elif self._drag_mode == 'rubberband':
-            self._rubber_band_rect.setBottomRight(event.pos())
-            self.viewport().update()
+            previous = self._rubber_band_rect.normalized()
+            self._rubber_band_rect.setBottomRight(pos)
+            dirty = previous.united(self._rubber_band_rect.normalized())
+            self._frame_scheduler.invalidate(dirty.adjusted(-2, -2, 2, 2))
+            self._update_band_hits()
         else:
-            item = self.itemAt(event.pos())
-            if not isinstance(item, HandleItem):
+            item = self.itemAt(pos)
+            if isinstance(item, HandleItem):
+                # Show the handle's cursor while hovering over a corner
+                self.viewport().setCursor(item.cursor())
+            else:
                 self.viewport().setCursor(QCursor(Qt.CursorShape.ArrowCursor))
 
         self._raw_last_scene_pos = raw_scene_pos
         self._last_mouse_scene_pos = snapped_scene_pos
 
+    def _begin_band_hit_test(self):
+        """Index the scene rects of the selectable items for the rubber band."""
+        selectable = QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
+        self._band_index = GridIndex()
+        self._band_index.rebuild(
+            (instance_id, item.sceneBoundingRect())
+            for instance_id, item in self._item_map.items()
+            if item.isVisible() and item.flags() & selectable
+        )
+        self._band_hits = set()
+        self._band_scene_rect = QRectF()
+
+    def _update_band_hits(self):
+        """Re-test only the items the band can have entered or left.
+
+        An item's containment can only change if it overlaps the area
+        between the previous and the current band, so just the items in
+        those strips are tested and only those that changed are repainted.
+        """
+        if self._band_index is None:
+            return
+        band = self.mapToScene(self._rubber_band_rect.normalized()).boundingRect()
+        previous = self._band_scene_rect
+        candidates = set()
+        for strip in subtract(band, previous) + subtract(previous, band):
+            candidates |= self._band_index.query(strip)
+        hits = self._band_hits
+        for instance_id in candidates:
+            rect = self._band_index.rect(instance_id)
+            inside = band.contains(rect)
+            if inside == (instance_id in hits):
+                continue
+            if inside:
+                hits.add(instance_id)
+            else:
+                hits.discard(instance_id)
+            self._frame_scheduler.invalidate(self.mapFromScene(rect).boundingRect().adjusted(-2, -2, 2, 2))
+        self._band_scene_rect = band
+
+    def _apply_band_selection(self, modifiers):
+        """Select the highlighted items; Shift adds, Ctrl toggles.
+
+        Item selection is changed with the scene's signals blocked, then the
+        selection is reported once.
+        """
+        items = [self._item_map[i] for i in self._band_hits if i in self._item_map]
+        before = set(self.scene.selectedItems())
+        self.scene.blockSignals(True)
+        try:
+            if modifiers == Qt.KeyboardModifier.ControlModifier:
+                for item in items:
+                    item.setSelected(not item.isSelected())
+            else:
+                if modifiers != Qt.KeyboardModifier.ShiftModifier:
+                    self.scene.clearSelection()
+                for item in items:
+                    item.setSelected(True)
+        finally:
+            self.scene.blockSignals(False)
+        if set(self.scene.selectedItems()) != before:
+            self._on_selection_changed()
+
+    def frame_time_stats(self) -> FrameTimeStats:
+        """Interaction latency and per-frame work histograms for this canvas."""
+        return self._frame_scheduler.stats()
+
+
+    def _begin_drag_session(self):
+        self._drag_session = DragSession(
+            self._drag_mode,
+            (i for i in self.scene.selectedItems() if isinstance(i, BaseGraphicsItem)),
+            self._resize_handle,
+        )
+        # Index the remaining items once, before the first move
+        self._ensure_snap_index()
+
+    def _emit_drag_geometry(self, force: bool = False):
+        """Send the dragged items' geometry to listeners (rate limited)."""
+        if self._drag_session is None:
+            return
+        geometry = self._drag_session.take_update(force)
+        if geometry:
+            self.selection_geometry_changed.emit(self.screen_id, geometry)
 
     def _perform_group_move(self, delta: QPointF):
         """Applies a move delta to all selected items and snaps the result."""
@@ -463,18 +505,17 @@ class DesignCanvas(QGraphicsView):
                     if isinstance(item, BaseGraphicsItem):
                         item.moveBy(offset.x(), offset.y())
 
-        self.viewport().update()
-
         # Emit real-time position updates during drag
         if self.scene.selectedItems():
             first_item = self.scene.selectedItems()[0]
             if isinstance(first_item, BaseGraphicsItem):
                 pos_dict = {'x': int(first_item.pos().x()), 'y': int(first_item.pos().y())}
                 self.selection_dragged.emit(pos_dict)
+        self._emit_drag_geometry()
         self.transform_handler.update_geometry()
 
     def _perform_group_resize(self, delta: QPointF):
-        if not self._start_selection_states: return
+        if not self._drag_session: return
 
         current_group_rect = self.get_group_bounding_rect()
         new_group_rect = QRectF(current_group_rect)
@@ -584,9 +625,7 @@ class DesignCanvas(QGraphicsView):
             new_width = start_item_rect.width() * scale_x
             new_height = start_item_rect.height() * scale_y
 
-            props = item.instance_data.setdefault('properties', {})
-            props['size'] = {'width': new_width, 'height': new_height}
-            item.update_data(item.instance_data)
+            item.set_size(new_width, new_height)
             offset_rect = item.boundingRect()
             item.setPos(
                 new_group_rect.left() + relative_x - offset_rect.left(),
@@ -603,78 +642,53 @@ class DesignCanvas(QGraphicsView):
                     if isinstance(item, BaseGraphicsItem):
                         item.moveBy(offset.x(), offset.y())
 
-        self.viewport().update()
-        
-        # Emit real-time size and position updates during resize
-        if self.scene.selectedItems():
-            selection_data = []
-            for item in self.scene.selectedItems():
-                if not isinstance(item, BaseGraphicsItem):
-                    continue
-                data = copy.deepcopy(item.instance_data)
-                props = data.setdefault('properties', {})
-                props['position'] = {
-                    'x': int(item.pos().x()),
-                    'y': int(item.pos().y()),
-                }
-                selection_data.append(data)
-            if selection_data:
-                self.selection_changed.emit(self.screen_id, selection_data)
+        # Geometry-only updates during resize; full data is committed on release
+        self._emit_drag_geometry()
         self.transform_handler.update_geometry()
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
-            if self._drag_mode == 'resize':
-                update_list = []
-                for item in self.scene.selectedItems():
-                    if not isinstance(item, BaseGraphicsItem) or not getattr(item, "is_resizable", False):
-                        continue
-                    start_state = self._start_selection_states[item.get_instance_id()]
-                    start_rect = start_state['rect'] if isinstance(start_state, dict) else start_state
-                    base_props = start_state.get('properties', {}) if isinstance(start_state, dict) else {}
-                    old_props = dict(base_props)
-                    old_props['position'] = {'x': start_rect.x(), 'y': start_rect.y()}
-                    old_props['size'] = {'width': start_rect.width(), 'height': start_rect.height()}
-                    new_props = dict(item.instance_data['properties'])
-                    new_props['position'] = {'x': item.pos().x(), 'y': item.pos().y()}
-                    if old_props != new_props:
-                        update_list.append((item.get_instance_id(), new_props, old_props))
-                if update_list:
-                    from services.commands import BulkUpdateChildPropertiesCommand
-                    command = BulkUpdateChildPropertiesCommand(self.screen_id, update_list)
+            # Apply the last queued move before the drag is committed
+            self._frame_scheduler.flush()
+            session = self._drag_session
+            if self._drag_mode == 'resize' and session is not None:
+                # Only geometry changed during the drag; embedded screens keep
+                # theirs on the instance, which the command handles
+                resize_list = [
+                    (instance_id, new, old)
+                    for instance_id, old, new in session.changes()
+                    if getattr(session.items[instance_id], "is_resizable", False)
+                ]
+                self._emit_drag_geometry(force=True)
+                if resize_list:
+                    from services.commands import BulkResizeChildCommand
+                    command = BulkResizeChildCommand(self.screen_id, resize_list)
                     from services.command_history_service import command_history_service
                     command_history_service.add_command(command)
-            elif self._drag_mode == 'move':
-                move_list = []
-                for item in self.scene.selectedItems():
-                    if isinstance(item, BaseGraphicsItem):
-                        start_pos = self._start_selection_states.get(item.get_instance_id())
-                        if start_pos and start_pos != item.pos():
-                            move_list.append((item.get_instance_id(), {'x': item.pos().x(), 'y': item.pos().y()}, {'x': start_pos.x(), 'y': start_pos.y()}))
+            elif self._drag_mode == 'move' and session is not None:
+                move_list = [
+                    (instance_id, {'x': x, 'y': y}, {'x': x0, 'y': y0})
+                    for instance_id, (x0, y0, _w0, _h0), (x, y, _w, _h) in session.changes()
+                ]
+                self._emit_drag_geometry(force=True)
                 if move_list:
                     from services.commands import BulkMoveChildCommand
                     command = BulkMoveChildCommand(self.screen_id, move_list)
                     from services.command_history_service import command_history_service
                     command_history_service.add_command(command)
             elif self._drag_mode == 'rubberband':
-                self.viewport().update()
-                selection_path = QPainterPath()
-                view_rect = self._rubber_band_rect.normalized()
-                scene_path = self.mapToScene(view_rect)
-                selection_path.addPolygon(scene_path)
-                selection_op = Qt.ItemSelectionOperation.ReplaceSelection
-                if event.modifiers() == Qt.KeyboardModifier.ShiftModifier:
-                    selection_op = Qt.ItemSelectionOperation.AddToSelection
-                elif event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-                    selection_op = Qt.ItemSelectionOperation.ToggleSelection
-                self.scene.setSelectionArea(selection_path, selection_op, Qt.ItemSelectionMode.ContainsItemBoundingRect)
+                self._apply_band_selection(event.modifiers())
             if self._drag_mode in ('move', 'resize'):
                 self.viewport().update()
                 self.transform_handler.update_geometry()
             self._drag_mode = None
+            self._drag_session = None
             self._resize_handle = None
             self._rubber_band_origin = None
             self._rubber_band_rect = QRect()
+            self._band_index = None
+            self._band_hits = set()
+            self._band_scene_rect = QRectF()
             self._snap_lines.clear()
             self.viewport().update()
             self.viewport().setCursor(QCursor(Qt.CursorShape.ArrowCursor))
@@ -726,7 +740,6 @@ class DesignCanvas(QGraphicsView):
             delta_scene = scene_pos_before - self.mapToScene(mouse_view_pos)
             self.centerOn(view_center_scene + delta_scene)
 
-            self._schedule_visible_items_update()
             # Notify listeners of the new zoom level
             self.zoom_changed.emit(self.transform().m11())
             event.accept()
@@ -747,6 +760,7 @@ class DesignCanvas(QGraphicsView):
         if not self.screen_data:
             self.scene.clear()
             self._item_map.clear()
+            self._snap_index.clear()
             return
 
         size = self.screen_data.get('size', {'width': 1920, 'height': 1080})
@@ -788,43 +802,42 @@ class DesignCanvas(QGraphicsView):
         if not self._initial_centered:
             self.centerOn(QPointF(w / 2, h / 2))
             self._initial_centered = True
+        self.resetCachedContent()
         self.update()
-        self.update_visible_items()
 
     def _on_styles_changed(self, style_id: str):
-        if not self.screen_data:
+        # Edits of a single style arrive through ``style_applied``; only bulk
+        # changes (project load) re-apply every button's style here.
+        if style_id or not self.screen_data:
             return
-        from tools.button import conditional_style as button_styles
-        changed = False
+        ids = []
         for child in self.screen_data.get('children', []):
             if child.get('tool_type') != constants.ToolType.BUTTON:
                 continue
             props = child.get('properties', {})
-            sid = props.get('style_id')
-            if style_id and sid != style_id:
+            if style_data_service.apply_resolved_style(props, props.get('style_id')):
+                ids.append(child.get('instance_id'))
+        self._refresh_styled_items(ids)
+
+    def _on_style_applied(self, style_id: str, affected: dict):
+        ids = affected.get(self.screen_id)
+        if ids and self.screen_data:
+            self._refresh_styled_items(ids)
+
+    def _on_screen_layer_invalidated(self, screen_id: str):
+        for item in self._item_map.values():
+            if isinstance(item, EmbeddedScreenItem) and item.instance_data.get('screen_id') == screen_id:
+                item.update()
+
+    def _refresh_styled_items(self, instance_ids):
+        """Re-apply the resolved style to the items' own property copies."""
+        for instance_id in instance_ids:
+            item = self._item_map.get(instance_id)
+            if not item:
                 continue
-            style_def = button_styles.get_style_by_id(sid)
-            if not style_def:
-                continue
-            props.update(copy.deepcopy(style_def.get('properties', {})))
-            if 'hover_properties' in style_def:
-                props['hover_properties'] = copy.deepcopy(style_def['hover_properties'])
-            else:
-                props.pop('hover_properties', None)
-            if style_def.get('icon'):
-                props['icon'] = style_def['icon']
-            else:
-                props.pop('icon', None)
-            if style_def.get('hover_icon'):
-                props['hover_icon'] = style_def['hover_icon']
-            else:
-                props.pop('hover_icon', None)
-            item = self._item_map.get(child.get('instance_id'))
-            if item:
-                item.update_data(copy.deepcopy(child))
-            changed = True
-        if changed:
-            self.update()
+            props = item.instance_data.setdefault('properties', {})
+            style_data_service.apply_resolved_style(props, props.get('style_id'))
+            item.update_data(item.instance_data)
 
     def apply_default_colors(self):
         """Apply a fixed palette to the canvas."""
@@ -832,6 +845,7 @@ class DesignCanvas(QGraphicsView):
         if not self.screen_data.get('style', {}).get('transparent', False):
             self.page_item.setBrush(QColor("#252526"))
         self._update_preview_style()
+        self.resetCachedContent()
         self.update()
 
     def _sync_scene_items(self):
@@ -841,6 +855,7 @@ class DesignCanvas(QGraphicsView):
             if instance_id not in current_instance_ids:
                 self._remove_item_safely(item)
                 del self._item_map[instance_id]
+                self._update_snap_index(instance_id, None)
         for child_data in children_list:
             instance_id = child_data['instance_id']
             if instance_id in self._item_map:
@@ -849,12 +864,60 @@ class DesignCanvas(QGraphicsView):
                 pos_data = child_data.get('position') or child_data.get('properties', {}).get('position', {})
                 item.setPos(QPointF(pos_data.get('x', 0), pos_data.get('y', 0)))
             else:
-                self._create_item(child_data)
+                item = self._create_item(child_data)
+            self._update_snap_index(instance_id, item)
         for i, child_data in enumerate(children_list):
             instance_id = child_data['instance_id']
             if instance_id in self._item_map:
                 self._item_map[instance_id].setZValue(i)
 
+    def apply_children_delta(self, delta):
+        """Apply a :class:`ChildrenDelta` without resyncing every child.
+
+        Each listed id is reconciled with the current screen data, so an id
+        is created, refreshed or removed according to whether it still
+        exists.  Z-values are renumbered only when the order may have changed.
+        """
+        self.screen_data = screen_service.get_screen(self.screen_id)
+        if not self.screen_data:
+            self.update_screen_data()
+            return
+        children_list = self.screen_data.get('children', [])
+        touched = set(delta.added) | set(delta.removed) | set(delta.updated)
+        current = {
+            child['instance_id']: child
+            for child in children_list
+            if child.get('instance_id') in touched
+        }
+
+        for instance_id in touched:
+            item = self._item_map.get(instance_id)
+            child_data = current.get(instance_id)
+            if child_data is None:
+                if item is not None:
+                    self._remove_item_safely(item)
+                    del self._item_map[instance_id]
+                self._update_snap_index(instance_id, None)
+                continue
+            if item is None:
+                item = self._create_item(child_data)
+                if item is None:
+                    continue
+            else:
+                item.update_data(copy.deepcopy(child_data))
+                pos_data = child_data.get('position') or child_data.get('properties', {}).get('position', {})
+                item.setPos(QPointF(pos_data.get('x', 0), pos_data.get('y', 0)))
+            self._update_snap_index(instance_id, item)
+
+        if delta.reordered or delta.added:
+            # Restack to list order; only items whose index moved are touched
+            for index, child_data in enumerate(children_list):
+                item = self._item_map.get(child_data['instance_id'])
+                if item is not None and item.zValue() != index:
+                    item.setZValue(index)
+        if delta.updated:
+            self.transform_handler.update_geometry()
+
     def _create_item(self, child_data):
         instance_id = child_data.get('instance_id')
         if not instance_id: return None
@@ -902,6 +965,8 @@ class DesignCanvas(QGraphicsView):
         command_history_service.add_command(command)
 
     def _on_selection_changed(self):
+        # Selected items are excluded from snapping
+        self._snap_index_valid = False
         items = [i for i in self.scene.selectedItems() if isinstance(i, QGraphicsItem)]
         self.transform_handler.set_targets(items)
         self.viewport().update()
@@ -986,6 +1051,33 @@ class DesignCanvas(QGraphicsView):
         else:
             stacking_menu.setEnabled(False)
 
+        arrange_menu = menu.addMenu("Arrange")
+        arrange_actions = [
+            ("Align Left", transform_engine.align, 'left'),
+            ("Align Center", transform_engine.align, 'center'),
+            ("Align Right", transform_engine.align, 'right'),
+            ("Align Top", transform_engine.align, 'top'),
+            ("Align Middle", transform_engine.align, 'middle'),
+            ("Align Bottom", transform_engine.align, 'bottom'),
+            None,
+            ("Distribute Horizontally", transform_engine.distribute, 'x'),
+            ("Distribute Vertically", transform_engine.distribute, 'y'),
+            None,
+            ("Match Width", transform_engine.match_size, 'width'),
+            ("Match Height", transform_engine.match_size, 'height'),
+            ("Match Size", transform_engine.match_size, 'both'),
+            None,
+            ("Arrange in Grid", transform_engine.grid_arrange),
+        ]
+        for entry in arrange_actions:
+            if entry is None:
+                arrange_menu.addSeparator()
+                continue
+            text, operation, *args = entry
+            action = arrange_menu.addAction(text)
+            action.triggered.connect(lambda _=False, op=operation, a=tuple(args): self.arrange_selection(op, *a))
+        arrange_menu.setEnabled(selection_count > 1)
+
         menu.addSeparator()
         
         if selection_count == 1:
@@ -1139,13 +1231,16 @@ class DesignCanvas(QGraphicsView):
         content_type, data = clipboard_service.get_content()
         if content_type != constants.CLIPBOARD_TYPE_HMI_OBJECTS: return
         items_to_paste = data if isinstance(data, list) else [data]
+        new_items = []
         for item_data in items_to_paste:
             new_item = copy.deepcopy(item_data)
             new_item['instance_id'] = str(uuid.uuid4())
             pos_dict = new_item.get('position') or new_item.get('properties', {}).get('position', {})
             pos_dict['x'] = int(pos_dict.get('x', 0)) + 20
             pos_dict['y'] = int(pos_dict.get('y', 0)) + 20
-            command = AddChildCommand(self.screen_id, new_item)
+            new_items.append(new_item)
+        if new_items:
+            command = BulkAddChildrenCommand(self.screen_id, new_items)
             command_history_service.add_command(command)
 
     def delete_selected(self):
@@ -1153,20 +1248,33 @@ class DesignCanvas(QGraphicsView):
         if not selected_items:
             return
 
-        instance_data_list = [
-            item.instance_data
+        instance_ids = [
+            item.get_instance_id()
             for item in selected_items
             if isinstance(item, BaseGraphicsItem)
         ]
 
-        if not instance_data_list:
+        if not instance_ids:
             return
 
         self.clear_selection()
 
-        for instance_data in instance_data_list:
-            command = RemoveChildCommand(self.screen_id, instance_data)
-            command_history_service.add_command(command)
+        command = BulkRemoveChildrenCommand(self.screen_id, instance_ids)
+        command_history_service.add_command(command)
+
+    def arrange_selection(self, operation, *args) -> bool:
+        """Apply a :mod:`transform_engine` operation to the selection.
+
+        The result is committed as one undo step; returns ``True`` if
+        anything moved or resized.
+        """
+        items = [item for item in self.scene.selectedItems() if isinstance(item, BaseGraphicsItem)]
+        before = transform_engine.SelectionGeometry.from_items(items)
+        command = transform_engine.command_for(self.screen_id, before, operation(before, *args))
+        if command is None:
+            return False
+        command_history_service.add_command(command)
+        return True
 
     def _move_selected_items(self, key):
         """Move selected items using arrow keys."""
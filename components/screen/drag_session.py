@@ -0,0 +1,56 @@
+# components/screen/drag_session.py
+"""
+Geometry-only state for an interactive move or resize on the canvas.
+
+A session records each dragged item's starting ``(x, y, w, h)`` and
+nothing else; full property dicts are only materialized once, when the
+drag is committed as an undo command.  Geometry updates for listeners
+(property editor, status bar) are rate limited.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PyQt6.QtCore import QElapsedTimer
+
+Geometry = Tuple[float, float, float, float]
+
+# Minimum time between geometry updates sent to listeners during a drag
+GEOMETRY_EMIT_INTERVAL_MS = 50
+
+
+def item_geometry(item) -> Geometry:
+    rect = item.boundingRect()
+    pos = item.pos()
+    return (pos.x(), pos.y(), rect.width(), rect.height())
+
+
+class DragSession:
+    """Items taking part in one drag and their starting geometry."""
+
+    def __init__(self, mode: str, items: Iterable, handle: Optional[str] = None):
+        self.mode = mode
+        self.handle = handle
+        self.items = {item.get_instance_id(): item for item in items}
+        self.start: Dict[str, Geometry] = {
+            instance_id: item_geometry(item) for instance_id, item in self.items.items()
+        }
+        self._emit_timer = QElapsedTimer()
+
+    def geometry(self) -> Dict[str, Geometry]:
+        return {instance_id: item_geometry(item) for instance_id, item in self.items.items()}
+
+    def take_update(self, force: bool = False) -> Optional[Dict[str, Geometry]]:
+        """Return the current geometry if an update is due, else ``None``."""
+        if not force and self._emit_timer.isValid() and self._emit_timer.elapsed() < GEOMETRY_EMIT_INTERVAL_MS:
+            return None
+        self._emit_timer.restart()
+        return self.geometry()
+
+    def changes(self) -> List[Tuple[str, Geometry, Geometry]]:
+        """``(instance_id, start, current)`` for every item that changed."""
+        result = []
+        for instance_id, item in self.items.items():
+            current = item_geometry(item)
+            if current != self.start[instance_id]:
+                result.append((instance_id, self.start[instance_id], current))
+        return result
@@ -0,0 +1,184 @@
+# components/screen/frame_scheduler.py
+"""
+Per-canvas frame scheduler for pointer interaction.
+
+Pointer moves arrive far more often than the display refreshes.  Instead of
+dropping moves that come in too soon, the scheduler keeps only the latest
+pointer position and runs the canvas's frame callback with it once per
+frame.  Repaint requests made in between are merged into one dirty region
+and sent to the widget with a single ``update`` after the callback.
+
+Frames are paced from the start of the previous frame at the screen's
+refresh interval.  Input latency (first queued request to end of frame)
+and per-frame work time are recorded in fixed-bucket histograms.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from PyQt6.QtCore import QElapsedTimer, QObject, QPoint, QRect, QTimer, Qt
+from PyQt6.QtGui import QRegion
+
+DEFAULT_INTERVAL_MS = 16
+# Upper bounds (ms) of the histogram buckets; one open bucket follows
+HISTOGRAM_BOUNDS_MS = (4, 8, 16, 33, 50, 100)
+
+
+def display_interval_ms(widget) -> int:
+    """Refresh interval of the screen showing ``widget``."""
+    screen = widget.screen() if widget is not None else None
+    rate = screen.refreshRate() if screen is not None else 0.0
+    if rate <= 0:
+        return DEFAULT_INTERVAL_MS
+    return max(1, int(1000 / rate))
+
+
+def _bucket(ms: float) -> int:
+    for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+        if ms <= bound:
+            return i
+    return len(HISTOGRAM_BOUNDS_MS)
+
+
+@dataclass(slots=True)
+class FrameTimeStats:
+    frames: int = 0
+    interval_ms: float = 0.0
+    pointer_events: int = 0
+    coalesced_events: int = 0
+    mean_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    mean_work_ms: float = 0.0
+    max_work_ms: float = 0.0
+    # Counts per bucket of HISTOGRAM_BOUNDS_MS, plus the open last bucket
+    latency_histogram: Tuple[int, ...] = ()
+    work_histogram: Tuple[int, ...] = ()
+
+
+class FrameScheduler(QObject):
+    """Coalesce pointer input and repaints for one widget into frames.
+
+    ``on_frame(pos)`` is called with the latest posted pointer position, at
+    most once per frame interval.  It may call :meth:`invalidate`; those
+    rects are painted in the same frame.
+    """
+
+    def __init__(self, widget, on_frame: Callable[[QPoint], None], interval_ms: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        self._widget = widget
+        self._on_frame = on_frame
+        self._interval_ms = interval_ms or display_interval_ms(widget)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._run_frame)
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._last_frame_ms: Optional[int] = None
+        self._first_request_ms: Optional[int] = None
+        self._in_frame = False
+        self._pointer: Optional[QPoint] = None
+        self._dirty = QRegion()
+        self._full_update = False
+        self.reset_stats()
+
+    @property
+    def interval_ms(self) -> int:
+        return self._interval_ms
+
+    def set_interval(self, interval_ms: int):
+        self._interval_ms = max(1, int(interval_ms))
+
+    def post_pointer(self, pos: QPoint):
+        """Queue a pointer position; only the latest one per frame is used."""
+        self._pointer_events += 1
+        if self._pointer is not None:
+            self._coalesced += 1
+        self._pointer = QPoint(pos)
+        self._request()
+
+    def invalidate(self, rect: Optional[QRect] = None):
+        """Add ``rect`` (widget coordinates) to the frame's dirty region.
+
+        ``None`` repaints the whole widget.
+        """
+        if rect is None:
+            self._full_update = True
+        elif not rect.isEmpty():
+            self._dirty = self._dirty.united(rect)
+        else:
+            return
+        self._request()
+
+    def flush(self):
+        """Run a pending frame now, e.g. before a press or release is handled."""
+        if self._timer.isActive():
+            self._timer.stop()
+            self._run_frame()
+
+    def stats(self) -> FrameTimeStats:
+        return FrameTimeStats(
+            frames=self._frames,
+            interval_ms=float(self._interval_ms),
+            pointer_events=self._pointer_events,
+            coalesced_events=self._coalesced,
+            mean_latency_ms=self._latency_total / self._frames if self._frames else 0.0,
+            max_latency_ms=self._latency_max,
+            mean_work_ms=self._work_total / self._frames if self._frames else 0.0,
+            max_work_ms=self._work_max,
+            latency_histogram=tuple(self._latency_hist),
+            work_histogram=tuple(self._work_hist),
+        )
+
+    def reset_stats(self):
+        self._frames = 0
+        self._pointer_events = 0
+        self._coalesced = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._work_total = 0.0
+        self._work_max = 0.0
+        self._latency_hist: List[int] = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self._work_hist: List[int] = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def _request(self):
+        now_ms = self._clock.elapsed()
+        if self._first_request_ms is None:
+            self._first_request_ms = now_ms
+        if self._in_frame or self._timer.isActive():
+            return
+        if self._last_frame_ms is None:
+            wait = 0
+        else:
+            wait = max(0, self._interval_ms - (now_ms - self._last_frame_ms))
+        self._timer.start(wait)
+
+    def _run_frame(self):
+        start_ms = self._clock.elapsed()
+        self._last_frame_ms = start_ms
+        pointer, self._pointer = self._pointer, None
+        self._in_frame = True
+        try:
+            if pointer is not None:
+                self._on_frame(pointer)
+        finally:
+            self._in_frame = False
+        if self._full_update:
+            self._widget.update()
+        elif not self._dirty.isEmpty():
+            self._widget.update(self._dirty)
+        self._dirty = QRegion()
+        self._full_update = False
+
+        end_ms = self._clock.elapsed()
+        first_ms = self._first_request_ms if self._first_request_ms is not None else start_ms
+        self._first_request_ms = None
+        latency = float(end_ms - first_ms)
+        work = float(end_ms - start_ms)
+        self._frames += 1
+        self._latency_total += latency
+        self._latency_max = max(self._latency_max, latency)
+        self._latency_hist[_bucket(latency)] += 1
+        self._work_total += work
+        self._work_max = max(self._work_max, work)
+        self._work_hist[_bucket(work)] += 1
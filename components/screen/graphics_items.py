@@ -15,13 +15,39 @@ from PyQt6.QtGui import (
     QLinearGradient,
 )
 from PyQt6.QtCore import QRectF, Qt, QPointF
-from PyQt6.QtSvg import QSvgRenderer
 import os
-import copy
 import logging
+import math
 
 from services.screen_data_service import screen_service
 from utils.icon_manager import IconManager
+from utils.icon_raster import icon_raster
+from .animation_clock import animation_clock
+from .render_cache import render_cache
+from .screen_layers import screen_layers, embed_style, paint_embed_background
+
+# Resolved style keys read by ButtonItem._render (the render cache key)
+_PAINT_KEYS = (
+    'component_type', 'shape_style', 'background_type', 'background_color',
+    'background_color2', 'background_opacity', 'default_style', 'text_color',
+    'text_value', 'label', 'font_family', 'font_size', 'bold', 'italic', 'underline',
+    'border_radius', 'border_radius_tl', 'border_radius_tr', 'border_radius_br',
+    'border_radius_bl', 'border_width', 'border_style', 'border_color',
+    'gradient_x1', 'gradient_y1', 'gradient_x2', 'gradient_y2',
+    'toggle_direction', 'toggle_on_is_left',
+    'icon', 'icon_size', 'icon_align', 'icon_color',
+    'h_align', 'horizontal_align', 'v_align', 'vertical_align',
+    'offset', 'offset_to_frame', 'animation',
+)
+
+# Pulse animation: period in seconds and number of distinct frames per period
+_PULSE_PERIOD_S = 1.0
+_PULSE_STEPS = 16
+
+# Below this effective view scale buttons paint as flat proxies (fill only,
+# no text, icon or border) and leave the render cache alone, so zooming out
+# over thousands of items neither draws detail nor churns cached pixmaps
+LOD_PROXY_THRESHOLD = 0.35
 
 
 def _pct_of(value, base):
@@ -77,6 +103,89 @@ def _apply_pen_style_from_name(pen: QPen, style_name: str):
         # Fallback
         pen.setStyle(Qt.PenStyle.SolidLine)
 
+
+def button_style_manager(props):
+    """Conditional style manager for a button's saved ``properties``."""
+    from tools.button.conditional_style import ConditionalStyleManager, ConditionalStyle
+    manager = ConditionalStyleManager()
+
+    # Load conditional styles from properties
+    conditional_styles = props.get('conditional_styles', [])
+    if conditional_styles:
+        manager.conditional_styles = [
+            ConditionalStyle.from_dict(style_data)
+            for style_data in conditional_styles
+        ]
+
+    # Set default style, aligned style keys with Conditional Style window (StyleProperties)
+    default_style = {
+        # Core component styling
+        'component_type': props.get('component_type', 'Standard Button'),
+        'shape_style': props.get('shape_style', 'Flat'),
+        'background_type': props.get('background_type', 'Solid'),
+        'background_color': props.get('background_color')
+        or props.get('default_style', {}).get('background_color', '#5a6270'),
+        # Extras supported by the editor (stored via StyleProperties.extra)
+        'background_color2': props.get('background_color2', '#5a6270'),
+        'gradient_x1': props.get('gradient_x1', 0),
+        'gradient_y1': props.get('gradient_y1', 0),
+        'gradient_x2': props.get('gradient_x2', 0),
+        'gradient_y2': props.get('gradient_y2', 1),
+        # Text
+        'text_type': props.get('text_type', 'Text'),
+        'text_value': props.get('text_value', props.get('label', 'Button')),
+        'text_color': props.get('text_color')
+        or props.get('default_style', {}).get('text_color', '#ffffff'),
+        'font_family': props.get('font_family', ''),
+        'font_size': props.get('font_size', 18),
+        'bold': props.get('bold', False),
+        'italic': props.get('italic', False),
+        'underline': props.get('underline', False),
+        'h_align': props.get('h_align', props.get('horizontal_align', 'center')),
+        'v_align': props.get('v_align', props.get('vertical_align', 'middle')),
+        'offset': props.get('offset', props.get('offset_to_frame', 0)),
+        'comment_ref': props.get('comment_ref', {}),
+        # Border
+        'border_radius': props.get('border_radius', 5),
+        'border_radius_tl': props.get('border_radius_tl') or props.get('border_radius', 5),
+        'border_radius_tr': props.get('border_radius_tr') or props.get('border_radius', 5),
+        'border_radius_br': props.get('border_radius_br') or props.get('border_radius', 5),
+        'border_radius_bl': props.get('border_radius_bl') or props.get('border_radius', 5),
+        'border_width': props.get('border_width', 0),
+        'border_style': props.get('border_style', 'solid'),
+        'border_color': props.get('border_color', '#000000'),
+        # Icon
+        'icon': props.get('icon', ''),
+        'icon_size': props.get('icon_size', 50),
+        'icon_align': props.get('icon_align', 'center'),
+        'icon_color': props.get('icon_color', ''),
+    }
+    manager.default_style = default_style
+    return manager
+
+
+def resolve_button_style(props, manager, tag_values, state: str = 'normal'):
+    """Resolved design-time style of a button.
+
+    ``props`` are the button's saved properties, ``manager`` its
+    :func:`button_style_manager`; ``state`` is ``'normal'`` or ``'hover'``.
+    """
+    default_props = dict(props)
+    hover_default = default_props.pop('hover_properties', {})
+
+    if state == 'hover':
+        default_props.update(hover_default)
+
+    active_props = manager.get_active_style(tag_values, state if state == 'hover' else None)
+
+    final_props = {**default_props, **active_props}
+
+    # Map text_value to label for compatibility with paint method
+    if 'text_value' in active_props:
+        final_props['label'] = active_props['text_value']
+    return final_props
+
+
 class BaseGraphicsItem(QGraphicsObject):
     """
     A base class for all custom graphics items on the canvas. It is now a simple
@@ -99,6 +208,12 @@ class BaseGraphicsItem(QGraphicsObject):
         self.instance_data = new_instance_data
         self.update()
 
+    def set_size(self, width, height):
+        """Resize in place during interactive drags, keeping resolved styles."""
+        self.prepareGeometryChange()
+        self.instance_data.setdefault('properties', {})['size'] = {'width': width, 'height': height}
+        self.update()
+
 class EmbeddedScreenItem(BaseGraphicsItem):
     def __init__(self, instance_data, parent=None):
         super().__init__(instance_data, parent)
@@ -108,6 +223,12 @@ class EmbeddedScreenItem(BaseGraphicsItem):
         # Cache complex embedded rendering when static
         self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
+    def set_size(self, width, height):
+        """Resize in place; embedded screens keep their size on the instance."""
+        self.prepareGeometryChange()
+        self.instance_data['size'] = {'width': width, 'height': height}
+        self.update()
+
     def boundingRect(self) -> QRectF:
         # Use instance size if provided, otherwise use base screen size
         instance_size = self.instance_data.get('size', {})
@@ -139,18 +260,19 @@ class EmbeddedScreenItem(BaseGraphicsItem):
 
         painter.save()
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        base_style = copy.deepcopy(base_screen_data.get('style', {}))
-        instance_style = self.instance_data.get('style', {})
-        final_style = {**base_style, **instance_style}
-
-        # Background
-        bg_color = QColor(final_style.get('color1', '#555b66'))
-        bg_color.setAlphaF(final_style.get('opacity', 1.0))
-        painter.setBrush(bg_color)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRect(self.boundingRect())
-        
+
+        rect = self.boundingRect()
+        paint_embed_background(painter, rect, embed_style(base_screen_data, self.instance_data))
+
+        # The embedded screen's children, composed from cached layers
+        t = painter.worldTransform()
+        scale = math.hypot(t.m11(), t.m12()) or 1.0
+        device = painter.device()
+        if device is not None:
+            scale *= device.devicePixelRatioF()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        screen_layers.paint(painter, self.instance_data.get('screen_id'), rect, scale)
+
         painter.restore()
 
     def hoverEnterEvent(self, event):
@@ -173,6 +295,11 @@ class ButtonItem(BaseGraphicsItem):
         self._current_tag_values = {}
         self._state = 'normal'
         self._tooltip = ''
+        # (props, render key, proxy colour) of the current style; None until
+        # next paint
+        self._render_style = None
+        # Quantized pulse phase while animated by the shared clock, else None
+        self._anim_phase = None
         # Initialize tooltip based on current style (with empty tag values)
         self._get_active_style_properties(self._state)
         # Base size used for percentage-based properties
@@ -188,72 +315,27 @@ class ButtonItem(BaseGraphicsItem):
         self._base_height = h
         return QRectF(0, 0, w, h)
 
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged:
+            if value is None:
+                animation_clock.unregister(self)
+            else:
+                # Re-resolve (and re-register animations) on the next paint
+                self._render_style = None
+        return super().itemChange(change, value)
+
     def update_data(self, new_instance_data):
         super().update_data(new_instance_data)
         # Reset conditional style manager when data changes
         self._conditional_style_manager = None
+        self._render_style = None
 
     def _get_conditional_style_manager(self):
         """Lazy load conditional style manager"""
         if self._conditional_style_manager is None:
-            from tools.button.conditional_style import ConditionalStyleManager, ConditionalStyle
-            self._conditional_style_manager = ConditionalStyleManager()
-            
-            # Load conditional styles from properties
-            conditional_styles = self.instance_data.get('properties', {}).get('conditional_styles', [])
-            if conditional_styles:
-                self._conditional_style_manager.conditional_styles = [
-                    ConditionalStyle.from_dict(style_data)
-                    for style_data in conditional_styles
-                ]
-            
-            # Set default style
-            props = self.instance_data.get('properties', {})
-            # Align default style keys with Conditional Style window (StyleProperties)
-            default_style = {
-                # Core component styling
-                'component_type': props.get('component_type', 'Standard Button'),
-                'shape_style': props.get('shape_style', 'Flat'),
-                'background_type': props.get('background_type', 'Solid'),
-                'background_color': props.get('background_color')
-                or props.get('default_style', {}).get('background_color', '#5a6270'),
-                # Extras supported by the editor (stored via StyleProperties.extra)
-                'background_color2': props.get('background_color2', '#5a6270'),
-                'gradient_x1': props.get('gradient_x1', 0),
-                'gradient_y1': props.get('gradient_y1', 0),
-                'gradient_x2': props.get('gradient_x2', 0),
-                'gradient_y2': props.get('gradient_y2', 1),
-                # Text
-                'text_type': props.get('text_type', 'Text'),
-                'text_value': props.get('text_value', props.get('label', 'Button')),
-                'text_color': props.get('text_color')
-                or props.get('default_style', {}).get('text_color', '#ffffff'),
-                'font_family': props.get('font_family', ''),
-                'font_size': props.get('font_size', 18),
-                'bold': props.get('bold', False),
-                'italic': props.get('italic', False),
-                'underline': props.get('underline', False),
-                'h_align': props.get('h_align', props.get('horizontal_align', 'center')),
-                'v_align': props.get('v_align', props.get('vertical_align', 'middle')),
-                'offset': props.get('offset', props.get('offset_to_frame', 0)),
-                'comment_ref': props.get('comment_ref', {}),
-                # Border
-                'border_radius': props.get('border_radius', 5),
-                'border_radius_tl': props.get('border_radius_tl') or props.get('border_radius', 5),
-                'border_radius_tr': props.get('border_radius_tr') or props.get('border_radius', 5),
-                'border_radius_br': props.get('border_radius_br') or props.get('border_radius', 5),
-                'border_radius_bl': props.get('border_radius_bl') or props.get('border_radius', 5),
-                'border_width': props.get('border_width', 0),
-                'border_style': props.get('border_style', 'solid'),
-                'border_color': props.get('border_color', '#000000'),
-                # Icon
-                'icon': props.get('icon', ''),
-                'icon_size': props.get('icon_size', 50),
-                'icon_align': props.get('icon_align', 'center'),
-                'icon_color': props.get('icon_color', ''),
-            }
-            self._conditional_style_manager.default_style = default_style
-        
+            self._conditional_style_manager = button_style_manager(
+                self.instance_data.get('properties', {})
+            )
         return self._conditional_style_manager
 
     def _get_current_tag_values(self):
@@ -268,22 +350,12 @@ class ButtonItem(BaseGraphicsItem):
         state: str
             One of ``'normal'`` or ``'hover'``.
         """
-        manager = self._get_conditional_style_manager()
-        tag_values = self._get_current_tag_values()
-
-        default_props = dict(self.instance_data.get('properties', {}))
-        hover_default = default_props.pop('hover_properties', {})
-
-        if state == 'hover':
-            default_props.update(hover_default)
-
-        active_props = manager.get_active_style(tag_values, state if state == 'hover' else None)
-
-        # Map text_value to label for compatibility with paint method
-        if 'text_value' in active_props:
-            active_props['label'] = active_props['text_value']
-
-        final_props = {**default_props, **active_props}
+        final_props = resolve_button_style(
+            self.instance_data.get('properties', {}),
+            self._get_conditional_style_manager(),
+            self._get_current_tag_values(),
+            state,
+        )
 
         tooltip = final_props.get('tooltip', '')
         if tooltip != self._tooltip:
@@ -292,15 +364,80 @@ class ButtonItem(BaseGraphicsItem):
 
         return final_props
 
+    def _get_render_style(self):
+        """Return ``(props, key, proxy)`` for painting, recomputed only on style changes.
+
+        ``key`` is the interned subset of ``props`` that affects rendering, so
+        buttons that look the same share render cache entries.  ``proxy`` is
+        the fill colour used at low zoom.
+        """
+        if self._render_style is None:
+            from tools.button.style_properties import FrozenStyle
+
+            props = self._get_active_style_properties(self._state)
+            key = FrozenStyle.of({k: props[k] for k in _PAINT_KEYS if k in props})
+            proxy = QColor(
+                props.get('background_color')
+                or props.get('default_style', {}).get('background_color')
+                or '#5a6270'
+            )
+            self._render_style = (props, key, proxy)
+            animation = props.get('animation') or {}
+            if animation.get('enabled', False) and animation.get('type', 'pulse') == 'pulse':
+                if self._anim_phase is None:
+                    self._anim_phase = self._pulse_phase(animation_clock.now())
+                animation_clock.register(self)
+            else:
+                self._anim_phase = None
+                animation_clock.unregister(self)
+        return self._render_style
+
+    @staticmethod
+    def _pulse_phase(t: float) -> int:
+        return int((t % _PULSE_PERIOD_S) / _PULSE_PERIOD_S * _PULSE_STEPS)
+
+    def advance_animation(self, t: float) -> bool:
+        """Advance the pulse to clock time ``t``; return True if it changed."""
+        phase = self._pulse_phase(t)
+        if phase == self._anim_phase:
+            return False
+        self._anim_phase = phase
+        return True
+
     def paint(self, painter: QPainter, option, widget=None):
-        painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Get active style properties
-        props = self._get_active_style_properties(self._state)
+        props, key, proxy = self._get_render_style()
         rect = self.boundingRect()
         w = rect.width()
         h = rect.height()
+
+        t = painter.worldTransform()
+        lod = math.hypot(t.m11(), t.m12()) or 1.0
+        if lod < LOD_PROXY_THRESHOLD:
+            painter.fillRect(rect, proxy)
+            return
+
+        # Render at the effective device scale so zoomed views stay sharp
+        device = painter.device()
+        scale = device.devicePixelRatioF() if device is not None else 1.0
+        scale *= lod
+
+        phase = self._anim_phase
+        state = self._state if phase is None else f"{self._state}:{phase}"
+        pix = render_cache.pixmap(
+            key, w, h, state, scale, lambda p: self._render(p, props, w, h, phase)
+        )
+        if pix is None:
+            self._render(painter, props, w, h, phase)
+        else:
+            painter.drawPixmap(QPointF(0, 0), pix)
+
+    @staticmethod
+    def _render(painter: QPainter, props, w: float, h: float, phase: Optional[int] = None):
+        """Draw a button from resolved ``props`` at the origin; no item state."""
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        rect = QRectF(0, 0, w, h)
         min_dim = min(w, h)
 
         component_type = props.get('component_type', 'Standard Button')
@@ -479,32 +616,13 @@ class ButtonItem(BaseGraphicsItem):
                 icon = IconManager.create_icon(name, color=color)
                 if icon.isNull():
                     logger.warning("Failed to load icon '%s'", icon_src)
-            else:
-                ext = os.path.splitext(icon_src)[1].lower()
-                if ext == '.svg':
+            elif size > 0:
+                device = painter.device()
+                dpr = device.devicePixelRatioF() if device is not None else 1.0
+                pix = icon_raster.pixmap(icon_src, size, dpr=dpr)
+                if pix.isNull():
                     if os.path.exists(icon_src):
-                        renderer = QSvgRenderer(icon_src)
-                        if renderer.isValid():
-                            pix = QPixmap(size, size)
-                            pix.fill(Qt.GlobalColor.transparent)
-                            p = QPainter(pix)
-                            renderer.render(p)
-                            p.end()
-                            if pix.isNull():
-                                logger.warning("Failed to render SVG icon '%s'", icon_src)
-                        else:
-                            logger.warning("Invalid SVG icon '%s'", icon_src)
-                    else:
-                        logger.warning("Icon file not found: %s", icon_src)
-                else:
-                    if os.path.exists(icon_src):
-                        pix = QPixmap(icon_src)
-                        if pix.isNull():
-                            logger.warning("Failed to load icon '%s'", icon_src)
-                        else:
-                            pix = pix.scaled(
-                                size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-                            )
+                        logger.warning("Failed to load icon '%s'", icon_src)
                     else:
                         logger.warning("Icon file not found: %s", icon_src)
             br = rect
@@ -522,16 +640,19 @@ class ButtonItem(BaseGraphicsItem):
                 target = QRectF(int(x), int(y), size, size)
                 icon.paint(painter, target.toRect())
             elif not pix.isNull():
-                x = br.left() + (br.width() - pix.width()) / 2
-                y = br.top() + (br.height() - pix.height()) / 2
+                # Logical size; the raster is at the device pixel ratio
+                pix_w = pix.width() / pix.devicePixelRatio()
+                pix_h = pix.height() / pix.devicePixelRatio()
+                x = br.left() + (br.width() - pix_w) / 2
+                y = br.top() + (br.height() - pix_h) / 2
                 if 'left' in align:
                     x = br.left()
                 elif 'right' in align:
-                    x = br.right() - pix.width()
+                    x = br.right() - pix_w
                 if 'top' in align:
                     y = br.top()
                 elif 'bottom' in align:
-                    y = br.bottom() - pix.height()
+                    y = br.bottom() - pix_h
                 painter.drawPixmap(int(x), int(y), pix)
             else:
                 x = br.left() + (br.width() - size) / 2
@@ -576,29 +697,30 @@ class ButtonItem(BaseGraphicsItem):
         elif v_align == 'bottom':
             alignment |= Qt.AlignmentFlag.AlignBottom
         offset_px = int(props.get('offset', props.get('offset_to_frame', 0)) or 0)
-        text_rect = self.boundingRect().adjusted(offset_px, offset_px, -offset_px, -offset_px)
+        text_rect = QRectF(0, 0, w, h).adjusted(offset_px, offset_px, -offset_px, -offset_px)
         painter.drawText(text_rect, alignment, label)
         
-        # Handle animations (simplified for now)
+        # Pulse animation: overlay the background with a strength that
+        # follows the shared clock phase (static when not animated)
         animation = props.get('animation', {})
         if animation.get('enabled', False):
-            # Basic animation support - could be enhanced with QPropertyAnimation
             anim_type = animation.get('type', 'pulse')
             intensity = animation.get('intensity', 1.0)
-            
+
             if anim_type == 'pulse':
-                # Simple pulse effect by adjusting opacity
                 pulse_factor = 0.8 + 0.2 * intensity
+                if phase is not None:
+                    pulse_factor *= 0.5 - 0.5 * math.cos(2 * math.pi * phase / _PULSE_STEPS)
                 base_alpha = _alpha255 / 255.0
-                bg_color.setAlphaF(min(1.0, base_alpha * pulse_factor))
+                bg_color.setAlphaF(max(0.0, min(1.0, base_alpha * pulse_factor)))
                 painter.setBrush(bg_color)
                 if shape_path:
                     painter.drawPath(shape_path)
                 else:
                     painter.drawRoundedRect(rect, border_radius, border_radius)
-        
+
         painter.restore()
-    
+
     def update_tag_values(self, tag_values):
         """Update tag-driven properties and schedule a repaint.
 
@@ -619,7 +741,8 @@ class ButtonItem(BaseGraphicsItem):
         self._current_tag_values = dict(tag_values or {})
 
         # Recalculate any conditional style properties that depend on tags
-        self._get_active_style_properties(self._state)
+        self._render_style = None
+        self._get_render_style()
 
         # Schedule a repaint to reflect the updated style
         self.update()
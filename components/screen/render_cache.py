@@ -0,0 +1,118 @@
+# components/screen/render_cache.py
+"""
+Shared pixmap cache for canvas item rendering.
+
+Items that render purely from their resolved style (buttons) paint once
+into a pixmap keyed by ``(style, width, height, state, scale)`` and blit it
+on later repaints.  Entries are shared across items with identical keys
+and evicted least-recently-used under a global memory budget.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPainter, QPixmap
+
+# Default budget for all cached item pixmaps (32-bit ARGB)
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(slots=True)
+class RenderCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes: int = 0
+    entries: int = 0
+
+
+class RenderCache:
+    """LRU cache of rendered item pixmaps bounded by total pixel memory."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self._budget = max(0, int(budget_bytes))
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[QPixmap, int]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def budget_bytes(self) -> int:
+        return self._budget
+
+    def set_budget(self, budget_bytes: int):
+        """Change the memory budget, evicting entries that no longer fit."""
+        self._budget = max(0, int(budget_bytes))
+        self._evict()
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> RenderCacheStats:
+        return RenderCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            bytes=self._bytes,
+            entries=len(self._entries),
+        )
+
+    def pixmap(
+        self,
+        style_key: Hashable,
+        width: float,
+        height: float,
+        state: str,
+        scale: float,
+        render: Callable[[QPainter], None],
+    ) -> Optional[QPixmap]:
+        """Return the cached pixmap for the key, rendering it on a miss.
+
+        ``render`` draws the item in logical coordinates at the origin.
+        ``None`` is returned when the pixmap would not fit the budget; the
+        caller should then paint directly.
+        """
+        scale = round(scale, 2) or 1.0
+        key = (style_key, round(width, 1), round(height, 1), state, scale)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+        pw = max(1, int(round(width * scale)))
+        ph = max(1, int(round(height * scale)))
+        cost = pw * ph * 4
+        # Never let a single item take more than a quarter of the budget
+        if cost * 4 > self._budget:
+            return None
+
+        self._misses += 1
+        pix = QPixmap(pw, ph)
+        pix.setDevicePixelRatio(scale)
+        pix.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pix)
+        try:
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            render(p)
+        finally:
+            p.end()
+
+        self._entries[key] = (pix, cost)
+        self._bytes += cost
+        self._evict()
+        return pix
+
+    def _evict(self):
+        while self._bytes > self._budget and self._entries:
+            _key, (_pix, cost) = self._entries.popitem(last=False)
+            self._bytes -= cost
+            self._evictions += 1
+
+
+# Shared by every canvas in the application
+render_cache = RenderCache()
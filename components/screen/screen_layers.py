@@ -0,0 +1,287 @@
+# components/screen/screen_layers.py
+"""
+Composited rendering of embedded screens.
+
+An embedded screen is drawn from a cached layer: a pixmap of all the
+screen's children rendered at a power-of-two scale.  Nested embeds are
+composed from their own cached layers, so a screen embedded in many places
+is rendered once per scale.  Layers are keyed by ``(screen_id, version,
+scale)``.  A screen's version is bumped, and its layers dropped, when it
+or any screen it embeds changes.  The ancestors are found through
+``screen_service._child_to_parents``.
+
+Embedding cycles (a screen that, directly or through other embeds, embeds
+itself) are detected when a layer is composed.  The embed that closes the
+cycle is drawn as a placeholder.  That makes each layer depend only on its
+own screen and keeps it cacheable.
+"""
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+
+from PyQt6.QtCore import QObject, QPointF, QRectF, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap
+
+from services.screen_data_service import screen_service
+from services.style_data_service import style_data_service
+
+DEFAULT_BUDGET_BYTES = 48 * 1024 * 1024
+# Layer scales are powers of two within these bounds
+_MIN_SCALE_EXP = -4
+_MAX_SCALE_EXP = 2
+
+LayerKey = Tuple[str, int, float]
+
+
+def layer_scale(scale: float) -> float:
+    """Round a view scale to the power of two layers are cached at."""
+    if scale <= 0:
+        return 1.0
+    exp = round(math.log2(scale))
+    return 2.0 ** max(_MIN_SCALE_EXP, min(_MAX_SCALE_EXP, exp))
+
+
+def screen_size(screen_data) -> Tuple[float, float]:
+    size = (screen_data or {}).get('size') or {}
+    return float(size.get('width', 1920)), float(size.get('height', 1080))
+
+
+def embed_style(base_screen_data, instance_data) -> dict:
+    """Style of an embed: the base screen's style with instance overrides."""
+    return {**base_screen_data.get('style', {}), **instance_data.get('style', {})}
+
+
+def paint_embed_background(painter: QPainter, rect: QRectF, style: dict):
+    bg_color = QColor(style.get('color1', '#555b66'))
+    bg_color.setAlphaF(style.get('opacity', 1.0))
+    painter.save()
+    painter.setBrush(bg_color)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawRect(rect)
+    painter.restore()
+
+
+def _paint_cycle_placeholder(painter: QPainter, rect: QRectF):
+    painter.save()
+    painter.setPen(QPen(QColor('#d9534f'), 0, Qt.PenStyle.DashLine))
+    painter.setBrush(Qt.BrushStyle.BDiagPattern)
+    painter.drawRect(rect)
+    painter.restore()
+
+
+def _embedded_screens(screen_id: str):
+    screen_data = screen_service.get_screen(screen_id) or {}
+    for child in screen_data.get('children', []):
+        embedded_id = child.get('screen_id')
+        if embedded_id:
+            yield embedded_id
+
+
+def reaches(source_id: str, target_id: str) -> bool:
+    """Whether ``source_id`` embeds ``target_id``, directly or nested."""
+    stack = [source_id]
+    seen: Set[str] = set()
+    while stack:
+        sid = stack.pop()
+        if sid == target_id:
+            return True
+        if sid in seen:
+            continue
+        seen.add(sid)
+        stack.extend(_embedded_screens(sid))
+    return False
+
+
+@dataclass(slots=True)
+class ScreenLayerStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    direct_paints: int = 0
+    bytes: int = 0
+    entries: int = 0
+
+
+class ScreenLayerCache(QObject):
+    """Cached, recursively composed layers of screens' children.
+
+    ``invalidated(screen_id)`` is emitted for a changed screen and for
+    every screen embedding it; views showing those screens repaint.
+    """
+
+    invalidated = pyqtSignal(str)
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        super().__init__()
+        self._budget = max(0, int(budget_bytes))
+        self._versions: Dict[str, int] = {}
+        self._entries: "OrderedDict[LayerKey, Tuple[QPixmap, int]]" = OrderedDict()
+        # Resolved button styles per screen, dropped with the screen's layers
+        self._styles: Dict[str, Dict[str, dict]] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._direct = 0
+        screen_service.screen_modified.connect(self.invalidate)
+        screen_service.screen_list_changed.connect(self.clear)
+        # Shared styles are written into button properties without a
+        # screen_modified notification
+        style_data_service.style_applied.connect(self._on_style_applied)
+
+    def set_budget(self, budget_bytes: int):
+        self._budget = max(0, int(budget_bytes))
+        self._evict()
+
+    def stats(self) -> ScreenLayerStats:
+        return ScreenLayerStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            direct_paints=self._direct,
+            bytes=self._bytes,
+            entries=len(self._entries),
+        )
+
+    def version(self, screen_id: str) -> int:
+        return self._versions.get(screen_id, 0)
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+        self._versions.clear()
+        self._styles.clear()
+
+    def invalidate(self, screen_id: str):
+        """Drop the layers of ``screen_id`` and of every screen embedding it."""
+        stack = [screen_id]
+        seen: Set[str] = set()
+        while stack:
+            sid = stack.pop()
+            if sid in seen:
+                continue
+            seen.add(sid)
+            self._versions[sid] = self._versions.get(sid, 0) + 1
+            self._styles.pop(sid, None)
+            stack.extend(screen_service._child_to_parents.get(sid, ()))
+        stale = [key for key in self._entries if key[0] in seen]
+        for key in stale:
+            self._bytes -= self._entries.pop(key)[1]
+        self._invalidations += len(seen)
+        for sid in seen:
+            self.invalidated.emit(sid)
+
+    def paint(self, painter: QPainter, screen_id: str, rect: QRectF, scale: float):
+        """Draw the children of ``screen_id`` stretched over ``rect``.
+
+        ``scale`` is the device pixels per logical unit of ``rect``.
+        """
+        screen_data = screen_service.get_screen(screen_id)
+        if not screen_data:
+            return
+        sw, sh = screen_size(screen_data)
+        if sw <= 0 or sh <= 0 or rect.isEmpty():
+            return
+        # Device pixels per screen unit
+        content_scale = layer_scale(scale * max(rect.width() / sw, rect.height() / sh))
+        pix = self.layer(screen_id, content_scale)
+        if pix is not None:
+            painter.drawPixmap(rect, pix, QRectF(pix.rect()))
+            return
+        # Too large for the budget: compose straight into the painter
+        self._direct += 1
+        painter.save()
+        painter.translate(rect.topLeft())
+        painter.scale(rect.width() / sw, rect.height() / sh)
+        painter.setClipRect(QRectF(0, 0, sw, sh), Qt.ClipOperation.IntersectClip)
+        self._compose(painter, screen_id, content_scale)
+        painter.restore()
+
+    def layer(self, screen_id: str, scale: float) -> Optional[QPixmap]:
+        """Layer of ``screen_id`` at ``scale`` device pixels per screen unit.
+
+        ``None`` if the screen is unknown or the layer exceeds the budget.
+        """
+        scale = layer_scale(scale)
+        key = (screen_id, self.version(screen_id), scale)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+        screen_data = screen_service.get_screen(screen_id)
+        if not screen_data:
+            return None
+        self._misses += 1
+        sw, sh = screen_size(screen_data)
+        pw, ph = max(1, int(math.ceil(sw * scale))), max(1, int(math.ceil(sh * scale)))
+        cost = pw * ph * 4
+        if cost > self._budget:
+            return None
+        pix = QPixmap(pw, ph)
+        pix.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pix)
+        painter.scale(pw / sw, ph / sh)
+        self._compose(painter, screen_id, scale)
+        painter.end()
+        self._entries[key] = (pix, cost)
+        self._bytes += cost
+        self._evict()
+        return pix
+
+    def _compose(self, painter: QPainter, screen_id: str, scale: float):
+        """Paint the children of ``screen_id`` in its page coordinates."""
+        from .graphics_items import ButtonItem, button_style_manager, resolve_button_style
+
+        screen_data = screen_service.get_screen(screen_id) or {}
+        styles = self._styles.setdefault(screen_id, {})
+        for child in screen_data.get('children', []):
+            props = child.get('properties', {})
+            pos = child.get('position') or props.get('position', {})
+            x, y = float(pos.get('x', 0)), float(pos.get('y', 0))
+            embedded_id = child.get('screen_id')
+            if embedded_id:
+                base = screen_service.get_screen(embedded_id)
+                size = child.get('size') or {}
+                bw, bh = screen_size(base) if base else (200.0, 150.0)
+                rect = QRectF(x, y, float(size.get('width', bw)), float(size.get('height', bh)))
+                if base is None:
+                    continue
+                paint_embed_background(painter, rect, embed_style(base, child))
+                if reaches(embedded_id, screen_id):
+                    _paint_cycle_placeholder(painter, rect)
+                else:
+                    self.paint(painter, embedded_id, rect, scale)
+            else:
+                size = props.get('size', {})
+                w, h = float(size.get('width', 100)), float(size.get('height', 40))
+                # Resolve conditional defaults the way the canvas does, once
+                # per button until the screen changes
+                instance_id = child.get('instance_id')
+                resolved = styles.get(instance_id)
+                if resolved is None:
+                    resolved = resolve_button_style(props, button_style_manager(props), {})
+                    styles[instance_id] = resolved
+                painter.save()
+                painter.translate(QPointF(x, y))
+                ButtonItem._render(painter, resolved, w, h)
+                painter.restore()
+
+    def _on_style_applied(self, _style_id: str, affected: dict):
+        for screen_id in affected:
+            self.invalidate(screen_id)
+
+    def _evict(self):
+        while self._bytes > self._budget and self._entries:
+            _key, (_pix, cost) = self._entries.popitem(last=False)
+            self._bytes -= cost
+            self._evictions += 1
+
+
+# Shared by every design canvas
+screen_layers = ScreenLayerCache()
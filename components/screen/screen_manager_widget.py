@@ -13,6 +13,7 @@ from services.command_history_service import command_history_service
 from services.commands import AddScreenCommand, RemoveScreenCommand, UpdateScreenPropertiesCommand
 from dialogs import ScreenPropertiesDialog
 from .screen_tree import ScreenTreeWidget, ScreenTreeItem
+from .thumbnail_service import thumbnail_service
 
 class ScreenManagerWidget(QWidget):
     screen_open_requested = pyqtSignal(str)
@@ -37,6 +38,7 @@ class ScreenManagerWidget(QWidget):
         self.tree.itemSelectionChanged.connect(self.selection_changed.emit)
 
         data_context.screens_changed.connect(self._handle_screen_event)
+        thumbnail_service.thumbnail_changed.connect(self._on_thumbnail_changed)
         
         self.sync_tree_with_service()
 
@@ -110,8 +112,20 @@ class ScreenManagerWidget(QWidget):
         if action == "screen_list_changed":
             self.sync_tree_with_service()
         elif action == "screen_modified":
+            delta = event.get("delta")
+            if delta is not None and not (delta.added or delta.removed or delta.reordered):
+                # Moved/edited children do not change the screen hierarchy
+                return
             self._on_screen_modified(event.get("screen_id", ""))
 
+    def _on_thumbnail_changed(self, screen_id: str):
+        item = self.item_map.get(screen_id)
+        if item is None:
+            return
+        icon = self.tree.thumbnail_icon(screen_id)
+        if icon is not None:
+            item.setIcon(0, icon)
+
     def _get_or_create_root_item(self, type_name, display_text, icon, color):
         if type_name in self.root_items: return self.root_items[type_name]
         item = ScreenTreeItem(self.tree, [display_text])
@@ -158,7 +172,9 @@ class ScreenManagerWidget(QWidget):
         else:
             item_text = f"[{screen_data.get('number', '?')}] - {screen_data.get('name', 'Screen')}"
             icon_map = {'base': 'fa5.clone', 'window': 'fa5.window-maximize', 'report': 'fa5.file-alt'}
-            item.setIcon(0, qta.icon(icon_map.get(screen_data.get('type'), 'fa5.square'), color='#c8cdd4'))
+            # Content preview once rendered; the type icon until then
+            icon = self.tree.thumbnail_icon(screen_id)
+            item.setIcon(0, icon or qta.icon(icon_map.get(screen_data.get('type'), 'fa5.square'), color='#c8cdd4'))
             item.setData(0, Qt.ItemDataRole.UserRole + 1, screen_data.get('number'))
         item.setText(0, item_text)
         item.setData(0, Qt.ItemDataRole.UserRole, screen_id)
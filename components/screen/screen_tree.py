@@ -2,10 +2,14 @@
 # Contains the custom QTreeWidget and QTreeWidgetItem for the screen manager.
 
 from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem, QAbstractItemView
-from PyQt6.QtCore import Qt, pyqtSignal, QMimeData, QByteArray
-from PyQt6.QtGui import QDrag, QKeyEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QMimeData, QByteArray, QSize
+from PyQt6.QtGui import QDrag, QKeyEvent, QIcon
 from components.tree_widget import CustomTreeWidget
 from utils import constants
+from .thumbnail_service import thumbnail_service, fitted_size
+
+# Box the screen previews are fitted into, in logical pixels
+THUMBNAIL_SIZE = QSize(32, 18)
 
 
 class ScreenTreeItem(QTreeWidgetItem):
@@ -41,6 +45,20 @@ class ScreenTreeWidget(CustomTreeWidget):
         self.setSortingEnabled(True)
         self.sortByColumn(0, Qt.SortOrder.AscendingOrder)
         self.setRootIsDecorated(True)
+        self.setIconSize(THUMBNAIL_SIZE)
+
+    def thumbnail_icon(self, screen_id):
+        """Preview icon of ``screen_id``, or ``None`` while it renders."""
+        dpr = self.devicePixelRatioF()
+        w, h = fitted_size(
+            screen_id,
+            int(THUMBNAIL_SIZE.width() * dpr),
+            int(THUMBNAIL_SIZE.height() * dpr),
+        )
+        pix = thumbnail_service.thumbnail(screen_id, w, h)
+        if pix is None or pix.isNull():
+            return None
+        return QIcon(pix)
 
     def keyPressEvent(self, event: QKeyEvent):
         """Emit a signal when the delete key is pressed."""
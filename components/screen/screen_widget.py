@@ -17,6 +17,7 @@ class ScreenWidget(QWidget):
     mouse_moved_on_scene = pyqtSignal(QPointF)
     mouse_left_scene = pyqtSignal()
     selection_dragged = pyqtSignal(dict)
+    selection_geometry_changed = pyqtSignal(str, object)
     zoom_changed = pyqtSignal(float)
 
     def __init__(self, screen_id, parent=None):
@@ -34,17 +35,25 @@ class ScreenWidget(QWidget):
         self.design_canvas.mouse_moved_on_scene.connect(self.mouse_moved_on_scene.emit)
         self.design_canvas.mouse_left_scene.connect(self.mouse_left_scene.emit)
         self.design_canvas.selection_dragged.connect(self.selection_dragged.emit)
+        self.design_canvas.selection_geometry_changed.connect(self.selection_geometry_changed.emit)
         self.design_canvas.zoom_changed.connect(self.zoom_changed.emit)
 
-        data_context.screens_changed.connect(
-            lambda evt: self.on_screen_modified(evt.get("screen_id", ""))
-            if evt.get("action") == "screen_modified"
-            else None
-        )
+        data_context.screens_changed.connect(self._handle_screen_event)
 
     def set_active_tool(self, tool_name: str):
         self.design_canvas.set_active_tool(tool_name)
 
+    def _handle_screen_event(self, event: dict):
+        if event.get("action") != "screen_modified":
+            return
+        screen_id = event.get("screen_id", "")
+        delta = event.get("delta")
+        if delta is not None and screen_id == self.screen_id and screen_service.get_screen(screen_id):
+            # Only the listed children changed
+            self.design_canvas.apply_children_delta(delta)
+            return
+        self.on_screen_modified(screen_id)
+
     @pyqtSlot(str)
     def on_screen_modified(self, modified_screen_id: str):
         if self.screen_id == modified_screen_id:
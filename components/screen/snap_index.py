@@ -0,0 +1,89 @@
+# components/screen/snap_index.py
+"""
+Sorted snap-line index for object snapping on the design canvas.
+
+Each indexed item contributes its left/center/right x and top/center/bottom
+y values.  The values are kept in two sorted lists so the nearest line to
+the cursor is found with a binary search instead of scanning every item.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from PyQt6.QtCore import QRectF
+
+_Lines = Tuple[Tuple[float, float, float], Tuple[float, float, float]]
+
+
+def _lines_of(rect: QRectF) -> _Lines:
+    center = rect.center()
+    return (
+        (rect.left(), center.x(), rect.right()),
+        (rect.top(), center.y(), rect.bottom()),
+    )
+
+
+def _nearest(values: List[float], value: float, threshold: float) -> Optional[float]:
+    """Closest entry of sorted ``values`` strictly within ``threshold``."""
+    i = bisect_left(values, value)
+    best = None
+    best_d = threshold
+    for j in (i - 1, i):
+        if 0 <= j < len(values):
+            d = abs(values[j] - value)
+            if d < best_d:
+                best, best_d = values[j], d
+    return best
+
+
+class SnapIndex:
+    """Snap lines of a set of items, keyed by an item id."""
+
+    def __init__(self):
+        self._xs: List[float] = []
+        self._ys: List[float] = []
+        self._lines: Dict[Hashable, _Lines] = {}
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._lines
+
+    def clear(self):
+        self._xs.clear()
+        self._ys.clear()
+        self._lines.clear()
+
+    def rebuild(self, entries: Iterable[Tuple[Hashable, QRectF]]):
+        """Replace the index with ``(key, scene_rect)`` entries."""
+        self._lines = {key: _lines_of(rect) for key, rect in entries}
+        self._xs = sorted(x for xs, _ys in self._lines.values() for x in xs)
+        self._ys = sorted(y for _xs, ys in self._lines.values() for y in ys)
+
+    def update(self, key: Hashable, rect: QRectF):
+        """Insert ``key`` or move its lines to ``rect``."""
+        lines = _lines_of(rect)
+        if self._lines.get(key) == lines:
+            return
+        self.discard(key)
+        self._lines[key] = lines
+        for x in lines[0]:
+            insort(self._xs, x)
+        for y in lines[1]:
+            insort(self._ys, y)
+
+    def discard(self, key: Hashable):
+        lines = self._lines.pop(key, None)
+        if lines is None:
+            return
+        for x in lines[0]:
+            del self._xs[bisect_left(self._xs, x)]
+        for y in lines[1]:
+            del self._ys[bisect_left(self._ys, y)]
+
+    def nearest_x(self, x: float, threshold: float) -> Optional[float]:
+        return _nearest(self._xs, x, threshold)
+
+    def nearest_y(self, y: float, threshold: float) -> Optional[float]:
+        return _nearest(self._ys, y, threshold)
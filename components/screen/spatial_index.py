@@ -0,0 +1,97 @@
+# components/screen/spatial_index.py
+"""
+Uniform-grid spatial index of item rects.
+
+Each rect is filed under every grid cell it overlaps, so a rect query only
+looks at items in the cells the query covers instead of every item on the
+screen.  Used for live rubber-band hit-testing on the design canvas.
+"""
+
+import math
+from typing import Dict, Hashable, Iterable, Iterator, List, Set, Tuple
+
+from PyQt6.QtCore import QRectF
+
+DEFAULT_CELL_SIZE = 256.0
+
+
+def subtract(a: QRectF, b: QRectF) -> List[QRectF]:
+    """The parts of ``a`` outside ``b``, as up to four rects."""
+    if a.isEmpty():
+        return []
+    if b.isEmpty() or not a.intersects(b):
+        return [QRectF(a)]
+    parts = []
+    top = max(a.top(), b.top())
+    bottom = min(a.bottom(), b.bottom())
+    if a.top() < b.top():
+        parts.append(QRectF(a.left(), a.top(), a.width(), b.top() - a.top()))
+    if a.bottom() > b.bottom():
+        parts.append(QRectF(a.left(), b.bottom(), a.width(), a.bottom() - b.bottom()))
+    if a.left() < b.left():
+        parts.append(QRectF(a.left(), top, b.left() - a.left(), bottom - top))
+    if a.right() > b.right():
+        parts.append(QRectF(b.right(), top, a.right() - b.right(), bottom - top))
+    return parts
+
+
+class GridIndex:
+    """Rects keyed by an item id, bucketed into square grid cells."""
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self._cell = float(cell_size)
+        self._rects: Dict[Hashable, QRectF] = {}
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rects
+
+    def _cells_of(self, rect: QRectF) -> Iterator[Tuple[int, int]]:
+        c = self._cell
+        for i in range(math.floor(rect.left() / c), math.floor(rect.right() / c) + 1):
+            for j in range(math.floor(rect.top() / c), math.floor(rect.bottom() / c) + 1):
+                yield (i, j)
+
+    def rect(self, key: Hashable) -> QRectF:
+        return self._rects[key]
+
+    def clear(self):
+        self._rects.clear()
+        self._cells.clear()
+
+    def rebuild(self, entries: Iterable[Tuple[Hashable, QRectF]]):
+        self.clear()
+        for key, rect in entries:
+            self.update(key, rect)
+
+    def update(self, key: Hashable, rect: QRectF):
+        """Insert ``key`` or move it to ``rect``."""
+        self.discard(key)
+        self._rects[key] = QRectF(rect)
+        for cell in self._cells_of(rect):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def discard(self, key: Hashable):
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        for cell in self._cells_of(rect):
+            keys = self._cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+
+    def query(self, rect: QRectF) -> Set[Hashable]:
+        """Keys whose rects intersect ``rect``."""
+        if rect.isEmpty():
+            return set()
+        found: Set[Hashable] = set()
+        for cell in self._cells_of(rect):
+            keys = self._cells.get(cell)
+            if keys:
+                found |= keys
+        return {key for key in found if self._rects[key].intersects(rect)}
@@ -0,0 +1,326 @@
+# components/screen/thumbnail_service.py
+"""
+Background-rendered screen thumbnails for the screen tree.
+
+A screen's content is first reduced, on the GUI thread, to an immutable
+snapshot of plain values: page size and colour, and each child's rect and
+fill, with embedded screens nested.  Thumbnails are keyed by the hash of
+that snapshot, so a screen that returns to an earlier state (undo) reuses
+that state's thumbnail.  Rendering the snapshot only needs ``QImage`` and
+``QPainter``, which are safe off the GUI thread; it runs on the global
+``QThreadPool`` and the GUI thread converts the result to ``QPixmap``.
+
+Thumbnails are miniatures: children are drawn as their filled shapes only
+(no text or icons), like the canvas's low-zoom proxies; embedded screens
+on the canvas are drawn in full by :mod:`screen_layers`.  Snapshots are
+dropped when ``screen_service.screen_modified`` fires for a screen or for
+any screen it embeds.  Until a new render finishes, the last thumbnail of
+the screen is returned so views do not flicker.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+
+from PyQt6.QtCore import QObject, QRectF, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+
+from services.screen_data_service import screen_service
+from services.style_data_service import style_data_service
+
+logger = logging.getLogger(__name__)
+
+# Embedded screens nested deeper than this are drawn as plain rects
+_MAX_DEPTH = 3
+DEFAULT_BUDGET_BYTES = 16 * 1024 * 1024
+
+# (kind, x, y, w, h, fill, radius, nested snapshot or None)
+_Child = Tuple[str, float, float, float, float, Optional[str], float, Optional["Snapshot"]]
+# (width, height, fill or None if transparent, children)
+Snapshot = Tuple[float, float, Optional[str], Tuple[_Child, ...]]
+# (content hash, width, height, with page fill)
+ThumbKey = Tuple[int, int, int, bool]
+
+
+def fitted_size(screen_id: str, max_width: int, max_height: int) -> Tuple[int, int]:
+    """Largest size with the screen's aspect ratio inside the given box."""
+    screen_data = screen_service.get_screen(screen_id)
+    w, h = _screen_size(screen_data) if screen_data else (max_width, max_height)
+    if w <= 0 or h <= 0:
+        return max_width, max_height
+    scale = min(max_width / w, max_height / h)
+    return max(1, int(round(w * scale))), max(1, int(round(h * scale)))
+
+
+def _screen_size(screen_data) -> Tuple[float, float]:
+    size = screen_data.get('size') or {}
+    return float(size.get('width', 1920)), float(size.get('height', 1080))
+
+
+def _screen_fill(style) -> Optional[str]:
+    if style.get('transparent', False):
+        return None
+    return style.get('color1', '#ffffff')
+
+
+def _snapshot(screen_id: str, depth: int = 0, visiting: Optional[Set[str]] = None) -> Optional[Snapshot]:
+    """Reduce a screen to the hashable values its thumbnail is drawn from."""
+    screen_data = screen_service.get_screen(screen_id)
+    if not screen_data:
+        return None
+    visiting = (visiting or set()) | {screen_id}
+    w, h = _screen_size(screen_data)
+    children = []
+    for child in screen_data.get('children', []):
+        props = child.get('properties', {})
+        pos = child.get('position') or props.get('position', {})
+        x, y = float(pos.get('x', 0)), float(pos.get('y', 0))
+        embedded_id = child.get('screen_id')
+        if embedded_id:
+            base = screen_service.get_screen(embedded_id) or {}
+            size = child.get('size') or {}
+            bw, bh = _screen_size(base) if base else (200.0, 150.0)
+            cw, ch = float(size.get('width', bw)), float(size.get('height', bh))
+            nested = None
+            if depth + 1 < _MAX_DEPTH and embedded_id not in visiting:
+                nested = _snapshot(embedded_id, depth + 1, visiting)
+            style = {**base.get('style', {}), **child.get('style', {})}
+            children.append(('screen', x, y, cw, ch, _screen_fill(style), 0.0, nested))
+        else:
+            size = props.get('size', {})
+            cw, ch = float(size.get('width', 100)), float(size.get('height', 40))
+            fill = (
+                props.get('background_color')
+                or props.get('default_style', {}).get('background_color')
+                or '#5a6270'
+            )
+            try:
+                radius = float(props.get('border_radius', 0)) * min(cw, ch) / 100.0
+            except (TypeError, ValueError):
+                radius = 0.0
+            if props.get('component_type') == 'Circle Button':
+                radius = min(cw, ch) / 2
+            children.append(('button', x, y, cw, ch, fill, radius, None))
+    return (w, h, _screen_fill(screen_data.get('style', {})), tuple(children))
+
+
+def _paint_snapshot(painter: QPainter, snapshot: Snapshot, page: bool = True):
+    """Draw ``snapshot`` in its own page coordinates (thread-safe)."""
+    w, h, fill, children = snapshot
+    if fill and page:
+        painter.fillRect(QRectF(0, 0, w, h), QColor(fill))
+    for kind, x, y, cw, ch, child_fill, radius, nested in children:
+        rect = QRectF(x, y, cw, ch)
+        if kind == 'screen' and nested is not None:
+            painter.save()
+            painter.setClipRect(rect, Qt.ClipOperation.IntersectClip)
+            painter.translate(x, y)
+            nw, nh = nested[0], nested[1]
+            if nw > 0 and nh > 0:
+                painter.scale(cw / nw, ch / nh)
+            _paint_snapshot(painter, nested)
+            painter.restore()
+        elif child_fill:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(child_fill))
+            if radius > 0:
+                painter.drawRoundedRect(rect, radius, radius)
+            else:
+                painter.drawRect(rect)
+
+
+def render_snapshot(snapshot: Snapshot, width: int, height: int, page: bool = True) -> QImage:
+    """Rasterize ``snapshot`` into a ``width`` x ``height`` image (thread-safe).
+
+    With ``page`` false the screen's own background is left transparent.
+    """
+    image = QImage(max(1, width), max(1, height), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    w, h = snapshot[0], snapshot[1]
+    if w <= 0 or h <= 0:
+        return image
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.scale(image.width() / w, image.height() / h)
+    _paint_snapshot(painter, snapshot, page)
+    painter.end()
+    return image
+
+
+@dataclass(slots=True)
+class ThumbnailStats:
+    hits: int = 0
+    misses: int = 0
+    renders: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    bytes: int = 0
+    entries: int = 0
+    pending: int = 0
+
+
+class _ThumbnailSignals(QObject):
+    done = pyqtSignal(str, object, object)  # screen id, ThumbKey, QImage
+
+
+class _ThumbnailRunnable(QRunnable):
+    def __init__(self, screen_id: str, key: ThumbKey, snapshot: Snapshot, signals: _ThumbnailSignals):
+        super().__init__()
+        self.screen_id = screen_id
+        self.key = key
+        self.snapshot = snapshot
+        self.signals = signals
+
+    def run(self):
+        _digest, width, height, page = self.key
+        try:
+            image = render_snapshot(self.snapshot, width, height, page)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to render thumbnail for screen '%s': %s", self.screen_id, exc)
+            image = QImage()
+        self.signals.done.emit(self.screen_id, self.key, image)
+
+
+class ThumbnailService(QObject):
+    """Shared cache of screen thumbnails rendered off the GUI thread.
+
+    ``thumbnail_changed(screen_id)`` is emitted when a screen's content
+    changed and again when its new thumbnail is ready; views repaint and
+    ask for the thumbnail again.
+    """
+
+    thumbnail_changed = pyqtSignal(str)
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        super().__init__()
+        self._budget = max(0, int(budget_bytes))
+        # screen id -> (content hash, snapshot), or None for unknown screens
+        self._snapshots: Dict[str, Optional[Tuple[int, Snapshot]]] = {}
+        # key -> (pixmap, cost)
+        self._pixmaps: "OrderedDict[ThumbKey, Tuple[QPixmap, int]]" = OrderedDict()
+        # (screen id, page) -> last thumbnail shown, returned while a new one
+        # renders
+        self._latest: Dict[Tuple[str, bool], QPixmap] = {}
+        self._pending: set = set()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._renders = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._signals = _ThumbnailSignals()
+        self._signals.done.connect(self._on_rendered)
+        screen_service.screen_modified.connect(self.invalidate)
+        screen_service.screen_list_changed.connect(self._on_screen_list_changed)
+        # Shared styles are written into button properties without a
+        # screen_modified notification
+        style_data_service.style_applied.connect(self._on_style_applied)
+
+    def set_budget(self, budget_bytes: int):
+        self._budget = max(0, int(budget_bytes))
+        self._evict()
+
+    def stats(self) -> ThumbnailStats:
+        return ThumbnailStats(
+            hits=self._hits,
+            misses=self._misses,
+            renders=self._renders,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            bytes=self._bytes,
+            entries=len(self._pixmaps),
+            pending=len(self._pending),
+        )
+
+    def invalidate(self, screen_id: str):
+        """Forget the content of ``screen_id`` and every screen embedding it."""
+        stack = [screen_id]
+        seen = set()
+        while stack:
+            sid = stack.pop()
+            if sid in seen:
+                continue
+            seen.add(sid)
+            if self._snapshots.pop(sid, None) is not None:
+                self._invalidations += 1
+            stack.extend(screen_service.get_parent_screens(sid))
+        for sid in seen:
+            self.thumbnail_changed.emit(sid)
+
+    def clear(self):
+        self._snapshots.clear()
+        self._pixmaps.clear()
+        self._latest.clear()
+        self._bytes = 0
+
+    def thumbnail(self, screen_id: str, width: int, height: int, page: bool = True) -> Optional[QPixmap]:
+        """Return the thumbnail of ``screen_id`` at ``width`` x ``height`` pixels.
+
+        ``page`` includes the screen's own background; embedded screens
+        paint their (instance-styled) background themselves.  On a miss a
+        background render is queued and the screen's previous thumbnail
+        (possibly stale or another size) or ``None`` is returned.
+        """
+        if screen_id not in self._snapshots:
+            snapshot = _snapshot(screen_id)
+            self._snapshots[screen_id] = None if snapshot is None else (hash(snapshot), snapshot)
+        content = self._snapshots[screen_id]
+        if content is None:
+            return None
+        digest, snapshot = content
+        key = (digest, max(1, int(width)), max(1, int(height)), bool(page))
+        entry = self._pixmaps.get(key)
+        if entry is not None:
+            self._pixmaps.move_to_end(key)
+            self._hits += 1
+            self._latest[(screen_id, key[3])] = entry[0]
+            return entry[0]
+        self._misses += 1
+        if key not in self._pending:
+            self._pending.add(key)
+            QThreadPool.globalInstance().start(
+                _ThumbnailRunnable(screen_id, key, snapshot, self._signals)
+            )
+        return self._latest.get((screen_id, key[3]))
+
+    def _on_rendered(self, screen_id: str, key: ThumbKey, image: QImage):
+        self._pending.discard(key)
+        self._renders += 1
+        if image.isNull():
+            return
+        pix = QPixmap.fromImage(image)
+        cost = max(1, pix.width() * pix.height() * 4)
+        old = self._pixmaps.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._pixmaps[key] = (pix, cost)
+        self._bytes += cost
+        self._evict()
+        content = self._snapshots.get(screen_id)
+        if content is not None and content[0] == key[0]:
+            self._latest[(screen_id, key[3])] = pix
+            self.thumbnail_changed.emit(screen_id)
+
+    def _on_style_applied(self, _style_id: str, affected: dict):
+        for screen_id in affected:
+            self.invalidate(screen_id)
+
+    def _on_screen_list_changed(self):
+        # Screens may have been added, removed or replaced wholesale
+        self._snapshots.clear()
+        live = screen_service.get_all_screens()
+        for latest_key in [k for k in self._latest if k[0] not in live]:
+            del self._latest[latest_key]
+
+    def _evict(self):
+        while self._bytes > self._budget and self._pixmaps:
+            _key, (_pix, cost) = self._pixmaps.popitem(last=False)
+            self._bytes -= cost
+            self._evictions += 1
+
+
+# Shared by the screen tree
+thumbnail_service = ThumbnailService()
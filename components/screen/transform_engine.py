@@ -0,0 +1,171 @@
+# components/screen/transform_engine.py
+"""
+Align, distribute, match-size and grid-arrange for a canvas selection.
+
+The selection's geometry is gathered once into parallel columns (ids, x,
+y, width, height).  Each operation is a pure function from those columns
+to new ones, so the arithmetic runs over flat float lists and never
+touches graphics items.  :func:`command_for` turns the difference into a
+single geometry-only undo command.  The command's children delta then
+updates the canvas items in one pass.
+"""
+
+import math
+from operator import add
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional
+
+from services.commands import BulkMoveChildCommand, BulkResizeChildCommand
+from .drag_session import item_geometry
+
+
+@dataclass(slots=True)
+class SelectionGeometry:
+    ids: List[str] = field(default_factory=list)
+    x: List[float] = field(default_factory=list)
+    y: List[float] = field(default_factory=list)
+    w: List[float] = field(default_factory=list)
+    h: List[float] = field(default_factory=list)
+
+    @classmethod
+    def from_items(cls, items: Iterable) -> "SelectionGeometry":
+        geometry = cls()
+        for item in items:
+            x, y, w, h = item_geometry(item)
+            geometry.ids.append(item.get_instance_id())
+            geometry.x.append(x)
+            geometry.y.append(y)
+            geometry.w.append(w)
+            geometry.h.append(h)
+        return geometry
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def replace(self, x=None, y=None, w=None, h=None) -> "SelectionGeometry":
+        return SelectionGeometry(
+            self.ids,
+            self.x if x is None else x,
+            self.y if y is None else y,
+            self.w if w is None else w,
+            self.h if h is None else h,
+        )
+
+    def bounds(self):
+        """``(left, top, right, bottom)`` of the whole selection."""
+        return (
+            min(self.x),
+            min(self.y),
+            max(map(add, self.x, self.w)),
+            max(map(add, self.y, self.h)),
+        )
+
+
+def align(geometry: SelectionGeometry, edge: str) -> SelectionGeometry:
+    """Align to the selection bounds.
+
+    ``edge`` is one of ``left``, ``center``, ``right``, ``top``, ``middle``
+    or ``bottom``.
+    """
+    if len(geometry) < 2:
+        return geometry
+    left, top, right, bottom = geometry.bounds()
+    if edge == 'left':
+        return geometry.replace(x=[left] * len(geometry))
+    if edge == 'right':
+        return geometry.replace(x=[right - w for w in geometry.w])
+    if edge == 'center':
+        cx = (left + right) / 2.0
+        return geometry.replace(x=[cx - w / 2.0 for w in geometry.w])
+    if edge == 'top':
+        return geometry.replace(y=[top] * len(geometry))
+    if edge == 'bottom':
+        return geometry.replace(y=[bottom - h for h in geometry.h])
+    if edge == 'middle':
+        cy = (top + bottom) / 2.0
+        return geometry.replace(y=[cy - h / 2.0 for h in geometry.h])
+    raise ValueError(f"Unknown alignment edge: {edge!r}")
+
+
+def distribute(geometry: SelectionGeometry, axis: str) -> SelectionGeometry:
+    """Space items evenly between the outermost ones along ``'x'`` or ``'y'``."""
+    n = len(geometry)
+    if n < 3:
+        return geometry
+    if axis == 'x':
+        pos, size = geometry.x, geometry.w
+    elif axis == 'y':
+        pos, size = geometry.y, geometry.h
+    else:
+        raise ValueError(f"Unknown distribution axis: {axis!r}")
+    order = sorted(range(n), key=pos.__getitem__)
+    start = pos[order[0]]
+    end = max(map(add, pos, size))
+    gap = (end - start - sum(size)) / (n - 1)
+    new_pos = list(pos)
+    cursor = start
+    for i in order:
+        new_pos[i] = cursor
+        cursor += size[i] + gap
+    return geometry.replace(x=new_pos) if axis == 'x' else geometry.replace(y=new_pos)
+
+
+def match_size(geometry: SelectionGeometry, dimension: str = 'both', reference: str = 'largest') -> SelectionGeometry:
+    """Give every item the width and/or height of the largest (or smallest) one."""
+    if len(geometry) < 2:
+        return geometry
+    pick = max if reference == 'largest' else min
+    w = h = None
+    if dimension in ('width', 'both'):
+        w = [pick(geometry.w)] * len(geometry)
+    if dimension in ('height', 'both'):
+        h = [pick(geometry.h)] * len(geometry)
+    return geometry.replace(w=w, h=h)
+
+
+def grid_arrange(geometry: SelectionGeometry, columns: Optional[int] = None, spacing: float = 10.0) -> SelectionGeometry:
+    """Lay items out in reading order on a grid of equal cells.
+
+    The grid starts at the selection's top-left corner.  Cells are as large
+    as the largest item; ``columns`` defaults to a near-square grid.
+    """
+    n = len(geometry)
+    if n < 2:
+        return geometry
+    columns = max(1, columns or math.ceil(math.sqrt(n)))
+    left, top, _right, _bottom = geometry.bounds()
+    cell_w = max(geometry.w) + spacing
+    cell_h = max(geometry.h) + spacing
+    order = sorted(range(n), key=lambda i: (geometry.y[i], geometry.x[i]))
+    x = list(geometry.x)
+    y = list(geometry.y)
+    for slot, i in enumerate(order):
+        row, col = divmod(slot, columns)
+        x[i] = left + col * cell_w
+        y[i] = top + row * cell_h
+    return geometry.replace(x=x, y=y)
+
+
+def command_for(screen_id: str, before: SelectionGeometry, after: SelectionGeometry):
+    """One undo command taking ``screen_id``'s children from ``before`` to ``after``.
+
+    Position-only results become a :class:`BulkMoveChildCommand`, results
+    that resize a :class:`BulkResizeChildCommand`.  Both store geometry
+    only and apply it in one pass over the screen's children.  ``None`` if
+    nothing changed.
+    """
+    if after.w is before.w and after.h is before.h:
+        move_list = [
+            (instance_id, {'x': x1, 'y': y1}, {'x': x0, 'y': y0})
+            for instance_id, x0, y0, x1, y1 in zip(before.ids, before.x, before.y, after.x, after.y)
+            if x0 != x1 or y0 != y1
+        ]
+        return BulkMoveChildCommand(screen_id, move_list) if move_list else None
+
+    resize_list = []
+    for i, instance_id in enumerate(before.ids):
+        old = (before.x[i], before.y[i], before.w[i], before.h[i])
+        new = (after.x[i], after.y[i], after.w[i], after.h[i])
+        if old != new:
+            resize_list.append((instance_id, new, old))
+    return BulkResizeChildCommand(screen_id, resize_list) if resize_list else None
@@ -5,11 +5,7 @@ import os
 import json
 
 from PyQt6.QtCore import Qt, QSize, QEvent, QObject
-from PyQt6.QtGui import QIcon, QPixmap, QColor, QPainter
-try:
-    from PyQt6.QtSvg import QSvgRenderer  # type: ignore
-except Exception:  # pragma: no cover - optional at runtime
-    QSvgRenderer = None  # type: ignore
+from PyQt6.QtGui import QIcon, QPixmap, QColor
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -34,6 +30,7 @@ from PyQt6.QtWidgets import (
 )
 
 from utils.icon_manager import IconManager
+from utils.icon_raster import icon_raster
 from utils.dpi import dpi_scale
 from utils.percentage import percent_to_value
 
@@ -566,6 +563,8 @@ class IconPickerDialog(QDialog):
         # Load SVG files from current directory
         self._svg_items: List[_ThumbButton] = []
         self._svg_meta: Dict[_ThumbButton, Tuple[str, str]] = {}
+        self._svg_buttons_by_path: Dict[str, _ThumbButton] = {}
+        icon_raster.ready.connect(self._on_svg_raster_ready)
         self._reload_svg_dir(initial_search=search)
 
         self.svg_groups.currentTextChanged.connect(lambda _: self._apply_svg_filters(search.text()))
@@ -655,10 +654,22 @@ class IconPickerDialog(QDialog):
         self._svg_meta.clear()
         cols = self._compute_grid_cols(self.svg_grid)
         r = c = 0
+        self._svg_buttons_by_path.clear()
+        # Cached thumbnails show at once; the rest rasterize in the background
+        # in one batched prefetch
+        thumbs = {p: icon_raster.cached(p, 32) for p in files}
+        icon_raster.prefetch([p for p, pix in thumbs.items() if pix is None], 32)
         for p in files:
-            icon = self._svg_icon_from_path(p)
+            pix = thumbs[p]
+            if pix is None:
+                icon = QIcon()
+            elif pix.isNull():
+                icon = QIcon(p)
+            else:
+                icon = QIcon(pix)
             text = os.path.splitext(os.path.basename(p))[0]
             btn = _ThumbButton(text, icon)
+            self._svg_buttons_by_path[p] = btn
             btn.clicked.connect(lambda _=False, b=btn, v=p: self._on_select("svg", v, b))
             self._svg_items.append(btn)
             if root:
@@ -758,19 +769,22 @@ class IconPickerDialog(QDialog):
     def _svg_icon_from_path(self, path: str) -> QIcon:
         # Render SVG to pixmap to ensure visibility even if QIcon lacks SVG plugin
         try:
-            if QSvgRenderer is not None:
-                renderer = QSvgRenderer(path)
-                if renderer.isValid():
-                    size = QSize(32, 32)
-                    pix = QPixmap(size)
-                    pix.fill(Qt.GlobalColor.transparent)
-                    painter = QPainter(pix)
-                    renderer.render(painter)
-                    painter.end()
-                    return QIcon(pix)
+            icon = icon_raster.icon(path, 32)
+            if not icon.isNull():
+                return icon
         except Exception:
             pass
         # Fallback: let QIcon try
         return QIcon(path)
 
+    def _on_svg_raster_ready(self, path: str, size: int):
+        btn = self._svg_buttons_by_path.get(path)
+        if btn is None or size != 32:
+            return
+        try:
+            btn.setIcon(self._svg_icon_from_path(path))
+        except RuntimeError:
+            # Button was deleted by a later reload
+            self._svg_buttons_by_path.pop(path, None)
+
     # No SVG color override UI or parsing helpers
@@ -3,10 +3,10 @@ from PyQt6.QtGui import QAction, QKeySequence
 from utils.icon_manager import IconManager
 from services.command_history_service import command_history_service
 from services.clipboard_service import clipboard_service
-from services.commands import BulkMoveChildCommand
 from components.docks import ProjectDock
 from components.screen.screen_widget import ScreenWidget
 from components.screen.graphics_items import BaseGraphicsItem
+from components.screen import transform_engine
 from components.tag_editor_widget import TagEditorWidget
 from utils import constants
 
@@ -134,217 +134,42 @@ def _get_selected_items(win):
     return current_widget, canvas, items
 
 
-def align_left(win):
+def _arrange(win, operation, *args):
+    """Run a transform engine operation on the active canvas selection."""
     widget, canvas, items = _get_selected_items(win)
-    if len(items) < 2:
+    if canvas is None or len(items) < 2:
         return
-    left = min(item.pos().x() for item in items)
-    move_list = []
-    for item in items:
-        old_x = item.pos().x()
-        old_y = item.pos().y()
-        if old_x != left:
-            item.setPos(left, old_y)
-            move_list.append((
-                item.get_instance_id(),
-                {'x': left, 'y': old_y},
-                {'x': old_x, 'y': old_y},
-            ))
-    if move_list:
-        command_history_service.add_command(
-            BulkMoveChildCommand(canvas.screen_id, move_list)
-        )
+    if canvas.arrange_selection(operation, *args):
         widget.refresh_selection_status()
 
 
+def align_left(win):
+    _arrange(win, transform_engine.align, 'left')
+
+
 def align_right(win):
-    widget, canvas, items = _get_selected_items(win)
-    if len(items) < 2:
-        return
-    right = max(item.pos().x() + item.boundingRect().width() for item in items)
-    move_list = []
-    for item in items:
-        w = item.boundingRect().width()
-        new_x = right - w
-        old_x = item.pos().x()
-        old_y = item.pos().y()
-        if old_x != new_x:
-            item.setPos(new_x, old_y)
-            move_list.append((
-                item.get_instance_id(),
-                {'x': new_x, 'y': old_y},
-                {'x': old_x, 'y': old_y},
-            ))
-    if move_list:
-        command_history_service.add_command(
-            BulkMoveChildCommand(canvas.screen_id, move_list)
-        )
-        widget.refresh_selection_status()
+    _arrange(win, transform_engine.align, 'right')
 
 
 def align_center(win):
-    widget, canvas, items = _get_selected_items(win)
-    if len(items) < 2:
-        return
-    left = min(item.pos().x() for item in items)
-    right = max(item.pos().x() + item.boundingRect().width() for item in items)
-    center_x = (left + right) / 2.0
-    move_list = []
-    for item in items:
-        w = item.boundingRect().width()
-        new_x = center_x - w / 2.0
-        old_x = item.pos().x()
-        old_y = item.pos().y()
-        if old_x != new_x:
-            item.setPos(new_x, old_y)
-            move_list.append((
-                item.get_instance_id(),
-                {'x': new_x, 'y': old_y},
-                {'x': old_x, 'y': old_y},
-            ))
-    if move_list:
-        command_history_service.add_command(
-            BulkMoveChildCommand(canvas.screen_id, move_list)
-        )
-        widget.refresh_selection_status()
+    _arrange(win, transform_engine.align, 'center')
 
 
 def align_top(win):
-    widget, canvas, items = _get_selected_items(win)
-    if len(items) < 2:
-        return
-    top = min(item.pos().y() for item in items)
-    move_list = []
-    for item in items:
-        old_x = item.pos().x()
-        old_y = item.pos().y()
-        if old_y != top:
-            item.setPos(old_x, top)
-            move_list.append(
-                (
-                    item.get_instance_id(),
-                    {'x': old_x, 'y': top},
-                    {'x': old_x, 'y': old_y},
-                )
-            )
-    if move_list:
-        command_history_service.add_command(
-            BulkMoveChildCommand(canvas.screen_id, move_list)
-        )
-        widget.refresh_selection_status()
+    _arrange(win, transform_engine.align, 'top')
 
 
 def align_bottom(win):
-    widget, canvas, items = _get_selected_items(win)
-    if len(items) < 2:
-        return
-    bottom = max(item.pos().y() + item.boundingRect().height() for item in items)
-    move_list = []
-    for item in items:
-        h = item.boundingRect().height()
-        new_y = bottom - h
-        old_x = item.pos().x()
-        old_y = item.pos().y()
-        if old_y != new_y:
-            item.setPos(old_x, new_y)
-            move_list.append(
-                (
-                    item.get_instance_id(),
-                    {'x': old_x, 'y': new_y},
-                    {'x': old_x, 'y': old_y},
-                )
-            )
-    if move_list:
-        command_history_service.add_command(
-            BulkMoveChildCommand(canvas.screen_id, move_list)
-        )
-        widget.refresh_selection_status()
+    _arrange(win, transform_engine.align, 'bottom')
 
 
 def align_middle(win):
-    widget, canvas, items = _get_selected_items(win)
-    if len(items) < 2:
-        return
-    top = min(item.pos().y() for item in items)
-    bottom = max(item.pos().y() + item.boundingRect().height() for item in items)
-    center_y = (top + bottom) / 2.0
-    move_list = []
-    for item in items:
-        h = item.boundingRect().height()
-        new_y = center_y - h / 2.0
-        old_x = item.pos().x()
-        old_y = item.pos().y()
-        if old_y != new_y:
-            item.setPos(old_x, new_y)
-            move_list.append(
-                (
-                    item.get_instance_id(),
-                    {'x': old_x, 'y': new_y},
-                    {'x': old_x, 'y': old_y},
-                )
-            )
-    if move_list:
-        command_history_service.add_command(
-            BulkMoveChildCommand(canvas.screen_id, move_list)
-        )
-        widget.refresh_selection_status()
+    _arrange(win, transform_engine.align, 'middle')
 
 
 def distribute_horizontally(win):
-    widget, canvas, items = _get_selected_items(win)
-    if len(items) < 3:
-        return
-    items_sorted = sorted(items, key=lambda it: it.pos().x())
-    left = min(item.pos().x() for item in items_sorted)
-    right = max(item.pos().x() + item.boundingRect().width() for item in items_sorted)
-    total_width = sum(item.boundingRect().width() for item in items_sorted)
-    space = (right - left - total_width) / (len(items_sorted) - 1)
-    current_x = left
-    move_list = []
-    for item in items_sorted:
-        old_x = item.pos().x()
-        old_y = item.pos().y()
-        new_x = current_x
-        current_x += item.boundingRect().width() + space
-        if old_x != new_x:
-            item.setPos(new_x, old_y)
-            move_list.append((
-                item.get_instance_id(),
-                {'x': new_x, 'y': old_y},
-                {'x': old_x, 'y': old_y},
-            ))
-    if move_list:
-        command_history_service.add_command(
-            BulkMoveChildCommand(canvas.screen_id, move_list)
-        )
-        widget.refresh_selection_status()
+    _arrange(win, transform_engine.distribute, 'x')
 
 
 def distribute_vertically(win):
-    widget, canvas, items = _get_selected_items(win)
-    if len(items) < 3:
-        return
-    items_sorted = sorted(items, key=lambda it: it.pos().y())
-    top = min(item.pos().y() for item in items_sorted)
-    bottom = max(item.pos().y() + item.boundingRect().height() for item in items_sorted)
-    total_height = sum(item.boundingRect().height() for item in items_sorted)
-    space = (bottom - top - total_height) / (len(items_sorted) - 1)
-    current_y = top
-    move_list = []
-    for item in items_sorted:
-        old_x = item.pos().x()
-        old_y = item.pos().y()
-        new_y = current_y
-        current_y += item.boundingRect().height() + space
-        if old_y != new_y:
-            item.setPos(old_x, new_y)
-            move_list.append((
-                item.get_instance_id(),
-                {'x': old_x, 'y': new_y},
-                {'x': old_x, 'y': old_y},
-            ))
-    if move_list:
-        command_history_service.add_command(
-            BulkMoveChildCommand(canvas.screen_id, move_list)
-        )
-        widget.refresh_selection_status()
\ No newline at end of file
+    _arrange(win, transform_engine.distribute, 'y')
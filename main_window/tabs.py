@@ -111,6 +111,7 @@ def open_screen_in_tab(win, screen_id):
     screen_widget.selection_changed.connect(lambda p_id, s_data: handlers.update_selection_status(win, s_data))
     
     screen_widget.selection_dragged.connect(lambda pos: handlers.update_drag_position_status(win, pos))
+    screen_widget.selection_geometry_changed.connect(win.docks['properties'].widget().update_selection_geometry)
     screen_widget.mouse_moved_on_scene.connect(lambda pos: handlers.update_mouse_position(win, pos))
     screen_widget.mouse_left_scene.connect(lambda: handlers.clear_mouse_position(win))
     screen_widget.zoom_changed.connect(lambda s: handlers.update_zoom_status(win, s))
@@ -1,6 +1,400 @@
 from __future__ import annotations
 
-class BackgroundTasks:
-    """Stub for timed/triggered background actions in the simulator."""
-    pass
+import ast
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional
 
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .data_manager import DataManager
+from .script_engine import ScriptEngine, compile_expression, restricted_globals
+
+logger = logging.getLogger(__name__)
+
+# Each wheel level has 64 slots; level k slots span 64**k ticks
+_WHEEL_BITS = 6
+_WHEEL_SIZE = 1 << _WHEEL_BITS
+_WHEEL_MASK = _WHEEL_SIZE - 1
+_WHEEL_LEVELS = 4
+
+# Edges a condition trigger can fire on
+_EDGES = ("rising", "falling", "both")
+
+
+@dataclass(slots=True, eq=False)
+class _Timer:
+    callback: Callable[["_Timer"], None]
+    expires: int = 0
+    period: int = 0
+    cancelled: bool = False
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel driven by explicit :meth:`advance` calls.
+
+    Time is counted in ticks of ``resolution_ms``.  Scheduling and
+    cancelling are O(1); timers far in the future sit in coarser levels and
+    cascade down as their expiry approaches.  Periodic timers re-arm from
+    their previous expiry so they do not drift.
+    """
+
+    def __init__(self, resolution_ms: float = 10.0):
+        self.resolution_ms = float(resolution_ms)
+        self._tick = 0
+        self._levels: List[List[List[_Timer]]] = [
+            [[] for _ in range(_WHEEL_SIZE)] for _ in range(_WHEEL_LEVELS)
+        ]
+        self._overflow: List[_Timer] = []
+        self._count = 0
+
+    @property
+    def current_tick(self) -> int:
+        return self._tick
+
+    def __len__(self) -> int:
+        return self._count
+
+    def to_ticks(self, ms: float) -> int:
+        return max(1, int(round(ms / self.resolution_ms)))
+
+    def schedule(self, callback: Callable[[_Timer], None], delay_ms: float, period_ms: float = 0.0) -> _Timer:
+        """Fire ``callback`` after ``delay_ms`` and then every ``period_ms`` (if > 0)."""
+        timer = _Timer(
+            callback,
+            expires=self._tick + self.to_ticks(delay_ms),
+            period=self.to_ticks(period_ms) if period_ms > 0 else 0,
+        )
+        self._insert(timer)
+        self._count += 1
+        return timer
+
+    def cancel(self, timer: _Timer):
+        # Lazily dropped when its slot is reached
+        if not timer.cancelled:
+            timer.cancelled = True
+            self._count -= 1
+
+    def _insert(self, timer: _Timer):
+        for level in range(_WHEEL_LEVELS):
+            shift = _WHEEL_BITS * level
+            # Lowest level whose slot for ``expires`` is within one revolution
+            if (timer.expires >> shift) - (self._tick >> shift) < _WHEEL_SIZE:
+                self._levels[level][(timer.expires >> shift) & _WHEEL_MASK].append(timer)
+                return
+        self._overflow.append(timer)
+
+    def advance_to(self, tick: int) -> int:
+        """Advance the wheel to ``tick``, firing due timers; returns count fired."""
+        fired = 0
+        while self._tick < tick:
+            self._tick += 1
+            t = self._tick
+            for level in range(1, _WHEEL_LEVELS):
+                shift = _WHEEL_BITS * level
+                if t & ((1 << shift) - 1):
+                    break
+                slot = (t >> shift) & _WHEEL_MASK
+                bucket = self._levels[level][slot]
+                if bucket:
+                    self._levels[level][slot] = []
+                    for timer in bucket:
+                        if not timer.cancelled:
+                            self._insert(timer)
+                if level == _WHEEL_LEVELS - 1 and self._overflow:
+                    pending, self._overflow = self._overflow, []
+                    for timer in pending:
+                        if not timer.cancelled:
+                            self._insert(timer)
+            slot = t & _WHEEL_MASK
+            bucket = self._levels[0][slot]
+            if not bucket:
+                continue
+            self._levels[0][slot] = []
+            for timer in bucket:
+                if timer.cancelled:
+                    continue
+                if timer.period:
+                    timer.expires += timer.period
+                    if timer.expires <= t:
+                        # Fell behind (e.g. long stall): skip missed periods
+                        timer.expires = t + timer.period
+                    self._insert(timer)
+                else:
+                    timer.cancelled = True
+                    self._count -= 1
+                timer.callback(timer)
+                fired += 1
+        return fired
+
+
+@dataclass(slots=True)
+class TaskStats:
+    """Execution statistics for one background task."""
+
+    runs: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    errors: int = 0
+    last_error: str = ""
+    last_run_ms: float = 0.0
+
+
+@dataclass(slots=True, eq=False)
+class _Task:
+    task_id: str
+    type: str
+    action: Dict[str, Any]
+    timer: Optional[_Timer] = None
+    condition: Optional[CodeType] = None
+    edge: str = "rising"
+    state: bool = False
+    handles: Dict[str, int] = field(default_factory=dict)
+    stats: TaskStats = field(default_factory=TaskStats)
+
+
+def _read_literals(tree: ast.AST) -> List[str]:
+    """Return tag names passed as string literals to ``read(...)`` calls."""
+    names = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "read"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            names.append(node.args[0].value)
+    return names
+
+
+class BackgroundTasks(QObject):
+    """
+    Timed and tag-triggered background actions for the simulator.
+
+    Task definitions follow the project ``"background"`` section:
+
+    - ``{"type": "interval", "ms": 5000, "action": {...}}``
+    - ``{"type": "trigger", "expr": "read('Temp') > 80", "edge": "rising", "action": {...}}``
+    - ``{"type": "trigger", "tag": "MotorRun", "action": {...}}`` (fires on every change)
+
+    Action kinds: ``set_tag`` (``tag``, ``value``), ``copy_tag``
+    (``source``, ``target``), ``change_screen`` (``screen``), ``hardcopy``
+    (``screen``) and ``run_snippet`` (``code``).
+
+    Interval tasks live in a single :class:`TimerWheel` advanced from the
+    scan clock, so there is no QTimer per task.  Trigger tasks are indexed by
+    the tags they read and only re-evaluated when ``DataManager.tags_changed``
+    reports one of those tags; they fire on the configured edge
+    (``rising``, ``falling`` or ``both``).
+    """
+
+    screen_change_requested = pyqtSignal(str)
+    hardcopy_requested = pyqtSignal(str)
+    task_failed = pyqtSignal(str, str)
+
+    def __init__(
+        self,
+        data_mgr: DataManager,
+        script_engine: Optional[ScriptEngine] = None,
+        resolution_ms: float = 10.0,
+    ):
+        super().__init__()
+        self.data_mgr = data_mgr
+        self.script_engine = script_engine
+        self.wheel = TimerWheel(resolution_ms)
+        self._origin_ms: Optional[float] = None
+        self._tasks: Dict[str, _Task] = {}
+        # Trigger tasks keyed by canonical tag path; dynamic ones run on any change
+        self._triggers_by_tag: Dict[str, List[_Task]] = {}
+        self._dynamic_triggers: List[_Task] = []
+        self._eval_globals = restricted_globals(read=self.data_mgr.get)
+        self._actions: Dict[str, Callable[[_Task], None]] = {
+            "set_tag": self._do_set_tag,
+            "copy_tag": self._do_copy_tag,
+            "change_screen": self._do_change_screen,
+            "hardcopy": self._do_hardcopy,
+            "run_snippet": self._do_run_snippet,
+        }
+        self.data_mgr.tags_changed.connect(self._on_tags_changed)
+
+    # --- Configuration --------------------------------------------------
+    def initialize(self, tasks_def: Optional[List[Dict[str, Any]]]):
+        """Replace all tasks with those from the project ``"background"`` section."""
+        for task_id in list(self._tasks):
+            self.remove_task(task_id)
+        self._origin_ms = None
+        for spec in tasks_def or []:
+            try:
+                self.add_task(spec)
+            except (KeyError, TypeError, ValueError, SyntaxError) as e:
+                logger.warning("Skipping invalid background task %r: %s", spec, e)
+
+    def add_task(self, spec: Dict[str, Any]) -> str:
+        """Register one task definition and return its id.
+
+        Raises ``ValueError`` (or ``SyntaxError``) for invalid definitions.
+        """
+        task_id = str(spec.get("id") or f"task{len(self._tasks) + 1}")
+        while task_id in self._tasks:
+            task_id += "_"
+        action = dict(spec.get("action") or {})
+        if action.get("kind") not in self._actions:
+            raise ValueError(f"Unknown action kind '{action.get('kind')}'")
+        task = _Task(task_id, str(spec.get("type", "interval")), action)
+        self._prepare_action(task)
+
+        if task.type == "interval":
+            period = float(spec.get("ms", 0))
+            if period <= 0:
+                raise ValueError("Interval task requires a positive 'ms'")
+            task.timer = self.wheel.schedule(lambda _t, task=task: self._run(task), period, period)
+        elif task.type == "trigger":
+            expr = spec.get("expr")
+            if expr:
+                task.condition = compile_expression(expr)
+                task.edge = str(spec.get("edge", "rising"))
+                if task.edge not in _EDGES:
+                    raise ValueError(f"Unknown trigger edge '{task.edge}'")
+                deps = _read_literals(ast.parse(expr, mode="eval"))
+                task.state = self._evaluate(task)
+            elif spec.get("tag"):
+                task.edge = "change"
+                deps = [spec["tag"]]
+            else:
+                raise ValueError("Trigger task requires 'expr' or 'tag'")
+            if deps:
+                for name in deps:
+                    path = self.data_mgr.path_of(self.data_mgr.handle(name))
+                    bucket = self._triggers_by_tag.setdefault(path, [])
+                    if task not in bucket:
+                        bucket.append(task)
+            else:
+                self._dynamic_triggers.append(task)
+        else:
+            raise ValueError(f"Unknown task type '{task.type}'")
+
+        self._tasks[task_id] = task
+        return task_id
+
+    def remove_task(self, task_id: str) -> bool:
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return False
+        if task.timer is not None:
+            self.wheel.cancel(task.timer)
+        for path, bucket in list(self._triggers_by_tag.items()):
+            if task in bucket:
+                bucket.remove(task)
+                if not bucket:
+                    del self._triggers_by_tag[path]
+        if task in self._dynamic_triggers:
+            self._dynamic_triggers.remove(task)
+        return True
+
+    def _prepare_action(self, task: _Task):
+        """Resolve tag handles and snippets once so each run is cheap."""
+        action = task.action
+        kind = action["kind"]
+        if kind == "set_tag":
+            task.handles["tag"] = self.data_mgr.handle(action["tag"])
+        elif kind == "copy_tag":
+            task.handles["source"] = self.data_mgr.handle(action["source"])
+            task.handles["target"] = self.data_mgr.handle(action["target"])
+        elif kind == "run_snippet" and self.script_engine is not None:
+            source = action.get("code") or action.get("source") or ""
+            self.script_engine.register(f"background:{task.task_id}", source)
+
+    # --- Scheduling -----------------------------------------------------
+    def advance(self, now_ms: Optional[float] = None) -> int:
+        """Advance interval tasks to ``now_ms`` (monotonic clock by default).
+
+        Returns the number of tasks fired.
+        """
+        if now_ms is None:
+            now_ms = time.monotonic() * 1000.0
+        if self._origin_ms is None:
+            self._origin_ms = now_ms
+            return 0
+        target = int((now_ms - self._origin_ms) / self.wheel.resolution_ms)
+        return self.wheel.advance_to(target)
+
+    def _on_tags_changed(self, changes: Dict[str, Any]):
+        if not self._triggers_by_tag and not self._dynamic_triggers:
+            return
+        # Insertion-ordered set: a task reading several changed tags runs once
+        due: Dict[_Task, None] = {}
+        for path in changes:
+            for task in self._triggers_by_tag.get(path, ()):
+                due[task] = None
+        due.update(dict.fromkeys(self._dynamic_triggers))
+        for task in due:
+            if task.condition is None:
+                self._run(task)
+                continue
+            new_state = self._evaluate(task)
+            old_state, task.state = task.state, new_state
+            if new_state == old_state:
+                continue
+            if task.edge == "both" or (task.edge == "falling") != new_state:
+                self._run(task)
+
+    def _evaluate(self, task: _Task) -> bool:
+        try:
+            return bool(eval(task.condition, self._eval_globals))
+        except Exception as e:
+            self._fail(task, f"Condition error: {e}")
+            return False
+
+    # --- Actions --------------------------------------------------------
+    def _run(self, task: _Task):
+        start = time.perf_counter()
+        try:
+            self._actions[task.action["kind"]](task)
+        except Exception as e:
+            self._fail(task, str(e))
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        st = task.stats
+        st.runs += 1
+        st.total_ms += elapsed_ms
+        st.max_ms = max(st.max_ms, elapsed_ms)
+        st.last_run_ms = self.wheel.current_tick * self.wheel.resolution_ms
+
+    def _fail(self, task: _Task, error: str):
+        task.stats.errors += 1
+        task.stats.last_error = error
+        logger.warning("Background task %s failed: %s", task.task_id, error)
+        self.task_failed.emit(task.task_id, error)
+
+    def _do_set_tag(self, task: _Task):
+        self.data_mgr.set_by_handle(task.handles["tag"], task.action.get("value"))
+
+    def _do_copy_tag(self, task: _Task):
+        value = self.data_mgr.get_by_handle(task.handles["source"])
+        self.data_mgr.set_by_handle(task.handles["target"], value)
+
+    def _do_change_screen(self, task: _Task):
+        self.screen_change_requested.emit(str(task.action.get("screen", "")))
+
+    def _do_hardcopy(self, task: _Task):
+        self.hardcopy_requested.emit(str(task.action.get("screen", "")))
+
+    def _do_run_snippet(self, task: _Task):
+        if self.script_engine is None:
+            raise RuntimeError("No script engine available for run_snippet")
+        self.script_engine.run(f"background:{task.task_id}")
+
+    # --- Introspection --------------------------------------------------
+    def task_ids(self) -> List[str]:
+        return list(self._tasks)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-task statistics keyed by task id."""
+        return {
+            task_id: {**asdict(t.stats), "type": t.type, "kind": t.action["kind"]}
+            for task_id, t in self._tasks.items()
+        }
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from services.tag_data_service import tag_data_service
@@ -21,14 +22,29 @@ class DataManager(QObject):
 
     Provides a signal-based interface to observe tag changes. Intended to be
     expanded with type enforcement, limits, arrays, etc.
+
+    ``tag_changed`` fires once per individual write.  ``tags_changed`` fires
+    with a ``{path: value}`` mapping for every change set: once per plain
+    write and once per committed :meth:`transaction`, which never emits
+    ``tag_changed``.
     """
 
     tag_changed = pyqtSignal(str, object)
+    tags_changed = pyqtSignal(dict)
 
     def __init__(self):
         super().__init__()
         # Local cache keyed by tag path (e.g. "[DB]::Tag") or plain name (legacy)
         self._tags: Dict[str, Tag] = {}
+        # Stable integer handles for canonical tag paths
+        self._handle_paths: List[str] = []
+        self._path_handles: Dict[str, int] = {}
+        # Transaction state: nesting depth, every write, and effective changes
+        self._batch_depth = 0
+        self._pending_writes: Dict[str, Any] = {}
+        self._pending_changes: Dict[str, Any] = {}
+        # Total writes (changed or not), for throughput reporting
+        self.write_count = 0
 
     def initialize(self, tags_def: Dict[str, Any]):
         """Legacy initializer kept for backward compatibility."""
@@ -80,28 +96,101 @@ class DataManager(QObject):
                     return f"[{db_name}]::" + name
         return None
 
+    def _canonical(self, name: str) -> str:
+        """Return the canonical "[DB]::Tag" path for ``name`` when resolvable."""
+        if self._parse_path(name):
+            return name
+        return self._resolve_plain_to_path(name) or name
+
     def get(self, name: str) -> Any:
+        path = self._canonical(name)
+        # Uncommitted writes of an open transaction win
+        if path in self._pending_writes:
+            return self._pending_writes[path]
         # Canonical path lookup uses shared tag_service for resolution
-        parsed = self._parse_path(name)
-        if parsed:
-            return tag_service.get_tag_value(name)
-        # Fallback for legacy plain names (try to resolve to a path)
-        path = self._resolve_plain_to_path(name)
-        if path:
+        if self._parse_path(path):
             return tag_service.get_tag_value(path)
         # Finally, local cache fallback
-        return self._tags.get(name).value if name in self._tags else None
+        return self._tags.get(path).value if path in self._tags else None
+
+    def get_type(self, name: str) -> str:
+        """Return the declared data type of ``name`` (``"any"`` if unknown)."""
+        t = self._tags.get(self._canonical(name))
+        return t.type if t else "any"
 
     def set(self, name: str, value: Any):
-        # Normalize to canonical path when possible
-        path = name
-        if not self._parse_path(name):
-            maybe = self._resolve_plain_to_path(name)
-            if maybe:
-                path = maybe
+        self._write(self._canonical(name), value)
 
-        # Update shared tag service (emits its own signal, but we keep our simple one)
-        tag_service.set_tag_value(path, value)
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a plain ``{path: value}`` copy of every known tag."""
+        values = {path: t.value for path, t in self._tags.items()}
+        values.update(self._pending_writes)
+        return values
+
+    # --- Handles ----------------------------------------------------------
+    def handle(self, name: str) -> int:
+        """Return a stable integer handle for ``name``.
+
+        Handles index a flat list of canonical paths so hot paths (recipes,
+        scripts, scan loops) can skip name resolution on every access.
+        """
+        path = self._canonical(name)
+        h = self._path_handles.get(path)
+        if h is None:
+            h = len(self._handle_paths)
+            self._handle_paths.append(path)
+            self._path_handles[path] = h
+        return h
+
+    def path_of(self, handle: int) -> str:
+        """Return the canonical tag path for ``handle``."""
+        return self._handle_paths[handle]
+
+    def get_by_handle(self, handle: int) -> Any:
+        path = self._handle_paths[handle]
+        if path in self._pending_writes:
+            return self._pending_writes[path]
+        if self._parse_path(path):
+            return tag_service.get_tag_value(path)
+        return self._tags.get(path).value if path in self._tags else None
+
+    def set_by_handle(self, handle: int, value: Any):
+        self._write(self._handle_paths[handle], value)
+
+    # --- Transactions -----------------------------------------------------
+    @contextmanager
+    def transaction(self) -> Iterator["DataManager"]:
+        """Batch writes into a single change notification.
+
+        Writes made inside the block update the underlying tag data
+        immediately, but ``tag_service`` and ``tags_changed`` are notified
+        once, with all values, when the outermost block exits.  Nested
+        transactions join the enclosing one.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._commit()
+
+    def _commit(self):
+        writes, changes = self._pending_writes, self._pending_changes
+        self._pending_writes = {}
+        self._pending_changes = {}
+        if writes:
+            tag_service.update_tag_values(writes)
+        if changes:
+            self.tags_changed.emit(changes)
+
+    def _write(self, path: str, value: Any):
+        self.write_count += 1
+        if not self._batch_depth:
+            # Update shared tag service (emits its own signal, but we keep our simple one)
+            tag_service.set_tag_value(path, value)
+        else:
+            self._pending_writes[path] = value
 
         # Update underlying tag_data_service value if we can parse the path
         parsed = self._parse_path(path)
@@ -120,4 +209,8 @@ class DataManager(QObject):
         if t.value != value:
             t.value = value
             self._tags[path] = t
-            self.tag_changed.emit(path, value)
+            if self._batch_depth:
+                self._pending_changes[path] = value
+            else:
+                self.tag_changed.emit(path, value)
+                self.tags_changed.emit({path: value})
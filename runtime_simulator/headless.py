@@ -0,0 +1,191 @@
+"""
+Headless runtime for load and regression testing.
+
+Loads a project through the shared services, builds the runtime objects
+without any window, and runs the scan cycle as fast as possible on a
+synthetic clock (``tick * scan_ms``), so runs are repeatable.
+
+Input sequences are JSON lists of steps applied at the start of a tick::
+
+    [{"tick": 0, "tag": "MotorRun", "value": true},
+     {"tick": 50, "screen": "Main"}]
+
+Every tag change is recorded as ``[tick, tag_path, value]``; the trace can
+be written out and compared against a golden file.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from utils import constants
+
+from .background_tasks import BackgroundTasks
+from .data_manager import DataManager
+from .recipe_manager import RecipeManager
+from .screens import ScreenRuntime
+from .script_engine import ScriptEngine
+from .widgets.button_runtime import ButtonRuntimeController
+from services.screen_data_service import screen_service
+from services.serialization import load_from_file
+
+
+@dataclass(slots=True)
+class HeadlessReport:
+    ticks: int
+    seconds: float
+    tag_writes: int
+    tag_changes: int
+    style_evaluations: int
+
+    def rate(self, count: int) -> float:
+        return count / self.seconds if self.seconds > 0 else float("inf")
+
+    def format(self) -> str:
+        return (
+            f"ticks: {self.ticks} in {self.seconds:.3f} s ({self.rate(self.ticks):,.0f} ticks/s)\n"
+            f"tag writes: {self.tag_writes} ({self.rate(self.tag_writes):,.0f}/s), "
+            f"changes: {self.tag_changes}\n"
+            f"style evaluations: {self.style_evaluations} "
+            f"({self.rate(self.style_evaluations):,.0f}/s)"
+        )
+
+
+class HeadlessRunner:
+    """Drive the simulator runtime without a GUI."""
+
+    def __init__(self, project_path: str, scan_ms: float = 100.0):
+        self.scan_ms = scan_ms
+        self.project: Dict[str, Any] = load_from_file(project_path)
+        self.data_mgr = DataManager()
+        self.data_mgr.initialize_from_services()
+        self.screen_rt = ScreenRuntime(self.data_mgr)
+        self.screen_rt.initialize(screen_service.get_all_screens())
+        self.recipe_mgr = RecipeManager(self.data_mgr)
+        self.recipe_mgr.initialize(self.project.get("recipes"))
+        self.script_engine = ScriptEngine(self.data_mgr)
+        self.script_engine.load(self.project)
+        self.bg_tasks = BackgroundTasks(self.data_mgr, self.script_engine)
+        self.bg_tasks.initialize(self.project.get("background"))
+        self.script_engine.screen_change_requested.connect(self._change_screen)
+        self.bg_tasks.screen_change_requested.connect(self._change_screen)
+
+        # Style plans for every button; evaluated whenever their tags change
+        self.controllers: List[ButtonRuntimeController] = []
+        for screen in (self.project.get("screens") or {}).values():
+            for child in screen.get("children", []) or []:
+                if child.get("tool_type") == constants.ToolType.BUTTON:
+                    self.controllers.append(ButtonRuntimeController(self.data_mgr, child))
+
+        self.trace: List[List[Any]] = []
+        self.tick = 0
+        self.tag_changes = 0
+        # Every coalesced change is recorded in the trace
+        self.data_mgr.tags_changed.connect(self._on_tags_changed)
+
+    def _on_tags_changed(self, changes: Dict[str, Any]):
+        self.tag_changes += len(changes)
+        for path, value in changes.items():
+            self.trace.append([self.tick, path, value])
+
+    def style_evaluations(self) -> int:
+        """Total style evaluations the controllers have performed."""
+        return sum(ctrl.style_evaluations for ctrl in self.controllers)
+
+    def _change_screen(self, ref: str):
+        sid = self.screen_rt.change_screen(ref)
+        if sid is not None:
+            self.script_engine.open_screen(sid)
+
+    def run(self, ticks: int, inputs: Optional[List[Dict[str, Any]]] = None) -> HeadlessReport:
+        steps: Dict[int, List[Dict[str, Any]]] = {}
+        for step in inputs or []:
+            steps.setdefault(int(step.get("tick", 0)), []).append(step)
+        if inputs:
+            ticks = max(ticks, max(steps) + 1)
+
+        writes_before = self.data_mgr.write_count
+        evaluations_before = self.style_evaluations()
+        start = time.perf_counter()
+        self.script_engine.start()
+        ids = self.screen_rt.get_screen_ids()
+        if ids:
+            self._change_screen(ids[0])
+        self.bg_tasks.advance(0.0)
+        for tick in range(ticks):
+            self.tick = tick
+            for step in steps.get(tick, ()):
+                if "tag" in step:
+                    self.data_mgr.set(step["tag"], step.get("value"))
+                if "screen" in step:
+                    self._change_screen(step["screen"])
+            self.script_engine.tick()
+            self.bg_tasks.advance((tick + 1) * self.scan_ms)
+        self.script_engine.stop()
+        elapsed = time.perf_counter() - start
+
+        return HeadlessReport(
+            ticks=ticks,
+            seconds=elapsed,
+            tag_writes=self.data_mgr.write_count - writes_before,
+            tag_changes=self.tag_changes,
+            style_evaluations=self.style_evaluations() - evaluations_before,
+        )
+
+    def normalized_trace(self) -> List[List[Any]]:
+        """Return the trace as it round-trips through JSON."""
+        return json.loads(json.dumps(self.trace, default=str))
+
+
+def compare_traces(actual: List[List[Any]], expected: List[List[Any]]) -> Optional[str]:
+    """Return a description of the first difference, or ``None`` if equal."""
+    for i, (a, e) in enumerate(zip(actual, expected)):
+        if a != e:
+            return f"entry {i}: expected {e}, got {a}"
+    if len(actual) != len(expected):
+        return f"length differs: expected {len(expected)} entries, got {len(actual)}"
+    return None
+
+
+def run_headless(
+    project_path: str,
+    ticks: int = 1000,
+    scan_ms: float = 100.0,
+    inputs_path: Optional[str] = None,
+    trace_out: Optional[str] = None,
+    golden_path: Optional[str] = None,
+) -> int:
+    """CLI entry for ``--headless``; returns a process exit code."""
+    # A core application satisfies QObject-based services without a display
+    from PyQt6.QtCore import QCoreApplication
+
+    _app = QCoreApplication.instance() or QCoreApplication([])
+
+    try:
+        runner = HeadlessRunner(project_path, scan_ms=scan_ms)
+        inputs = None
+        if inputs_path:
+            with open(inputs_path, "r", encoding="utf-8") as f:
+                inputs = json.load(f)
+    except Exception as e:
+        print(f"[runtime] Could not load project: {e}")
+        return 3
+
+    report = runner.run(ticks, inputs)
+    print(report.format())
+
+    trace = runner.normalized_trace()
+    if trace_out:
+        with open(trace_out, "w", encoding="utf-8") as f:
+            json.dump(trace, f, indent=1)
+    if golden_path:
+        with open(golden_path, "r", encoding="utf-8") as f:
+            diff = compare_traces(trace, json.load(f))
+        if diff:
+            print(f"trace mismatch: {diff}")
+            return 1
+        print("trace matches golden file")
+    return 0
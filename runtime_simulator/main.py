@@ -8,6 +8,9 @@ Usage examples:
 
 If no project file is supplied, the simulator opens a file
 dialog to select one, then starts the Qt event loop.
+
+With ``--headless`` no window is created: the scan cycle runs for
+``--ticks`` cycles and throughput is printed (see ``headless.py``).
 """
 
 from __future__ import annotations
@@ -23,6 +26,7 @@ from PyQt6.QtWidgets import QApplication, QFileDialog, QMessageBox
 try:
     # Executed as a module: python -m runtime_simulator.main
     from .simulator import SimulatorWindow  # type: ignore
+    from .headless import run_headless  # type: ignore
 except ImportError:
     # Executed as a file: python runtime_simulator/main.py
     # Ensure the repo root (parent of this dir) is on sys.path
@@ -31,6 +35,7 @@ except ImportError:
     if _ROOT not in sys.path:
         sys.path.insert(0, _ROOT)
     from runtime_simulator.simulator import SimulatorWindow  # type: ignore
+    from runtime_simulator.headless import run_headless  # type: ignore
 
 
 def _resolve_project_path(arg: Optional[str]) -> Optional[str]:
@@ -53,10 +58,6 @@ def main(argv: list[str] | None = None) -> int:
     # Prepare argv for Qt and argparse
     raw_argv = list(sys.argv if argv is None else argv)
 
-    # Create the Qt application up-front so we can show dialogs if needed
-    app = QApplication(raw_argv)
-    app.setStyle("Fusion")
-
     # CLI parsing
     parser = argparse.ArgumentParser(
         prog="hmi-sim",
@@ -74,9 +75,46 @@ def main(argv: list[str] | None = None) -> int:
         help="Path to the .hmi project file (JSON)",
     )
 
+    parser.add_argument(
+        "--remote-view",
+        dest="remote_port",
+        type=int,
+        metavar="PORT",
+        help="Serve a mirror viewer on http://127.0.0.1:PORT/ (0 picks a free port)",
+    )
+
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run the scan cycle without a GUI and print throughput",
+    )
+    parser.add_argument("--ticks", type=int, default=1000, help="Headless: scan cycles to run")
+    parser.add_argument("--scan-ms", type=float, default=100.0, help="Headless: simulated scan period")
+    parser.add_argument("--inputs", help="Headless: JSON input sequence to replay")
+    parser.add_argument("--trace-out", help="Headless: write the tag trace to this JSON file")
+    parser.add_argument("--golden", help="Headless: compare the tag trace against this JSON file")
+
     args = parser.parse_args(raw_argv[1:])
     arg_path = args.project_opt or args.project
 
+    if args.headless:
+        # No QApplication and never a file dialog in headless mode
+        if not arg_path or not os.path.exists(arg_path):
+            print(f"[runtime] Project file not found: {arg_path}", file=sys.stderr)
+            return 2
+        return run_headless(
+            arg_path,
+            ticks=args.ticks,
+            scan_ms=args.scan_ms,
+            inputs_path=args.inputs,
+            trace_out=args.trace_out,
+            golden_path=args.golden,
+        )
+
+    # Create the Qt application up-front so we can show dialogs if needed
+    app = QApplication(raw_argv)
+    app.setStyle("Fusion")
+
     # Resolve project file (argument or file dialog)
     project_path = _resolve_project_path(arg_path)
     if not project_path:
@@ -85,7 +123,7 @@ def main(argv: list[str] | None = None) -> int:
 
     # Construct the simulator window (it loads project via shared services)
     try:
-        win = SimulatorWindow(project_path)
+        win = SimulatorWindow(project_path, remote_port=args.remote_port)
     except Exception as e:
         QMessageBox.critical(None, "Invalid Project", f"Could not load project:\n{e}")
         return 3
@@ -1,6 +1,159 @@
 from __future__ import annotations
 
-class RecipeManager:
-    """Stub for future recipe handling in the simulator."""
-    pass
+from typing import Any, Dict, List, Optional
 
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from services.csv_service import csv_service
+
+from .data_manager import DataManager
+
+
+class RecipeManager(QObject):
+    """
+    Named sets of tag values that can be applied at runtime.
+
+    Recipes are kept as one table: one row per tag handle and one column
+    per recipe.  A ``None`` cell means the tag is not part of that recipe.
+    Applying a recipe writes its column through a single
+    :meth:`DataManager.transaction`, so listeners receive one coalesced
+    ``tags_changed`` notification instead of one per tag.
+    """
+
+    recipes_changed = pyqtSignal()
+    recipe_applied = pyqtSignal(str)
+
+    def __init__(self, data_mgr: DataManager):
+        super().__init__()
+        self.data_mgr = data_mgr
+        self._rows: List[int] = []  # tag handles
+        self._row_index: Dict[int, int] = {}  # handle -> row
+        self._names: List[str] = []
+        self._name_index: Dict[str, int] = {}  # recipe name -> column
+        self._columns: List[List[Any]] = []
+
+    def initialize(self, recipes_def: Optional[Dict[str, Any]]):
+        """Load recipes from the project ``"recipes"`` section.
+
+        Accepts the documented layout
+        ``{group: {"fields": [...], "records": [{"name": ..., field: value}]}}``.
+        Each record becomes one recipe named after its ``name``.
+        """
+        self._clear()
+        for group in (recipes_def or {}).values():
+            fields = group.get("fields", []) or []
+            for record in group.get("records", []) or []:
+                name = record.get("name")
+                if not name:
+                    continue
+                self._set_column(name, {f: record[f] for f in fields if f in record})
+        self.recipes_changed.emit()
+
+    def _clear(self):
+        self._rows.clear()
+        self._row_index.clear()
+        self._names.clear()
+        self._name_index.clear()
+        self._columns.clear()
+
+    # --- Table helpers --------------------------------------------------
+    def _row_for(self, tag: str) -> int:
+        handle = self.data_mgr.handle(tag)
+        row = self._row_index.get(handle)
+        if row is None:
+            row = len(self._rows)
+            self._rows.append(handle)
+            self._row_index[handle] = row
+            for col in self._columns:
+                col.append(None)
+        return row
+
+    def _set_column(self, name: str, values: Dict[str, Any]):
+        rows = [(self._row_for(tag), value) for tag, value in values.items()]
+        col = [None] * len(self._rows)
+        for row, value in rows:
+            col[row] = value
+        idx = self._name_index.get(name)
+        if idx is None:
+            self._name_index[name] = len(self._names)
+            self._names.append(name)
+            self._columns.append(col)
+        else:
+            self._columns[idx] = col
+
+    # --- CRUD -----------------------------------------------------------
+    def recipe_names(self) -> List[str]:
+        return list(self._names)
+
+    def get_recipe(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return ``{tag_path: value}`` for the recipe, or ``None``."""
+        idx = self._name_index.get(name)
+        if idx is None:
+            return None
+        col = self._columns[idx]
+        return {
+            self.data_mgr.path_of(handle): col[row]
+            for row, handle in enumerate(self._rows)
+            if col[row] is not None
+        }
+
+    def set_recipe(self, name: str, values: Dict[str, Any]):
+        """Create or replace the recipe ``name`` with ``{tag: value}``."""
+        self._set_column(name, values)
+        self.recipes_changed.emit()
+
+    def capture_recipe(self, name: str, tags: List[str]):
+        """Create or replace ``name`` from the current values of ``tags``."""
+        self.set_recipe(name, {tag: self.data_mgr.get(tag) for tag in tags})
+
+    def remove_recipe(self, name: str) -> bool:
+        idx = self._name_index.pop(name, None)
+        if idx is None:
+            return False
+        del self._names[idx]
+        del self._columns[idx]
+        for i, n in enumerate(self._names[idx:], start=idx):
+            self._name_index[n] = i
+        self.recipes_changed.emit()
+        return True
+
+    # --- Runtime --------------------------------------------------------
+    def apply_recipe(self, name: str) -> int:
+        """Write every value of ``name`` in one transaction.
+
+        Returns the number of tags written (0 if the recipe is unknown).
+        """
+        idx = self._name_index.get(name)
+        if idx is None:
+            return 0
+        col = self._columns[idx]
+        count = 0
+        with self.data_mgr.transaction():
+            for handle, value in zip(self._rows, col):
+                if value is None:
+                    continue
+                self.data_mgr.set_by_handle(handle, value)
+                count += 1
+        self.recipe_applied.emit(name)
+        return count
+
+    # --- CSV ------------------------------------------------------------
+    def export_csv(self, file_path: str) -> bool:
+        tags = [
+            (self.data_mgr.path_of(h), self.data_mgr.get_type(self.data_mgr.path_of(h)))
+            for h in self._rows
+        ]
+        return csv_service.export_recipes_to_csv(file_path, tags, self._names, self._columns)
+
+    def import_csv(self, file_path: str):
+        """Merge recipes from a CSV file, replacing recipes with the same name.
+
+        Raises ``ValueError`` if the file cannot be parsed.
+        """
+        tags, names, columns = csv_service.import_recipes_from_csv(file_path)
+        for name, col in zip(names, columns):
+            self._set_column(
+                name,
+                {tag: value for (tag, _), value in zip(tags, col) if value is not None},
+            )
+        self.recipes_changed.emit()
@@ -1,6 +1,418 @@
 from __future__ import annotations
 
-class RemoteView:
-    """Stub for optional remote/mirror viewer window."""
-    pass
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import struct
+import threading
+import zlib
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlsplit
 
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from .data_manager import DataManager
+from .screens import ScreenRuntime
+
+logger = logging.getLogger(__name__)
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_OP_TEXT = 0x1
+_OP_BINARY = 0x2
+_OP_CLOSE = 0x8
+_OP_PING = 0x9
+_OP_PONG = 0xA
+
+# WebSocket handshakes are only accepted from pages served by these hosts
+# (plus the bound host), so other web pages cannot read live tag values
+_LOCAL_HOSTS = frozenset(("localhost", "127.0.0.1", "::1"))
+
+# Clients whose unsent backlog exceeds this are dropped (they can reconnect)
+_MAX_CLIENT_BACKLOG = 4 * 1024 * 1024
+
+_VIEWER_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>HMI Remote View</title>
+<style>
+body{margin:0;background:#1e1e1e;color:#ddd;font-family:sans-serif}
+#screen{position:relative;transform-origin:0 0;background:#2b2b2b}
+.item{position:absolute;box-sizing:border-box;display:flex;align-items:center;
+justify-content:center;overflow:hidden;border:1px solid #555;background:#5a6270;color:#fff}
+#status{position:fixed;right:8px;bottom:4px;font-size:12px;opacity:.7}
+</style></head><body>
+<div id="screen"></div><div id="status">connecting...</div>
+<script>
+const screen = document.getElementById('screen'), status = document.getElementById('status');
+const tags = {}, items = {};
+function geometry(c){
+  const p = c.properties || {};
+  const pos = c.position || p.position || {}, size = c.size || p.size || {};
+  return [pos.x||0, pos.y||0, size.width||100, size.height||40];
+}
+function applyStyle(id, s){
+  const el = items[id]; if(!el) return;
+  if(s.background_color) el.style.background = s.background_color;
+  if(s.text_color) el.style.color = s.text_color;
+  if(s.border_color) el.style.borderColor = s.border_color;
+  const t = s.text_value !== undefined ? s.text_value : s.label;
+  if(t !== undefined) el.textContent = t;
+}
+function showScreen(scr){
+  screen.innerHTML = ''; for(const k in items) delete items[k];
+  if(!scr) return;
+  const sz = scr.size || {width:1920, height:1080};
+  screen.style.width = sz.width + 'px'; screen.style.height = sz.height + 'px';
+  screen.style.transform = 'scale(' + Math.min(innerWidth/sz.width, innerHeight/sz.height) + ')';
+  for(const c of scr.children || []){
+    const [x,y,w,h] = geometry(c), el = document.createElement('div');
+    el.className = 'item';
+    Object.assign(el.style, {left:x+'px', top:y+'px', width:w+'px', height:h+'px'});
+    items[c.instance_id] = el; screen.appendChild(el);
+    applyStyle(c.instance_id, c.properties || {});
+  }
+}
+function handle(m){
+  if(m.screen !== undefined) showScreen(m.screen);
+  Object.assign(tags, m.tags || {});
+  for(const id in m.styles || {}) applyStyle(id, m.styles[id]);
+  status.textContent = Object.keys(tags).length + ' tags';
+}
+async function decode(data){
+  if(typeof data === 'string') return JSON.parse(data);
+  const stream = data.stream().pipeThrough(new DecompressionStream('deflate'));
+  return JSON.parse(await new Response(stream).text());
+}
+let queue = Promise.resolve();
+function connect(){
+  const ws = new WebSocket('ws://' + location.host + '/ws');
+  ws.onmessage = e => { queue = queue.then(() => decode(e.data)).then(handle); };
+  ws.onopen = () => status.textContent = 'connected';
+  ws.onclose = () => { status.textContent = 'disconnected'; setTimeout(connect, 1000); };
+}
+connect();
+</script></body></html>
+"""
+
+
+def _encode_frame(payload: bytes, opcode: int) -> bytes:
+    """Build an unmasked server-to-client WebSocket frame."""
+    n = len(payload)
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return header + payload
+
+
+async def _read_frame(reader: asyncio.StreamReader):
+    """Read one (masked) client frame; returns ``(opcode, payload)``."""
+    b0, b1 = await reader.readexactly(2)
+    n = b1 & 0x7F
+    if n == 126:
+        (n,) = struct.unpack("!H", await reader.readexactly(2))
+    elif n == 127:
+        (n,) = struct.unpack("!Q", await reader.readexactly(8))
+    mask = await reader.readexactly(4) if b1 & 0x80 else b"\0\0\0\0"
+    data = await reader.readexactly(n)
+    if b1 & 0x80:
+        data = bytes(c ^ mask[i & 3] for i, c in enumerate(data))
+    return b0 & 0x0F, data
+
+
+class _MirrorServer:
+    """Minimal asyncio HTTP/WebSocket server; all methods run on its loop.
+
+    Frames are encoded once by the caller and written unchanged to every
+    client, so extra clients only add socket writes.
+    """
+
+    def __init__(self, on_join, on_leave, allowed_hosts=_LOCAL_HOSTS):
+        self._on_join = on_join
+        self._on_leave = on_leave
+        self._allowed_hosts = frozenset(allowed_hosts)
+        self.clients: Set[asyncio.StreamWriter] = set()
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str, port: int) -> int:
+        self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        for writer in list(self.clients):
+            writer.close()
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    def activate(self, writer: asyncio.StreamWriter, frame: bytes):
+        """Send the snapshot ``frame`` and start broadcasting to ``writer``."""
+        if writer.is_closing():
+            return
+        writer.write(frame)
+        self.clients.add(writer)
+
+    def broadcast(self, frame: bytes):
+        for writer in list(self.clients):
+            if writer.is_closing() or writer.transport.get_write_buffer_size() > _MAX_CLIENT_BACKLOG:
+                self.clients.discard(writer)
+                writer.close()
+                continue
+            writer.write(frame)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.close()
+            return
+        lines = request.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in lines[1:]:
+            key, sep, value = line.partition(":")
+            if sep:
+                headers[key.strip().lower()] = value.strip()
+
+        if headers.get("upgrade", "").lower() != "websocket":
+            body = _VIEWER_HTML.encode("utf-8")
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+            writer.close()
+            return
+
+        origin = headers.get("origin")
+        if origin is not None and (urlsplit(origin).hostname or "") not in self._allowed_hosts:
+            # Browsers always send Origin; non-browser clients may omit it
+            logger.warning("Remote view: rejected WebSocket from origin %s", origin)
+            writer.write(b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            writer.close()
+            return
+
+        accept = base64.b64encode(
+            hashlib.sha1((headers.get("sec-websocket-key", "") + _WS_GUID).encode()).digest()
+        ).decode()
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                f"Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode()
+        )
+        self._on_join(writer)
+        try:
+            while True:
+                opcode, data = await _read_frame(reader)
+                if opcode == _OP_CLOSE:
+                    writer.write(_encode_frame(data[:2], _OP_CLOSE))
+                    break
+                if opcode == _OP_PING:
+                    writer.write(_encode_frame(data, _OP_PONG))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+            self._on_leave(writer)
+
+
+class RemoteView(QObject):
+    """
+    Mirror viewer served over a local WebSocket.
+
+    ``start()`` serves a minimal HTML viewer at ``http://host:port/`` whose
+    WebSocket (``/ws``) receives one snapshot of the active screen, its
+    buttons' current styles and all tag values, then only deltas:
+    ``{"tags": {...}, "styles": {...}}`` batched per frame (``frame_ms``).
+    Button styles are fed in through :meth:`notify_style`.  With
+    ``compress`` every message is sent as a zlib-compressed binary frame.
+    WebSocket handshakes from pages on other origins than localhost (or
+    ``host``) are refused.
+
+    Each batch is serialized and framed once on the GUI thread and the same
+    bytes are written to every client by the server thread, so the cost
+    of additional clients is a socket write each.
+    """
+
+    clients_changed = pyqtSignal(int)
+    # Internal: emitted from the server thread, delivered on the GUI thread
+    _client_joined = pyqtSignal(object)
+    _client_left = pyqtSignal(object)
+
+    def __init__(
+        self,
+        data_mgr: DataManager,
+        screen_rt: ScreenRuntime,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        frame_ms: int = 33,
+        compress: bool = False,
+    ):
+        super().__init__()
+        self.data_mgr = data_mgr
+        self.screen_rt = screen_rt
+        self.host = host
+        self.port = port
+        self.compress = compress
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[_MirrorServer] = None
+        self._joining: List[Any] = []
+        self._client_count = 0
+        self._pending_tags: Dict[str, Any] = {}
+        self._pending_styles: Dict[str, Dict[str, Any]] = {}
+        self._pending_screen = False
+        # Current runtime style per instance, sent whole with each screen
+        self._styles: Dict[str, Dict[str, Any]] = {}
+        # Last style sent per instance, so only changed keys go on the wire
+        self._sent_styles: Dict[str, Dict[str, Any]] = {}
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(frame_ms)
+        self._flush_timer.timeout.connect(self._flush)
+
+        self._client_joined.connect(self._on_client_joined)
+        self._client_left.connect(self._on_client_left)
+        self.data_mgr.tags_changed.connect(self._on_tags_changed)
+
+    # --- Lifecycle ------------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def client_count(self) -> int:
+        return self._client_count
+
+    def start(self) -> int:
+        """Start serving in a background thread; returns the bound port.
+
+        Raises ``OSError`` if the port cannot be bound.
+        """
+        if self._thread is not None:
+            return self.port
+        loop = asyncio.new_event_loop()
+        allowed = _LOCAL_HOSTS
+        if self.host not in ("", "0.0.0.0", "::"):
+            allowed = allowed | {self.host}
+        server = _MirrorServer(self._client_joined.emit, self._client_left.emit, allowed)
+        try:
+            self.port = loop.run_until_complete(server.start(self.host, self.port))
+        except OSError:
+            loop.close()
+            raise
+        self._loop, self._server = loop, server
+        self._thread = threading.Thread(target=loop.run_forever, name="RemoteView", daemon=True)
+        self._thread.start()
+        logger.info("Remote view serving on http://%s:%d/", self.host, self.port)
+        return self.port
+
+    def stop(self):
+        if self._thread is None:
+            return
+        loop, server, thread = self._loop, self._server, self._thread
+        self._loop = self._server = self._thread = None
+        try:
+            asyncio.run_coroutine_threadsafe(server.close(), loop).result(timeout=2)
+        except (FutureTimeoutError, TimeoutError):
+            logger.warning("Remote view: server did not close within 2 s")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=2)
+        if thread.is_alive():
+            # A running loop cannot be closed; the daemon thread ends with the app
+            logger.warning("Remote view: server thread did not stop within 2 s")
+        else:
+            loop.close()
+        self._joining.clear()
+        self._client_count = 0
+        self.clients_changed.emit(0)
+
+    # --- Change feeds ---------------------------------------------------
+    def screen_changed(self):
+        """Resend the active screen to all clients on the next frame."""
+        self._pending_screen = True
+        self._schedule()
+
+    def notify_style(self, instance_id: str, props: Dict[str, Any]):
+        """Queue the runtime style of ``instance_id`` (only changed keys are sent)."""
+        self._styles[instance_id] = props
+        if not self._client_count:
+            return
+        sent = self._sent_styles.setdefault(instance_id, {})
+        diff = {k: v for k, v in props.items() if sent.get(k, object()) != v}
+        if not diff:
+            return
+        sent.update(diff)
+        self._pending_styles.setdefault(instance_id, {}).update(diff)
+        self._schedule()
+
+    def _on_tags_changed(self, changes: Dict[str, Any]):
+        if not self._client_count:
+            return
+        self._pending_tags.update(changes)
+        self._schedule()
+
+    def _on_client_joined(self, writer):
+        self._joining.append(writer)
+        self._client_count += 1
+        self.clients_changed.emit(self._client_count)
+        self._schedule()
+
+    def _on_client_left(self, writer):
+        if writer in self._joining:
+            self._joining.remove(writer)
+        self._client_count = max(0, self._client_count - 1)
+        if not self._client_count:
+            self._sent_styles.clear()
+        self.clients_changed.emit(self._client_count)
+
+    # --- Sending --------------------------------------------------------
+    def _schedule(self):
+        if self._loop is not None and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _frame(self, message: Dict[str, Any]) -> bytes:
+        data = json.dumps(message, separators=(",", ":"), default=str).encode("utf-8")
+        if self.compress:
+            return _encode_frame(zlib.compress(data), _OP_BINARY)
+        return _encode_frame(data, _OP_TEXT)
+
+    def _screen_message(self) -> Dict[str, Any]:
+        sid = self.screen_rt.active_screen_id
+        screen = self.screen_rt.get_screen(sid) if sid else None
+        styles = {}
+        for child in (screen or {}).get("children", []) or []:
+            props = self._styles.get(child.get("instance_id"))
+            if props is not None:
+                styles[child["instance_id"]] = props
+        return {"screen": screen, "styles": styles}
+
+    def _flush(self):
+        loop, server = self._loop, self._server
+        if loop is None:
+            return
+        if self._joining:
+            snapshot = self._frame({**self._screen_message(), "tags": self.data_mgr.snapshot()})
+            for writer in self._joining:
+                loop.call_soon_threadsafe(server.activate, writer, snapshot)
+            self._joining.clear()
+
+        message: Dict[str, Any] = {}
+        if self._pending_screen:
+            message.update(self._screen_message())
+            self._sent_styles.clear()
+        if self._pending_tags:
+            message["tags"] = self._pending_tags
+        if self._pending_styles:
+            message["styles"] = {**message.get("styles", {}), **self._pending_styles}
+        self._pending_screen = False
+        self._pending_tags = {}
+        self._pending_styles = {}
+        if message:
+            loop.call_soon_threadsafe(server.broadcast, self._frame(message))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .data_manager import DataManager
 
@@ -15,10 +15,30 @@ class ScreenRuntime:
     def __init__(self, data_mgr: DataManager):
         self.data_mgr = data_mgr
         self._screens: Dict[str, Dict[str, Any]] = {}
+        self.active_screen_id: Optional[str] = None
 
     def initialize(self, screens: Dict[str, Any]):
         self._screens = screens or {}
+        self.active_screen_id = None
 
     def get_screen_ids(self):
         return list(self._screens.keys())
 
+    def get_screen(self, screen_id: str) -> Optional[Dict[str, Any]]:
+        return self._screens.get(screen_id)
+
+    def resolve(self, ref: Any) -> Optional[str]:
+        """Resolve a screen reference (id, name or number) to a screen id."""
+        if ref in self._screens:
+            return ref
+        for sid, screen in self._screens.items():
+            if screen.get("name") == ref or str(screen.get("number")) == str(ref):
+                return sid
+        return None
+
+    def change_screen(self, ref: Any) -> Optional[str]:
+        """Make the referenced screen active; returns its id or ``None``."""
+        sid = self.resolve(ref)
+        if sid is not None:
+            self.active_screen_id = sid
+        return sid
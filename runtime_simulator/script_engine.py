@@ -1,6 +1,493 @@
 from __future__ import annotations
 
-class ScriptEngine:
-    """Stub for runtime script execution (project/screen/object)."""
-    pass
+import ast
+import builtins
+import hashlib
+import logging
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .data_manager import DataManager
+
+logger = logging.getLogger(__name__)
+
+_CODE_CACHE: "OrderedDict[str, CodeType]" = OrderedDict()
+_CODE_CACHE_MAXSIZE = 256
+
+# Compiled scripts get a recognizable filename so the time-limit tracer
+# only instruments script frames, never the helper API or Qt internals.
+_FILENAME_PREFIX = "<hmi-script:"
+
+_SAFE_BUILTINS: Dict[str, Any] = {
+    name: getattr(builtins, name)
+    for name in (
+        "abs", "all", "any", "bool", "dict", "divmod", "enumerate", "float",
+        "int", "isinstance", "len", "list", "max", "min", "pow", "range",
+        "reversed", "round", "set", "sorted", "str", "sum", "tuple", "zip",
+        "Exception", "ArithmeticError", "IndexError", "KeyError",
+        "TypeError", "ValueError", "ZeroDivisionError",
+    )
+}
+
+
+# Attributes a script may access: the public methods and properties of the
+# value types scripts handle, plus ``args`` of caught exceptions.  Anything
+# else (frame, generator, code or function internals) is rejected.
+# ``str.format``/``format_map`` are left out because format fields resolve
+# attributes themselves (``"{0.gi_frame}".format(g)``).
+_ALLOWED_ATTRIBUTES = frozenset(
+    name
+    for tp in (bool, int, float, complex, str, bytes, list, tuple, dict, set, frozenset, range)
+    for name in dir(tp)
+    if not name.startswith("_")
+) - {"format", "format_map"} | {"args"}
+
+
+class ScriptTimeout(BaseException):
+    """Raised inside a script that exceeds its hard time limit.
+
+    Derives from ``BaseException`` so ``except Exception`` in a script
+    cannot swallow it.
+    """
+
+
+class _ScriptValidator(ast.NodeVisitor):
+    """Reject constructs that could escape the restricted namespace.
+
+    Attribute access is limited to :data:`_ALLOWED_ATTRIBUTES`; a denylist
+    of private names is not enough, since public introspection attributes
+    (``gi_frame``, ``f_back``, ``f_globals`` ...) reach the host's globals.
+    """
+
+    def visit_Import(self, node):
+        raise ValueError("Import statements are not allowed")
+
+    visit_ImportFrom = visit_Import
+
+    def visit_Attribute(self, node):
+        if node.attr not in _ALLOWED_ATTRIBUTES:
+            raise ValueError(f"Access to attribute '{node.attr}' is not allowed")
+        self.generic_visit(node)
+
+    def visit_Name(self, node):
+        if node.id.startswith("__"):
+            raise ValueError(f"Name '{node.id}' is not allowed")
+
+    def visit_ExceptHandler(self, node):
+        if node.type is None:
+            raise ValueError("Bare 'except:' is not allowed; catch Exception instead")
+        self.generic_visit(node)
+
+
+def _compile(source: str, mode: str = "exec") -> CodeType:
+    """Validate and compile ``source``, caching code objects by source hash.
+
+    Raises ``SyntaxError`` or ``ValueError`` for invalid scripts.
+    """
+    key = mode + ":" + hashlib.sha1(source.encode("utf-8")).hexdigest()
+    code = _CODE_CACHE.get(key)
+    if code is not None:
+        _CODE_CACHE.move_to_end(key)
+        return code
+    tree = ast.parse(source, mode=mode)
+    _ScriptValidator().visit(tree)
+    code = compile(tree, f"{_FILENAME_PREFIX}{key[5:17]}>", mode)
+    _CODE_CACHE[key] = code
+    if len(_CODE_CACHE) > _CODE_CACHE_MAXSIZE:
+        _CODE_CACHE.popitem(last=False)
+    return code
+
+
+def compile_expression(source: str) -> CodeType:
+    """Validate and compile a single script expression (e.g. a trigger condition)."""
+    return _compile(source, "eval")
+
+
+def restricted_globals(**helpers: Any) -> Dict[str, Any]:
+    """Return a globals dict with the safe builtins plus ``helpers``."""
+    return {"__builtins__": _SAFE_BUILTINS, **helpers}
+
+
+def _deadline_tracer(deadline: float) -> Callable:
+    """Return a ``sys.settrace`` hook raising :class:`ScriptTimeout` after ``deadline``."""
+
+    def _local(frame, event, arg):
+        if event == "line" and time.perf_counter() > deadline:
+            raise ScriptTimeout("hard time limit exceeded")
+        return _local
+
+    def _global(frame, event, arg):
+        if frame.f_code.co_filename.startswith(_FILENAME_PREFIX):
+            return _local
+        return None
+
+    return _global
+
+
+def _exec_guarded(code: CodeType, namespace: Dict[str, Any], hard_limit_s: float) -> Tuple[Optional[str], bool]:
+    """Execute ``code`` with a hard time limit.
+
+    Returns ``(error, timed_out)``.  The limit is skipped while another
+    tracer (e.g. a debugger) is installed.
+    """
+    prev_trace = sys.gettrace()
+    if prev_trace is None:
+        sys.settrace(_deadline_tracer(time.perf_counter() + hard_limit_s))
+    try:
+        exec(code, namespace)
+        return None, False
+    except ScriptTimeout as exc:
+        return str(exc), True
+    except Exception as exc:
+        return f"{type(exc).__name__}: {exc}", False
+    finally:
+        if prev_trace is None:
+            sys.settrace(None)
+
+
+def _run_in_worker(source: str, snapshot: Dict[str, Any], hard_limit_s: float):
+    """Execute a script in a worker process against a tag snapshot.
+
+    Returns ``(writes, logs, screens, error, timed_out, elapsed_ms)``; the
+    engine applies the writes on its next tick.
+    """
+    writes: Dict[str, Any] = {}
+    logs: List[str] = []
+    screens: List[str] = []
+
+    def _resolve(tag):
+        if tag in snapshot or tag in writes:
+            return tag
+        suffix = f"]::{tag}"
+        return next((p for p in snapshot if p.endswith(suffix)), tag)
+
+    def read(tag):
+        path = _resolve(tag)
+        return writes[path] if path in writes else snapshot.get(path)
+
+    def write(tag, value):
+        writes[_resolve(tag)] = value
+
+    namespace = {
+        "__builtins__": _SAFE_BUILTINS,
+        "tag": lambda name: name,
+        "read": read,
+        "write": write,
+        "toggle": lambda tag: write(tag, not read(tag)),
+        "change_screen": lambda name: screens.append(str(name)),
+        "ack": lambda alarm_id: None,
+        "log": lambda msg: logs.append(str(msg)),
+        "print": lambda *a: logs.append(" ".join(map(str, a))),
+        "delay_ms": lambda ms: None,
+    }
+    start = time.perf_counter()
+    try:
+        code = _compile(source)
+    except (SyntaxError, ValueError) as exc:
+        return writes, logs, screens, str(exc), False, 0.0
+    error, timed_out = _exec_guarded(code, namespace, hard_limit_s)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    return writes, logs, screens, error, timed_out, elapsed_ms
+
+
+@dataclass(slots=True)
+class ScriptStats:
+    """Execution statistics for one script."""
+
+    runs: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    overruns: int = 0
+    errors: int = 0
+    last_error: str = ""
+
+
+@dataclass(slots=True)
+class _Script:
+    key: str
+    source: str
+    code: Optional[CodeType]
+    namespace: Dict[str, Any]
+    worker: bool = False
+    suspended: bool = False
+    resume_at: float = 0.0
+    consecutive_overruns: int = 0
+    pending: Optional[Future] = None
+    stats: ScriptStats = field(default_factory=ScriptStats)
+
+
+class ScriptEngine(QObject):
+    """
+    Runtime execution of project, screen and object scripts.
+
+    Scripts are compiled once (cached by source hash) and executed in a
+    restricted namespace exposing the helper API: ``tag``, ``read``,
+    ``write``, ``toggle``, ``change_screen``, ``ack``, ``log`` and
+    ``delay_ms``.  ``read``/``write`` accept a tag name or a handle returned
+    by ``tag(name)``.
+
+    ``delay_ms(ms)`` does not pause the running script: the rest of the
+    current run still executes, and later runs of the same script are
+    skipped until ``ms`` have passed.
+
+    Script keys:
+      - ``project:<event>`` (``on_start``, ``on_stop``, ``project_tick``)
+      - ``screen:<screen_id>:<event>`` (``on_open``, ``on_close``, ``tick``)
+      - ``object:<instance_id>:<event>`` (e.g. ``on_click``)
+
+    Every run is timed against ``budget_ms``.  Overruns are reported via
+    ``script_error``; ``max_overruns`` consecutive overruns, or exceeding
+    ``budget_ms * hard_limit_factor`` (the run is aborted), suspend the
+    script until :meth:`resume`.  Scripts declared as
+    ``{"source": ..., "worker": true}`` run in a subprocess against a tag
+    snapshot and their writes are applied on a later tick.
+    """
+
+    script_error = pyqtSignal(str, str)
+    script_suspended = pyqtSignal(str, str)
+    log_message = pyqtSignal(str)
+    screen_change_requested = pyqtSignal(str)
+    alarm_ack_requested = pyqtSignal(str)
+
+    def __init__(
+        self,
+        data_mgr: DataManager,
+        budget_ms: float = 20.0,
+        hard_limit_factor: float = 5.0,
+        max_overruns: int = 3,
+    ):
+        super().__init__()
+        self.data_mgr = data_mgr
+        self.budget_ms = budget_ms
+        self.hard_limit_factor = hard_limit_factor
+        self.max_overruns = max_overruns
+        self._scripts: Dict[str, _Script] = {}
+        self._current: Optional[_Script] = None
+        self._active_screen: Optional[str] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._api = self._build_api()
+
+    # --- Helper API -----------------------------------------------------
+    def _build_api(self) -> Dict[str, Any]:
+        dm = self.data_mgr
+
+        def tag(name: str) -> int:
+            return dm.handle(name)
+
+        def read(tag: Any) -> Any:
+            return dm.get_by_handle(tag) if isinstance(tag, int) else dm.get(tag)
+
+        def write(tag: Any, value: Any) -> None:
+            if isinstance(tag, int):
+                dm.set_by_handle(tag, value)
+            else:
+                dm.set(tag, value)
+
+        def toggle(tag: Any) -> None:
+            write(tag, not read(tag))
+
+        def change_screen(name: str) -> None:
+            self.screen_change_requested.emit(str(name))
+
+        def ack(alarm_id: str) -> None:
+            self.alarm_ack_requested.emit(str(alarm_id))
+
+        def log(msg: Any) -> None:
+            self.log_message.emit(str(msg))
+
+        def delay_ms(ms: int) -> None:
+            # Does not block: the current run continues and later runs of
+            # the calling script are skipped until the delay passes
+            if self._current is not None:
+                self._current.resume_at = time.perf_counter() + max(0, ms) / 1000.0
+
+        return {
+            "tag": tag,
+            "read": read,
+            "write": write,
+            "toggle": toggle,
+            "change_screen": change_screen,
+            "ack": ack,
+            "log": log,
+            "print": lambda *a: log(" ".join(map(str, a))),
+            "delay_ms": delay_ms,
+        }
+
+    # --- Loading --------------------------------------------------------
+    def load(self, project: Dict[str, Any]):
+        """Register all scripts found in ``project`` (replacing previous ones)."""
+        self._scripts.clear()
+        self._active_screen = None
+        for event, spec in (project.get("scripts") or {}).items():
+            self.register(f"project:{event}", spec)
+        for sid, screen in (project.get("screens") or {}).items():
+            for event, spec in (screen.get("scripts") or {}).items():
+                self.register(f"screen:{sid}:{event}", spec)
+            for child in screen.get("children", []) or []:
+                props = child.get("properties") or {}
+                for event, spec in (props.get("scripts") or {}).items():
+                    self.register(f"object:{child.get('instance_id')}:{event}", spec)
+
+    def register(self, key: str, spec: Any) -> bool:
+        """Compile and register a script; ``spec`` is source or a dict.
+
+        Returns ``False`` (and reports via ``script_error``) if it does not
+        compile.
+        """
+        if isinstance(spec, dict):
+            source = str(spec.get("source", "") or "")
+            worker = bool(spec.get("worker", False))
+        else:
+            source = str(spec or "")
+            worker = False
+        if not source.strip():
+            return False
+        try:
+            code = _compile(source)
+        except (SyntaxError, ValueError) as exc:
+            self._scripts[key] = _Script(key, source, None, {})
+            self._report(self._scripts[key], f"Compile error: {exc}")
+            return False
+        namespace = {"__builtins__": _SAFE_BUILTINS, **self._api}
+        self._scripts[key] = _Script(key, source, code, namespace, worker=worker)
+        return True
+
+    # --- Lifecycle ------------------------------------------------------
+    def start(self):
+        self.run("project:on_start")
+
+    def stop(self):
+        if self._active_screen:
+            self.run(f"screen:{self._active_screen}:on_close")
+        self.run("project:on_stop")
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def tick(self):
+        """Run one scan: collect worker results, then the tick scripts."""
+        self._poll_workers()
+        self.run("project:project_tick")
+        if self._active_screen:
+            self.run(f"screen:{self._active_screen}:tick")
+
+    def open_screen(self, screen_id: str):
+        if screen_id == self._active_screen:
+            return
+        if self._active_screen:
+            self.run(f"screen:{self._active_screen}:on_close")
+        self._active_screen = screen_id
+        self.run(f"screen:{screen_id}:on_open")
+
+    def fire_object_event(self, instance_id: str, event: str = "on_click") -> bool:
+        """Run the ``event`` script of a screen object (e.g. a button click)."""
+        return self.run(f"object:{instance_id}:{event}")
+
+    # --- Execution ------------------------------------------------------
+    def run(self, key: str) -> bool:
+        """Run the script registered under ``key``; returns whether it ran."""
+        script = self._scripts.get(key)
+        if script is None or script.code is None or script.suspended:
+            return False
+        if script.resume_at and time.perf_counter() < script.resume_at:
+            return False
+        if script.worker:
+            return self._submit(script)
+
+        hard_limit_s = self.budget_ms * self.hard_limit_factor / 1000.0
+        self._current = script
+        start = time.perf_counter()
+        try:
+            error, timed_out = _exec_guarded(script.code, script.namespace, hard_limit_s)
+        finally:
+            self._current = None
+        self._record(script, (time.perf_counter() - start) * 1000.0, error, timed_out)
+        return True
+
+    def _submit(self, script: _Script) -> bool:
+        if script.pending is not None:
+            # Previous run still in flight; never queue up behind it
+            return False
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=1)
+        hard_limit_s = self.budget_ms * self.hard_limit_factor / 1000.0
+        script.pending = self._executor.submit(
+            _run_in_worker, script.source, self.data_mgr.snapshot(), hard_limit_s
+        )
+        return True
+
+    def _poll_workers(self):
+        for script in self._scripts.values():
+            fut = script.pending
+            if fut is None or not fut.done():
+                continue
+            script.pending = None
+            try:
+                writes, logs, screens, error, timed_out, elapsed_ms = fut.result()
+            except Exception as exc:
+                self._record(script, 0.0, f"Worker failed: {exc}", False)
+                continue
+            if writes:
+                with self.data_mgr.transaction():
+                    for name, value in writes.items():
+                        self.data_mgr.set(name, value)
+            for msg in logs:
+                self.log_message.emit(msg)
+            for name in screens:
+                self.screen_change_requested.emit(name)
+            self._record(script, elapsed_ms, error, timed_out)
+
+    def _record(self, script: _Script, elapsed_ms: float, error: Optional[str], timed_out: bool):
+        st = script.stats
+        st.runs += 1
+        st.total_ms += elapsed_ms
+        st.max_ms = max(st.max_ms, elapsed_ms)
+        if error:
+            self._report(script, error)
+        if timed_out:
+            self._suspend(script, "hard time limit exceeded")
+        elif elapsed_ms > self.budget_ms:
+            st.overruns += 1
+            script.consecutive_overruns += 1
+            self.script_error.emit(
+                script.key,
+                f"Execution took {elapsed_ms:.1f} ms (budget {self.budget_ms:.1f} ms)",
+            )
+            if script.consecutive_overruns >= self.max_overruns:
+                self._suspend(script, f"over budget {script.consecutive_overruns} times in a row")
+        else:
+            script.consecutive_overruns = 0
+
+    def _report(self, script: _Script, error: str):
+        script.stats.errors += 1
+        script.stats.last_error = error
+        logger.warning("Script %s error: %s", script.key, error)
+        self.script_error.emit(script.key, error)
+
+    def _suspend(self, script: _Script, reason: str):
+        script.suspended = True
+        logger.warning("Script %s suspended: %s", script.key, reason)
+        self.script_suspended.emit(script.key, reason)
+
+    # --- Introspection --------------------------------------------------
+    def resume(self, key: str) -> bool:
+        script = self._scripts.get(key)
+        if script is None or not script.suspended:
+            return False
+        script.suspended = False
+        script.consecutive_overruns = 0
+        return True
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-script statistics keyed by script key."""
+        return {
+            key: {**asdict(s.stats), "suspended": s.suspended, "worker": s.worker}
+            for key, s in self._scripts.items()
+        }
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -14,8 +15,18 @@ from PyQt6.QtWidgets import (
 
 from .data_manager import DataManager
 from .screens import ScreenRuntime
+from .recipe_manager import RecipeManager
+from .script_engine import ScriptEngine
+from .background_tasks import BackgroundTasks
+from .remote_view import RemoteView
+from .widgets.button_runtime import ButtonRuntimeController
 from services.serialization import load_from_file
 from services.screen_data_service import screen_service
+from utils import constants
+
+
+# Scan clock period driving project/screen tick scripts
+SCAN_INTERVAL_MS = 100
 
 
 class SimulatorWindow(QMainWindow):
@@ -26,12 +37,20 @@ class SimulatorWindow(QMainWindow):
     to be expanded with actual rendering and interaction logic.
     """
 
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, remote_port: Optional[int] = None):
         super().__init__()
         self.project_path = project_path
         self.project: Dict[str, Any] = {}
         self.data_mgr = DataManager()
         self.screen_rt = ScreenRuntime(self.data_mgr)
+        self.recipe_mgr = RecipeManager(self.data_mgr)
+        self.script_engine = ScriptEngine(self.data_mgr)
+        self.script_engine.screen_change_requested.connect(self._on_screen_change_requested)
+        self.bg_tasks = BackgroundTasks(self.data_mgr, self.script_engine)
+        self.bg_tasks.screen_change_requested.connect(self._on_screen_change_requested)
+        self.bg_tasks.hardcopy_requested.connect(self._on_hardcopy_requested)
+        self.remote_view = RemoteView(self.data_mgr, self.screen_rt, port=remote_port or 0)
+        self.controllers: List[ButtonRuntimeController] = []
 
         self.setWindowTitle(f"HMI Runtime Simulator - {os.path.basename(project_path)}")
         self.resize(1024, 640)
@@ -47,9 +66,25 @@ class SimulatorWindow(QMainWindow):
 
         sb = QStatusBar(self)
         self.setStatusBar(sb)
+        self.script_engine.log_message.connect(lambda msg: sb.showMessage(msg, 5000))
+        self.script_engine.script_suspended.connect(
+            lambda key, reason: sb.showMessage(f"Script {key} suspended: {reason}")
+        )
+
+        self._scan_timer = QTimer(self)
+        self._scan_timer.setInterval(SCAN_INTERVAL_MS)
+        self._scan_timer.timeout.connect(self.script_engine.tick)
+        self._scan_timer.timeout.connect(self.bg_tasks.advance)
 
         self._load_project()
 
+        if remote_port is not None:
+            try:
+                port = self.remote_view.start()
+                sb.showMessage(f"Remote view: http://127.0.0.1:{port}/")
+            except OSError as e:
+                sb.showMessage(f"Remote view unavailable: {e}", 5000)
+
     def _load_project(self):
         # Load via shared services to ensure identical schema handling
         self.project = load_from_file(self.project_path)
@@ -60,6 +95,19 @@ class SimulatorWindow(QMainWindow):
         # Prepare screens runtime from shared screen service/state
         screens = screen_service.get_all_screens()
         self.screen_rt.initialize(screens)
+        self._build_button_controllers(screens)
+
+        # Recipes are optional; projects without a "recipes" section get none
+        self.recipe_mgr.initialize(self.project.get("recipes"))
+
+        # Scripts run on the scan clock; the first screen is opened on start
+        self.script_engine.load(self.project)
+        self.bg_tasks.initialize(self.project.get("background"))
+        self.script_engine.start()
+        ids = self.screen_rt.get_screen_ids()
+        if ids:
+            self._on_screen_change_requested(ids[0])
+        self._scan_timer.start()
 
         # Derive counts for info
         tag_db = self.project.get("tag_databases", {}) or {}
@@ -71,3 +119,39 @@ class SimulatorWindow(QMainWindow):
             f"Project: {os.path.basename(self.project_path)}\n"
             f"Tags: {tag_count} | Screens: {scr_count}"
         )
+
+    def _build_button_controllers(self, screens: Dict[str, Any]):
+        # One controller per runtime button; style changes are mirrored to
+        # the remote viewer and clicks run the button's object scripts
+        self.controllers = []
+        for screen in (screens or {}).values():
+            for child in screen.get("children", []) or []:
+                if child.get("tool_type") != constants.ToolType.BUTTON:
+                    continue
+                ctrl = ButtonRuntimeController(self.data_mgr, child)
+                ctrl.style_changed.connect(self.remote_view.notify_style)
+                ctrl.clicked.connect(self.script_engine.fire_object_event)
+                ctrl.refresh_style()
+                self.controllers.append(ctrl)
+
+    def _on_screen_change_requested(self, ref: str):
+        sid = self.screen_rt.change_screen(ref)
+        if sid is None:
+            self.statusBar().showMessage(f"Unknown screen: {ref}", 5000)
+            return
+        self.script_engine.open_screen(sid)
+        self.remote_view.screen_changed()
+
+    def _on_hardcopy_requested(self, screen: str):
+        # The simulator renders one screen at a time; capture what is shown
+        out_dir = os.path.join(os.path.dirname(os.path.abspath(self.project_path)), "hardcopy")
+        os.makedirs(out_dir, exist_ok=True)
+        path = os.path.join(out_dir, datetime.now().strftime("%Y%m%d_%H%M%S") + ".png")
+        if not self.centralWidget().grab().save(path):
+            self.statusBar().showMessage(f"Hardcopy failed: {path}", 5000)
+
+    def closeEvent(self, event):
+        self._scan_timer.stop()
+        self.script_engine.stop()
+        self.remote_view.stop()
+        super().closeEvent(event)
@@ -1,27 +1,31 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple, Callable, Set
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple, Callable, Set
+from collections import OrderedDict
 from dataclasses import dataclass
 
-import os
-import json
-import hashlib
-
-from PyQt6.QtCore import QObject, QSize, Qt
+from PyQt6.QtCore import QObject, QSize, pyqtSignal
 from PyQt6.QtWidgets import QPushButton
-from PyQt6.QtGui import QColor, QIcon, QPixmap, QPainter
-from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtGui import QIcon
 
 from runtime_simulator.data_manager import DataManager
 
 # Reuse the designer's conditional style logic for evaluation
 from tools.button.conditional_style import ConditionalStyleManager
 from tools.button.runtime_style import RuntimeConditionalStyle
+from tools.button.qss import runtime_rule
 from tools.button.actions.constants import TriggerMode, ActionType
 from utils.icon_manager import IconManager
+from utils.icon_raster import icon_raster
 from utils.percentage import percent_to_value
 
 
+# Bounds for the per-button memo of input values -> matched style row and
+# of (row, state, size) -> stylesheet rule/icon
+_MATCH_MEMO_SIZE = 64
+_RENDER_CACHE_SIZE = 16
+
+
 @dataclass(slots=True)
 class ButtonRuntimeConfig:
     """Subset of button configuration used at runtime."""
@@ -33,28 +37,45 @@ class ButtonRuntimeController(QObject):
     Attach runtime behavior to a QPushButton based on saved button properties.
 
     - Observes DataManager for tag changes to re-evaluate conditional styles.
+      Only tags read by the styles up to the active one trigger a restyle.
     - Handles click/press depending on configured actions.
     - Evaluates triggers (Ordinary/On/Off/Range) before executing actions.
+    - Emits ``style_changed(instance_id, props)`` whenever the active style
+      changes, with or without a bound widget.
+    - Emits ``clicked(instance_id)`` when the bound button is clicked, for
+      the button's ``on_click`` script.
     """
 
+    style_changed = pyqtSignal(str, dict)
+    clicked = pyqtSignal(str)
+
     def __init__(self, data_mgr: DataManager, button_config: Dict[str, Any]):
         super().__init__()
         self.data_mgr = data_mgr
         self.cfg = ButtonRuntimeConfig(properties=button_config.get("properties", {}))
+        self.instance_id = str(button_config.get("instance_id", ""))
         self._manager = self._build_style_manager(self.cfg.properties)
-        self._tag_values: Dict[str, Any] = {}
-        self._tags_of_interest: Set[str] = self._collect_referenced_tags(self.cfg.properties)
+        self._table = self._manager.compile()
+        # Style inputs by the names conditions use, and change keys -> input name
+        self._inputs: Tuple[str, ...] = tuple(sorted(self._table.all_inputs or ()))
+        self._input_keys: Dict[str, str] = {}
+        for name in self._inputs:
+            self._input_keys[name] = name
+            self._input_keys[self.data_mgr.path_of(self.data_mgr.handle(name))] = name
+        self._tags_of_interest: Set[str] = set(self._input_keys)
+        self._tag_values: Dict[str, Any] = {name: self.data_mgr.get(name) for name in self._inputs}
+        # Tags the current style depends on (None: any input)
+        self._style_deps: Optional[FrozenSet[str]] = None
         self._button: Optional[QPushButton] = None
-        self._last_props: Optional[Dict[str, Any]] = None
+        self._last_props: Optional[Mapping[str, Any]] = None
         self._last_css: str = ""
-        self._style_cache: Dict[Tuple[str, Optional[str]], Tuple[str, QIcon]] = {}
+        self._match_memo: "OrderedDict[Tuple[Any, ...], int]" = OrderedDict()
+        self._render_cache: "OrderedDict[Tuple[int, Optional[str], int, int], Tuple[str, QIcon]]" = OrderedDict()
+        # Style evaluations performed (read by the headless runner)
+        self.style_evaluations = 0
 
-        # Prime local cache
-        for t in self._tags_of_interest:
-            self._tag_values[t] = self.data_mgr.get(t)
-
-        # Observe tag changes
-        self.data_mgr.tag_changed.connect(self._on_tag_changed)
+        # Observe tag changes (coalesced per write or transaction)
+        self.data_mgr.tags_changed.connect(self._on_tags_changed)
 
     # --- Public API -----------------------------------------------------
     def bind(self, button: QPushButton):
@@ -64,6 +85,7 @@ class ButtonRuntimeController(QObject):
         # Provide visual feedback for pressed state regardless of actions
         button.pressed.connect(lambda: self._apply_style(None))
         button.released.connect(lambda: self._apply_style(None))
+        button.clicked.connect(lambda: self.clicked.emit(self.instance_id))
 
         # Hook runtime actions
         actions = self.cfg.properties.get("actions", [])
@@ -84,12 +106,64 @@ class ButtonRuntimeController(QObject):
         elif a_type == ActionType.WORD.value:
             button.clicked.connect(lambda: self._execute_word_action(action))
 
+    @property
+    def tags_of_interest(self) -> Set[str]:
+        return self._tags_of_interest
+
+    def refresh_style(self):
+        """Re-evaluate the style now; emits ``style_changed`` if it differs."""
+        self._apply_style(state=None)
+
+    def evaluate_style(self, state: Optional[str] = None) -> Mapping[str, Any]:
+        """Return the active style for the current tag values (no widget needed)."""
+        return self._table.result(self._match(), state)
+
     # --- Tag + style handling ------------------------------------------
-    def _on_tag_changed(self, name: str, value: Any):
-        if name in self._tags_of_interest:
-            self._tag_values[name] = value
-            self._invalidate_cache()
+    def _on_tags_changed(self, changes: Dict[str, Any]):
+        if self._table.all_inputs is None:
+            # A condition's inputs are unknown: any change may restyle.
+            # Changes arrive by "[DB]::Tag" path; conditions may use either
+            # the path or the plain tag name.
+            for key, value in changes.items():
+                self._tag_values[key] = value
+                parsed = self.data_mgr._parse_path(key)
+                if parsed is not None:
+                    self._tag_values[parsed[1]] = value
             self._apply_style(state=None)
+            return
+        changed = None
+        for key in self._tags_of_interest.intersection(changes):
+            name = self._input_keys[key]
+            self._tag_values[name] = changes[key]
+            changed = changed or set()
+            changed.add(name)
+        if changed is None:
+            return
+        deps = self._style_deps
+        if deps is not None and deps.isdisjoint(changed):
+            # Only styles after the active one read these tags
+            return
+        self._apply_style(state=None)
+
+    def _match(self) -> int:
+        """Return the matching style row, memoized by the input values."""
+        if self._table.all_inputs is None:
+            # Inputs unknown: the values below do not determine the match
+            return self._table.match(self._tag_values)
+        try:
+            key = tuple(self._tag_values[name] for name in self._inputs)
+            index = self._match_memo.get(key)
+        except TypeError:
+            # Unhashable tag value (e.g. arrays): evaluate directly
+            return self._table.match(self._tag_values)
+        if index is None:
+            index = self._table.match(self._tag_values)
+            self._match_memo[key] = index
+            if len(self._match_memo) > _MATCH_MEMO_SIZE:
+                self._match_memo.popitem(last=False)
+        else:
+            self._match_memo.move_to_end(key)
+        return index
 
     def _build_style_manager(self, props: Dict[str, Any]) -> ConditionalStyleManager:
         m = ConditionalStyleManager()
@@ -109,94 +183,37 @@ class ButtonRuntimeController(QObject):
                 pass
         return m
 
-    def _invalidate_cache(self) -> None:
-        self._style_cache.clear()
-
-    def _compute_style_key(self, props: Dict[str, Any], state: Optional[str]) -> Tuple[str, Optional[str]]:
-        data = json.dumps(props, sort_keys=True)
-        digest = hashlib.sha1(data.encode("utf-8")).hexdigest()
-        return digest, state
-
     def _apply_style(self, state: Optional[str]):
-        if not self._button:
-            return
-        if state is None:
+        if state is None and self._button is not None:
             if not self._button.isEnabled():
                 state = "disabled"
             elif self._button.isDown():
                 state = "pressed"
-        props = self._manager.get_active_style(self._tag_values, state)
-        if props == self._last_props:
+        index = self._match()
+        self.style_evaluations += 1
+        self._style_deps = self._table.inputs_for(index)
+        props = self._table.result(index, state)
+        # Results are shared per (row, state), so identity means unchanged
+        if props is self._last_props:
+            return
+        self._last_props = props
+        self.style_changed.emit(self.instance_id, dict(props))
+        if not self._button:
             return
 
         # Button geometry for proportional scaling
         h = max(self._button.height(), 1)
         w = max(self._button.width(), 1)
-        min_dim = min(w, h)
 
         # Update text and tooltip regardless of cache use
         text = str(props.get("text_value", props.get("label", "Button")))
         self._button.setText(text)
         self._button.setToolTip(str(props.get("tooltip", "") or ""))
 
-        key = self._compute_style_key(props, state)
-        cached = self._style_cache.get(key)
+        key = (index, state, w, h)
+        cached = self._render_cache.get(key)
         if cached is None:
-            bg = props.get("background_color") or props.get("default_style", {}).get(
-                "background_color", "#5a6270"
-            )
-            fg = props.get("text_color") or props.get("default_style", {}).get(
-                "text_color", "#ffffff"
-            )
-            bw = percent_to_value(props.get("border_width", 0) or 0, min_dim)
-            bc = props.get("border_color", "#000000")
-
-            if any(
-                props.get(k, 0)
-                for k in (
-                    "border_radius_tl",
-                    "border_radius_tr",
-                    "border_radius_br",
-                    "border_radius_bl",
-                )
-            ):
-                br_tl = percent_to_value(props.get("border_radius_tl", 0) or 0, min_dim)
-                br_tr = percent_to_value(props.get("border_radius_tr", 0) or 0, min_dim)
-                br_br = percent_to_value(props.get("border_radius_br", 0) or 0, min_dim)
-                br_bl = percent_to_value(props.get("border_radius_bl", 0) or 0, min_dim)
-                radius_css = (
-                    f"border-top-left-radius:{br_tl}px;"
-                    f"border-top-right-radius:{br_tr}px;"
-                    f"border-bottom-right-radius:{br_br}px;"
-                    f"border-bottom-left-radius:{br_bl}px;"
-                )
-            else:
-                br = percent_to_value(props.get("border_radius", 0) or 0, min_dim)
-                radius_css = f"border-radius:{br}px;"
-
-            font_size = percent_to_value(props.get("font_size", 0) or 0, h)
-            font_family = props.get("font_family")
-            bold = props.get("bold")
-            italic = props.get("italic")
-            underline = props.get("underline")
-            font_css = f"font-size:{font_size}px;"
-            if font_family:
-                font_css += f"font-family:'{font_family}';"
-            if bold:
-                font_css += "font-weight:bold;"
-            if italic:
-                font_css += "font-style:italic;"
-            if underline:
-                font_css += "text-decoration:underline;"
-
-            css = (
-                "QPushButton{"
-                f"background-color:{bg};color:{fg};"
-                f"border:{bw}px solid {bc};"
-                f"{radius_css}{font_css}"
-                "}"
-            )
-
+            css = runtime_rule(props, w, h)
             icon_src = props.get("icon", "")
             icon = QIcon()
             if icon_src:
@@ -205,27 +222,18 @@ class ButtonRuntimeController(QObject):
                 if str(icon_src).startswith("qta:"):
                     name = icon_src.split(":", 1)[1]
                     icon = IconManager.create_icon(name, color=color)
-                else:
-                    ext = os.path.splitext(icon_src)[1].lower()
-                    if ext == ".svg":
-                        renderer = QSvgRenderer(icon_src)
-                        if renderer.isValid():
-                            pix = QPixmap(size, size)
-                            pix.fill(Qt.GlobalColor.transparent)
-                            p = QPainter(pix)
-                            renderer.render(p)
-                            p.end()
-                            icon = QIcon(pix)
-                    else:
-                        pix = QPixmap(icon_src)
-                        if not pix.isNull():
-                            icon = QIcon(pix)
+                elif size > 0:
+                    icon = icon_raster.icon(icon_src, size)
             cached = (css, icon)
-            self._style_cache[key] = cached
+            self._render_cache[key] = cached
+            if len(self._render_cache) > _RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+        else:
+            self._render_cache.move_to_end(key)
 
         css, icon = cached
-        self._button.setStyleSheet(css)
-        self._last_props = dict(props)
+        if css != self._last_css:
+            self._button.setStyleSheet(f"QPushButton{{{css}}}")
         self._last_css = css
         self._button.setIcon(icon)
         if not icon.isNull():
@@ -368,34 +376,3 @@ class ButtonRuntimeController(QObject):
             return float(v)
         except Exception:
             return None
-
-    def _collect_referenced_tags(self, props: Dict[str, Any]) -> Set[str]:
-        tags: Set[str] = set()
-
-        def add_from_operand(data: Optional[Dict[str, Any]]):
-            tag = self._extract_tag_name(data)
-            if tag:
-                tags.add(tag)
-
-        # Conditional styles
-        for s in props.get('conditional_styles', []) or []:
-            # condition_data can contain operands
-            cd = s.get('condition_data') or {}
-            add_from_operand(cd.get('tag'))
-            add_from_operand(cd.get('operand1'))
-            add_from_operand(cd.get('operand2'))
-            add_from_operand(cd.get('lower_bound'))
-            add_from_operand(cd.get('upper_bound'))
-
-        # Actions
-        for a in props.get('actions', []) or []:
-            add_from_operand(a.get('target_tag'))
-            add_from_operand(a.get('value'))
-            tr = a.get('trigger') or {}
-            add_from_operand(tr.get('tag'))
-            add_from_operand(tr.get('operand1'))
-            add_from_operand(tr.get('operand2'))
-            add_from_operand(tr.get('lower_bound'))
-            add_from_operand(tr.get('upper_bound'))
-
-        return tags
@@ -144,15 +144,21 @@ class AddChildCommand(Command):
         self.parent_id: str = parent_id
         self.child_data: Dict[str, Any] = copy.deepcopy(child_data)
         self.instance_id: Any = self.child_data['instance_id']
+        self._applied: bool = False
 
     def redo(self) -> None:
         screen_service._perform_add_child(self.parent_id, self.child_data)
+        self._applied = True
 
     def undo(self) -> None:
         screen_service._perform_remove_child(self.parent_id, self.instance_id)
+        self._applied = False
 
     def notify(self) -> None:
-        screen_service.screen_modified.emit(self.parent_id)
+        if self._applied:
+            screen_service.notify_children_changed(self.parent_id, added=(self.instance_id,))
+        else:
+            screen_service.notify_children_changed(self.parent_id, removed=(self.instance_id,))
 
 class RemoveChildCommand(Command):
     """Removes a child instance from a parent screen."""
@@ -162,15 +168,79 @@ class RemoveChildCommand(Command):
         self.parent_id: str = parent_id
         self.instance_data: Dict[str, Any] = copy.deepcopy(instance_data)
         self.instance_id: Any = self.instance_data['instance_id']
+        self._applied: bool = False
 
     def redo(self) -> None:
         screen_service._perform_remove_child(self.parent_id, self.instance_id)
+        self._applied = True
 
     def undo(self) -> None:
         screen_service._perform_add_child(self.parent_id, self.instance_data)
+        self._applied = False
 
     def notify(self) -> None:
-        screen_service.screen_modified.emit(self.parent_id)
+        if self._applied:
+            screen_service.notify_children_changed(self.parent_id, removed=(self.instance_id,))
+        else:
+            screen_service.notify_children_changed(self.parent_id, added=(self.instance_id,))
+
+class BulkAddChildrenCommand(Command):
+    """Adds several child instances at once; undo removes them together."""
+
+    def __init__(self, parent_id: str, children_data: List[Dict[str, Any]]):
+        super().__init__()
+        self.parent_id: str = parent_id
+        self.children_data: List[Dict[str, Any]] = copy.deepcopy(children_data)
+        self.instance_ids: List[Any] = [c['instance_id'] for c in self.children_data]
+
+        self._applied: bool = False
+
+    def redo(self) -> None:
+        screen_service._perform_add_children(self.parent_id, self.children_data)
+        self._applied = True
+
+    def undo(self) -> None:
+        screen_service._perform_remove_children(self.parent_id, self.instance_ids)
+        self._applied = False
+
+    def notify(self) -> None:
+        if self._applied:
+            screen_service.notify_children_changed(self.parent_id, added=self.instance_ids)
+        else:
+            screen_service.notify_children_changed(self.parent_id, removed=self.instance_ids)
+
+class BulkRemoveChildrenCommand(Command):
+    """Removes several child instances; undo restores them in their stacking order."""
+
+    def __init__(self, parent_id: str, instance_ids: List[Any]):
+        super().__init__()
+        self.parent_id: str = parent_id
+        self.instance_ids: List[Any] = list(instance_ids)
+        # (index, child_data) recorded on redo, reinserted on undo
+        self.removed: List[Tuple[int, Dict[str, Any]]] = []
+        self._applied: bool = False
+
+    def redo(self) -> None:
+        self.removed = screen_service._perform_remove_children(
+            self.parent_id, self.instance_ids
+        )
+        self._applied = True
+
+    def undo(self) -> None:
+        screen_service._perform_add_children(
+            self.parent_id,
+            [child for _, child in self.removed],
+            [index for index, _ in self.removed],
+        )
+        self._applied = False
+
+    def notify(self) -> None:
+        ids = [child['instance_id'] for _, child in self.removed]
+        if self._applied:
+            screen_service.notify_children_changed(self.parent_id, removed=ids)
+        else:
+            # Restored children keep their original stacking positions
+            screen_service.notify_children_changed(self.parent_id, added=ids, reordered=True)
 
 # Re-added the missing MoveChildCommand
 class MoveChildCommand(Command):
@@ -199,7 +269,7 @@ class MoveChildCommand(Command):
         )
 
     def notify(self) -> None:
-        screen_service.screen_modified.emit(self.parent_id)
+        screen_service.notify_children_changed(self.parent_id, updated=(self.instance_id,))
 
 class BulkMoveChildCommand(Command):
     """Moves multiple children; undo restores their previous positions."""
@@ -213,23 +283,50 @@ class BulkMoveChildCommand(Command):
         ]
 
     def redo(self) -> None:
-        for instance_id, new_pos, _ in self.move_list:
-            screen_service._perform_update_child_position(
-                self.parent_id,
-                instance_id,
-                new_pos,
-            )
+        screen_service._perform_update_children_positions(
+            self.parent_id,
+            {instance_id: new_pos for instance_id, new_pos, _ in self.move_list},
+        )
 
     def undo(self) -> None:
-        for instance_id, _, old_pos in self.move_list:
-            screen_service._perform_update_child_position(
-                self.parent_id,
-                instance_id,
-                old_pos,
-            )
+        screen_service._perform_update_children_positions(
+            self.parent_id,
+            {instance_id: old_pos for instance_id, _, old_pos in self.move_list},
+        )
 
     def notify(self) -> None:
-        screen_service.screen_modified.emit(self.parent_id)
+        screen_service.notify_children_changed(
+            self.parent_id, updated=[iid for iid, _, _ in self.move_list]
+        )
+
+class BulkResizeChildCommand(Command):
+    """Sets position and size of multiple children; undo restores both.
+
+    Only ``(x, y, width, height)`` tuples are stored, so large selections
+    avoid copying every child's full properties.
+    """
+
+    def __init__(self, parent_id: str, resize_list: List[Tuple[Any, Tuple[float, float, float, float], Tuple[float, float, float, float]]]):
+        super().__init__()
+        self.parent_id: str = parent_id
+        self.resize_list = [(iid, tuple(new), tuple(old)) for iid, new, old in resize_list]
+
+    def redo(self) -> None:
+        screen_service._perform_update_children_geometry(
+            self.parent_id,
+            {instance_id: new for instance_id, new, _ in self.resize_list},
+        )
+
+    def undo(self) -> None:
+        screen_service._perform_update_children_geometry(
+            self.parent_id,
+            {instance_id: old for instance_id, _, old in self.resize_list},
+        )
+
+    def notify(self) -> None:
+        screen_service.notify_children_changed(
+            self.parent_id, updated=[iid for iid, _, _ in self.resize_list]
+        )
 
 class UpdateChildPropertiesCommand(Command):
     """Updates properties of a child instance; undo restores previous props."""
@@ -256,7 +353,7 @@ class UpdateChildPropertiesCommand(Command):
         )
 
     def notify(self) -> None:
-        screen_service.screen_modified.emit(self.screen_id)
+        screen_service.notify_children_changed(self.screen_id, updated=(self.instance_id,))
 
 class BulkUpdateChildPropertiesCommand(Command):
     """Applies multiple child property updates; undo restores old properties."""
@@ -267,23 +364,21 @@ class BulkUpdateChildPropertiesCommand(Command):
         self.update_list: List[Tuple[Any, Dict[str, Any], Dict[str, Any]]] = copy.deepcopy(update_list)
 
     def redo(self) -> None:
-        for instance_id, new_props, _ in self.update_list:
-            screen_service._perform_update_child_properties(
-                self.screen_id,
-                instance_id,
-                new_props,
-            )
+        screen_service._perform_update_children_properties(
+            self.screen_id,
+            {instance_id: new_props for instance_id, new_props, _ in self.update_list},
+        )
 
     def undo(self) -> None:
-        for instance_id, _, old_props in self.update_list:
-            screen_service._perform_update_child_properties(
-                self.screen_id,
-                instance_id,
-                old_props,
-            )
+        screen_service._perform_update_children_properties(
+            self.screen_id,
+            {instance_id: old_props for instance_id, _, old_props in self.update_list},
+        )
 
     def notify(self) -> None:
-        screen_service.screen_modified.emit(self.screen_id)
+        screen_service.notify_children_changed(
+            self.screen_id, updated=[iid for iid, _, _ in self.update_list]
+        )
 
 
 class AddAnchorCommand(Command):
@@ -315,7 +410,7 @@ class AddAnchorCommand(Command):
         )
 
     def notify(self) -> None:
-        screen_service.screen_modified.emit(self.screen_id)
+        screen_service.notify_children_changed(self.screen_id, updated=(self.instance_id,))
 
 
 class RemoveAnchorCommand(Command):
@@ -348,7 +443,7 @@ class RemoveAnchorCommand(Command):
         )
 
     def notify(self) -> None:
-        screen_service.screen_modified.emit(self.screen_id)
+        screen_service.notify_children_changed(self.screen_id, updated=(self.instance_id,))
 
 
 class MoveAnchorCommand(Command):
@@ -381,7 +476,7 @@ class MoveAnchorCommand(Command):
         )
 
     def notify(self) -> None:
-        screen_service.screen_modified.emit(self.screen_id)
+        screen_service.notify_children_changed(self.screen_id, updated=(self.instance_id,))
 
 # --- Comment Group Commands ---
 class AddCommentGroupCommand(Command):
@@ -5,7 +5,7 @@ import csv
 import os
 import json
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from services.tag_data_service import tag_data_service
 
@@ -159,4 +159,65 @@ class CsvService:
         except (IOError, ValueError, KeyError) as e:
             raise ValueError(f"Failed to process CSV file: {e}")
 
+    def export_recipes_to_csv(
+        self,
+        file_path: str,
+        tags: List[Tuple[str, str]],
+        recipe_names: List[str],
+        columns: List[List[Any]],
+    ) -> bool:
+        """
+        Exports a recipe table to a CSV file.
+
+        Each row is a tag (``TagName``, ``DataType``) followed by one value
+        column per recipe.  Cells holding ``None`` (tag not part of that
+        recipe) are written empty.
+        """
+        header = ['TagName', 'DataType', *recipe_names]
+        try:
+            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                for row, (tag_name, data_type) in enumerate(tags):
+                    values = [
+                        '' if col[row] is None else col[row]
+                        for col in columns
+                    ]
+                    writer.writerow([tag_name, data_type, *values])
+            return True
+        except IOError:
+            return False
+
+    def import_recipes_from_csv(
+        self, file_path: str
+    ) -> Tuple[List[Tuple[str, str]], List[str], List[List[Any]]]:
+        """
+        Imports a recipe table written by :meth:`export_recipes_to_csv`.
+
+        Returns ``(tags, recipe_names, columns)`` where ``tags`` is a list of
+        ``(tag_name, data_type)`` rows and ``columns`` holds one list of typed
+        values per recipe.  Empty cells become ``None``.
+        """
+        try:
+            with open(file_path, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if not header or header[:2] != ['TagName', 'DataType']:
+                    raise ValueError("missing 'TagName,DataType' header")
+                recipe_names = header[2:]
+                tags: List[Tuple[str, str]] = []
+                columns: List[List[Any]] = [[] for _ in recipe_names]
+                for row in reader:
+                    if not row or not row[0]: continue
+                    tag_name = row[0]
+                    data_type = row[1] if len(row) > 1 else ''
+                    tags.append((tag_name, data_type))
+                    cells = row[2:]
+                    for i, col in enumerate(columns):
+                        val_str = cells[i] if i < len(cells) else ''
+                        col.append(self._parse_value(data_type, val_str) if val_str != '' else None)
+            return tags, recipe_names, columns
+        except (IOError, ValueError) as e:
+            raise ValueError(f"Failed to process CSV file: {e}")
+
 csv_service = CsvService()
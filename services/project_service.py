@@ -9,6 +9,10 @@ from services.tag_data_service import tag_data_service
 from services.comment_data_service import comment_data_service
 from services.settings_service import settings_service
 
+# Top-level project keys owned by the data services.  Any other section
+# (e.g. runtime "scripts" or "recipes") is kept verbatim and written back.
+_SERVICE_SECTIONS = ("project_info", "screens", "tag_databases", "comment_groups")
+
 class ProjectService(QObject):
     """
     Manages all project-related operations such as creating, loading,
@@ -23,6 +27,7 @@ class ProjectService(QObject):
         self.project_file_path = None
         self.is_dirty = False
         self.project_info = self._get_default_project_info()
+        self.extra_sections: Dict[str, Any] = {}
 
     def new_project(self):
         """
@@ -116,6 +121,7 @@ class ProjectService(QObject):
         self.project_file_path = None
         self.is_dirty = False
         self.project_info = self._get_default_project_info()
+        self.extra_sections = {}
         screen_service.clear_all()
         tag_data_service.clear_all()
         comment_data_service.clear_all()
@@ -130,6 +136,9 @@ class ProjectService(QObject):
         self._reset_project_state(is_loading=True)
 
         self.project_info = project_data.get("project_info", self._get_default_project_info())
+        self.extra_sections = {
+            k: v for k, v in project_data.items() if k not in _SERVICE_SECTIONS
+        }
         screen_service.load_from_project(project_data)
         tag_data_service.load_from_project(project_data)
         comment_data_service.load_from_project(project_data)
@@ -159,6 +168,7 @@ class ProjectService(QObject):
         tag_data = tag_data_service.serialize_for_project()
         comment_data = comment_data_service.serialize_for_project()
         project_data = {
+            **self.extra_sections,
             "project_info": new_info,
             **screen_data,
             **tag_data,
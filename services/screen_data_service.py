@@ -3,9 +3,24 @@
 
 import uuid
 import copy
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 from .data_context import DataContext, data_context
 
+
+@dataclass(frozen=True, slots=True)
+class ChildrenDelta:
+    """Which children of a screen changed in one modification.
+
+    Carried as ``"delta"`` on ``screens_changed`` events; events without a
+    delta mean anything may have changed.
+    """
+    added: Tuple[Any, ...] = ()
+    removed: Tuple[Any, ...] = ()
+    updated: Tuple[Any, ...] = ()
+    reordered: bool = False
+
 class ScreenDataService(QObject):
     """
     A service that manages all screen data for the project.
@@ -19,14 +34,35 @@ class ScreenDataService(QObject):
         self._bus = bus
         self._screens = {}
         self._child_to_parents = {}
+        # Delta attached to the screen_modified emission in progress
+        self._pending_deltas: Dict[str, ChildrenDelta] = {}
 
         # Bridge existing signals into the shared data context
         self.screen_list_changed.connect(
             lambda: self._bus.screens_changed.emit({"action": "screen_list_changed"})
         )
-        self.screen_modified.connect(
-            lambda sid: self._bus.screens_changed.emit({"action": "screen_modified", "screen_id": sid})
+        self.screen_modified.connect(self._bridge_screen_modified)
+
+    def _bridge_screen_modified(self, screen_id):
+        event = {"action": "screen_modified", "screen_id": screen_id}
+        delta = self._pending_deltas.get(screen_id)
+        if delta is not None:
+            event["delta"] = delta
+        self._bus.screens_changed.emit(event)
+
+    def notify_children_changed(self, parent_id, added=(), removed=(), updated=(), reordered=False):
+        """Emit ``screen_modified`` for ``parent_id`` with a structured delta.
+
+        Listeners of the data context receive the :class:`ChildrenDelta` and
+        can apply just those children instead of resyncing the screen.
+        """
+        self._pending_deltas[parent_id] = ChildrenDelta(
+            tuple(added), tuple(removed), tuple(updated), bool(reordered)
         )
+        try:
+            self.screen_modified.emit(parent_id)
+        finally:
+            self._pending_deltas.pop(parent_id, None)
 
     def _index_add_child(self, parent_id, child_screen_id):
         if not child_screen_id:
@@ -165,7 +201,7 @@ class ScreenDataService(QObject):
             return
 
         if changed:
-            self.screen_modified.emit(parent_id)
+            self.notify_children_changed(parent_id, reordered=True)
         
     def get_parent_screens(self, child_screen_id):
         return list(self._child_to_parents.get(child_screen_id, set()))
@@ -251,6 +287,62 @@ class ScreenDataService(QObject):
             return True
         return False
 
+    def _perform_add_children(self, parent_id, children_data, indices=None):
+        """Insert several children in one pass.
+
+        Without ``indices`` the children are appended.  Otherwise each child
+        is placed at its index in the resulting list, which restores the
+        stacking order recorded by :meth:`_perform_remove_children`.
+        """
+        if parent_id not in self._screens:
+            return False
+        children = self._screens[parent_id].setdefault('children', [])
+        if indices is None:
+            children.extend(children_data)
+        else:
+            placed = sorted(zip(indices, range(len(children_data))))
+            merged = []
+            rest = iter(children)
+            for index, i in placed:
+                while len(merged) < index:
+                    nxt = next(rest, None)
+                    if nxt is None:
+                        break
+                    merged.append(nxt)
+                merged.append(children_data[i])
+            merged.extend(rest)
+            self._screens[parent_id]['children'] = merged
+        for child in children_data:
+            self._index_add_child(parent_id, child.get('screen_id'))
+        return True
+
+    def _perform_remove_children(self, parent_id, instance_ids):
+        """Remove several children in one pass.
+
+        Returns ``[(index, child_data), ...]`` of the removed children in
+        their original order, for undo.
+        """
+        if parent_id not in self._screens:
+            return []
+        id_set = set(instance_ids)
+        children = self._screens[parent_id].get('children', [])
+        removed = []
+        kept = []
+        for index, child in enumerate(children):
+            if child.get('instance_id') in id_set:
+                removed.append((index, child))
+            else:
+                kept.append(child)
+        if not removed:
+            return []
+        self._screens[parent_id]['children'] = kept
+        remaining = {c.get('screen_id') for c in kept}
+        for _, child in removed:
+            cid = child.get('screen_id')
+            if cid not in remaining:
+                self._index_remove_child(parent_id, cid)
+        return removed
+
     def _perform_update_child_position(self, parent_id, instance_id, position):
         instance = self.get_child_instance(parent_id, instance_id)
         if instance:
@@ -261,6 +353,53 @@ class ScreenDataService(QObject):
             return True
         return False
 
+    def _perform_update_children_positions(self, parent_id, positions):
+        """Set positions from an ``{instance_id: position}`` map in one pass."""
+        count = 0
+        for instance in self._screens.get(parent_id, {}).get('children', []):
+            position = positions.get(instance.get('instance_id'))
+            if position is None:
+                continue
+            if 'position' in instance:
+                instance['position'] = position
+            elif 'properties' in instance and 'position' in instance['properties']:
+                instance['properties']['position'] = position
+            else:
+                continue
+            count += 1
+        return count
+
+    def _perform_update_children_geometry(self, parent_id, geometry):
+        """Set position and size from an ``{instance_id: (x, y, w, h)}`` map.
+
+        Embedded screens keep their geometry on the instance, other children
+        inside ``properties``.
+        """
+        count = 0
+        for instance in self._screens.get(parent_id, {}).get('children', []):
+            g = geometry.get(instance.get('instance_id'))
+            if g is None:
+                continue
+            x, y, w, h = g
+            target = instance if 'properties' not in instance else instance['properties']
+            if 'position' in instance:
+                instance['position'] = {'x': x, 'y': y}
+            else:
+                target['position'] = {'x': x, 'y': y}
+            target['size'] = {'width': w, 'height': h}
+            count += 1
+        return count
+
+    def _perform_update_children_properties(self, parent_id, props_by_id):
+        """Replace properties from an ``{instance_id: props}`` map in one pass."""
+        count = 0
+        for instance in self._screens.get(parent_id, {}).get('children', []):
+            new_props = props_by_id.get(instance.get('instance_id'))
+            if new_props is not None and 'properties' in instance:
+                instance['properties'] = new_props
+                count += 1
+        return count
+
     def _perform_update_child_properties(self, parent_id, instance_id, new_props):
         instance = self.get_child_instance(parent_id, instance_id)
         if instance and 'properties' in instance:
@@ -33,6 +33,7 @@ def save_to_file(file_path: str) -> bool:
 def get_current_project() -> Dict[str, Any]:
     """Return the current in-memory project as a JSON-serializable dict."""
     return {
+        **project_service.extra_sections,
         "project_info": project_service.get_project_info(),
         **screen_service.serialize_for_project(),
         **tag_data_service.serialize_for_project(),
@@ -10,18 +10,22 @@ refresh their UI.
 
 The service also updates any existing button instances when a style is
 modified or removed so that changes propagate across the entire project.
+Each style is resolved once into an interned :class:`FrozenStyle` of the
+keys it applies to an instance; a reverse index from style to using
+instances (built lazily per screen) keeps propagation proportional to the
+number of affected buttons.
 """
 
 from __future__ import annotations
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import copy
 import uuid
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from .data_context import DataContext, data_context
-from tools.button.style_properties import StyleProperties
+from tools.button.style_properties import FrozenStyle, StyleProperties
 
 # ---------------------------------------------------------------------------
 # Default style definition
@@ -62,17 +66,54 @@ def _qt_default_style() -> Dict[str, Any]:
     }
 
 
+# Instance keys owned by a style: removed from the instance when the style
+# does not define them
+_STATE_KEYS = ("hover_properties", "pressed_properties", "disabled_properties")
+_ICON_KEYS = ("icon", "hover_icon")
+
+
+def _resolve(style_def: Dict[str, Any]) -> FrozenStyle:
+    """Flatten ``style_def`` into the keys it sets on a using instance."""
+    data = dict(style_def.get("properties", {}))
+    for key in _STATE_KEYS:
+        if key in style_def:
+            data[key] = style_def[key]
+    for key in _ICON_KEYS:
+        if style_def.get(key):
+            data[key] = style_def[key]
+        else:
+            data.pop(key, None)
+    return FrozenStyle.of(data)
+
+
+def _write_resolved(props: Dict[str, Any], resolved: FrozenStyle) -> None:
+    for key in _STATE_KEYS + _ICON_KEYS:
+        if key not in resolved:
+            props.pop(key, None)
+    for key, value in resolved.items():
+        # Resolved values are shared; only containers need their own copy
+        props[key] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
 class StyleDataService(QObject):
     """Manages button style definitions."""
 
     # Emitted with the ID of the style that changed.  An empty string
     # indicates a bulk change (e.g. project load).
     styles_changed = pyqtSignal(str)
+    # Emitted after an edited style was written to its instances, with
+    # ``{screen_id: [instance_id, ...]}`` of every affected button.
+    style_applied = pyqtSignal(str, dict)
 
     def __init__(self, bus: DataContext):
         super().__init__()
         self._bus = bus
         self._styles: Dict[str, Dict[str, Any]] = {}
+        # Resolved style per ID, dropped when that style changes
+        self._resolved: Dict[str, FrozenStyle] = {}
+        # screen_id -> style_id -> button child dicts using it (lazy)
+        self._users: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._watching_screens = False
 
         # Bridge into the shared data context
         self.styles_changed.connect(
@@ -88,6 +129,7 @@ class StyleDataService(QObject):
     def clear_all(self) -> None:
         """Remove all styles and restore the built-in default."""
         self._styles.clear()
+        self._resolved.clear()
         self.add_style(_qt_default_style())
         self.styles_changed.emit("")
 
@@ -119,6 +161,7 @@ class StyleDataService(QObject):
         data = copy.deepcopy(style_data)
         data["id"] = sid
         self._styles[sid] = data
+        self._resolved.pop(sid, None)
         self.styles_changed.emit(sid)
         return sid
 
@@ -129,6 +172,7 @@ class StyleDataService(QObject):
         data = copy.deepcopy(style_data)
         data["id"] = style_id
         self._styles[style_id] = data
+        self._resolved.pop(style_id, None)
         self._apply_style_to_buttons(style_id, data)
         self.styles_changed.emit(style_id)
         return True
@@ -139,6 +183,7 @@ class StyleDataService(QObject):
             return False
         if style_id in self._styles:
             del self._styles[style_id]
+            self._resolved.pop(style_id, None)
             # Apply the default style to buttons that used the removed one
             self._apply_style_to_buttons(style_id, self.get_default_style())
             self.styles_changed.emit(style_id)
@@ -154,57 +199,89 @@ class StyleDataService(QObject):
     def load_from_project(self, project_data: Dict[str, Any]) -> None:
         styles = project_data.get("styles", {})
         self._styles = {sid: copy.deepcopy(s) for sid, s in styles.items()}
+        self._resolved.clear()
         # Guarantee the default style exists
         if _QT_DEFAULT_STYLE_ID not in self._styles:
             self._styles[_QT_DEFAULT_STYLE_ID] = _qt_default_style()
         self.styles_changed.emit("")
 
+    # ------------------------------------------------------------------
+    # Style resolution
+    # ------------------------------------------------------------------
+    def resolve_style(self, style_id: str) -> Optional[FrozenStyle]:
+        """Return the keys ``style_id`` applies to an instance (cached)."""
+        resolved = self._resolved.get(style_id)
+        if resolved is None:
+            data = self._styles.get(style_id)
+            if data is None:
+                return None
+            resolved = self._resolved[style_id] = _resolve(data)
+        return resolved
+
+    def apply_resolved_style(
+        self, props: Dict[str, Any], style_id: str, new_id: str | None = None
+    ) -> bool:
+        """Write the resolved ``style_id`` (default style if unknown) into ``props``."""
+        resolved = self.resolve_style(style_id) or self.resolve_style(_QT_DEFAULT_STYLE_ID)
+        if resolved is None:
+            return False
+        if new_id is not None:
+            props["style_id"] = new_id
+        _write_resolved(props, resolved)
+        return True
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _watch_screens(self, screen_service) -> None:
+        if self._watching_screens:
+            return
+        screen_service.screen_modified.connect(lambda sid: self._users.pop(sid, None))
+        screen_service.screen_list_changed.connect(self._users.clear)
+        self._watching_screens = True
+
+    def _users_of(self, screen_id: str, screen: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        users = self._users.get(screen_id)
+        if users is None:
+            users = {}
+            for child in screen.get("children", []):
+                sid = child.get("properties", {}).get("style_id")
+                if sid:
+                    users.setdefault(sid, []).append(child)
+            self._users[screen_id] = users
+        return users
+
     def _apply_style_to_buttons(self, style_id: str, style_def: Dict[str, Any]) -> None:
         """Update all button instances using the given style."""
         try:
             from services.screen_data_service import screen_service
         except Exception:  # pragma: no cover - defensive
             return
+        self._watch_screens(screen_service)
 
         new_id = style_def.get("id", style_id)
+        resolved = self.resolve_style(new_id) or _resolve(style_def)
+        affected: Dict[str, List[str]] = {}
         for sid, screen in screen_service.get_all_screens().items():
-            changed = False
-            for child in screen.get("children", []):
+            users = self._users_of(sid, screen)
+            children = users.pop(style_id, None)
+            if not children:
+                continue
+            ids: List[str] = []
+            kept: List[Dict[str, Any]] = []
+            for child in children:
                 props = child.get("properties", {})
                 if props.get("style_id") != style_id:
                     continue
                 props["style_id"] = new_id
-                props.update(copy.deepcopy(style_def.get("properties", {})))
-                if "hover_properties" in style_def:
-                    props["hover_properties"] = copy.deepcopy(style_def["hover_properties"])
-                else:
-                    props.pop("hover_properties", None)
-                if "pressed_properties" in style_def:
-                    props["pressed_properties"] = copy.deepcopy(
-                        style_def["pressed_properties"]
-                    )
-                else:
-                    props.pop("pressed_properties", None)
-                if "disabled_properties" in style_def:
-                    props["disabled_properties"] = copy.deepcopy(
-                        style_def["disabled_properties"]
-                    )
-                else:
-                    props.pop("disabled_properties", None)
-                if style_def.get("icon"):
-                    props["icon"] = style_def["icon"]
-                else:
-                    props.pop("icon", None)
-                if style_def.get("hover_icon"):
-                    props["hover_icon"] = style_def["hover_icon"]
-                else:
-                    props.pop("hover_icon", None)
-                changed = True
-            if changed:
-                screen_service.notify_screen_update(sid)
+                _write_resolved(props, resolved)
+                kept.append(child)
+                ids.append(child.get("instance_id"))
+            users.setdefault(new_id, []).extend(kept)
+            if ids:
+                affected[sid] = ids
+        if affected:
+            self.style_applied.emit(style_id, affected)
 
 
 style_data_service = StyleDataService(data_context)
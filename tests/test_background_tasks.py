@@ -0,0 +1,76 @@
+import logging
+
+import pytest
+
+from runtime_simulator.background_tasks import BackgroundTasks
+from runtime_simulator.data_manager import DataManager
+
+
+@pytest.fixture
+def tasks():
+    data_mgr = DataManager()
+    data_mgr.set("A", 0)
+    data_mgr.set("B", 0)
+    data_mgr.set("Count", 0)
+    return BackgroundTasks(data_mgr)
+
+
+def _count_runs(tasks, task_id):
+    return tasks.stats()[task_id]["runs"]
+
+
+def test_trigger_reading_several_changed_tags_runs_once(tasks):
+    task_id = tasks.add_task(
+        {
+            "type": "trigger",
+            "expr": "read('A') > 1 and read('B') > 1",
+            "edge": "both",
+            "action": {"kind": "set_tag", "tag": "Count", "value": 1},
+        }
+    )
+    with tasks.data_mgr.transaction():
+        tasks.data_mgr.set("A", 5)
+        tasks.data_mgr.set("B", 5)
+    assert _count_runs(tasks, task_id) == 1
+
+
+@pytest.mark.parametrize("edge, fires", [("rising", [True, False]), ("falling", [False, True]), ("both", [True, True])])
+def test_edges(tasks, edge, fires):
+    task_id = tasks.add_task(
+        {
+            "type": "trigger",
+            "expr": "read('A') > 1",
+            "edge": edge,
+            "action": {"kind": "set_tag", "tag": "Count", "value": 1},
+        }
+    )
+    runs = []
+    for value in (5, 0):
+        before = _count_runs(tasks, task_id)
+        tasks.data_mgr.set("A", value)
+        runs.append(_count_runs(tasks, task_id) > before)
+    assert runs == fires
+
+
+def test_unknown_edge_is_rejected(tasks):
+    spec = {
+        "type": "trigger",
+        "expr": "read('A') > 1",
+        "edge": "sideways",
+        "action": {"kind": "set_tag", "tag": "Count", "value": 1},
+    }
+    with pytest.raises(ValueError, match="sideways"):
+        tasks.add_task(spec)
+
+
+def test_initialize_skips_invalid_tasks(tasks, caplog):
+    spec = {
+        "type": "trigger",
+        "expr": "read('A') > 1",
+        "edge": "Rising",
+        "action": {"kind": "set_tag", "tag": "Count", "value": 1},
+    }
+    with caplog.at_level(logging.WARNING):
+        tasks.initialize([spec])
+    assert tasks.task_ids() == []
+    assert "Unknown trigger edge" in caplog.text
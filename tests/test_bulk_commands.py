@@ -0,0 +1,122 @@
+import random
+import uuid
+
+import pytest
+
+from services.commands import (
+    BulkAddChildrenCommand,
+    BulkMoveChildCommand,
+    BulkRemoveChildrenCommand,
+    BulkResizeChildCommand,
+)
+from services.screen_data_service import screen_service
+
+
+def _child(embedded_id=None):
+    child = {
+        "instance_id": str(uuid.uuid4()),
+        "properties": {"position": {"x": 0, "y": 0}, "size": {"width": 100, "height": 40}},
+    }
+    if embedded_id:
+        child["screen_id"] = embedded_id
+    return child
+
+
+@pytest.fixture
+def screens():
+    embedded = screen_service._perform_add_screen({"type": "base", "number": 9001})
+    children = [_child(embedded if i % 5 == 0 else None) for i in range(30)]
+    parent = screen_service._perform_add_screen({"type": "base", "number": 9002, "children": children})
+    yield parent, embedded
+    screen_service._perform_remove_screen(parent)
+    screen_service._perform_remove_screen(embedded)
+
+
+def _ids(screen_id):
+    return [c["instance_id"] for c in screen_service.get_screen(screen_id)["children"]]
+
+
+def test_bulk_remove_undo_restores_stacking_order(screens):
+    parent, _embedded = screens
+    rng = random.Random(2)
+    for _ in range(20):
+        before = _ids(parent)
+        picked = rng.sample(before, rng.randint(1, len(before)))
+        # Selection order must not matter
+        rng.shuffle(picked)
+        cmd = BulkRemoveChildrenCommand(parent, picked)
+        cmd.redo()
+        assert _ids(parent) == [i for i in before if i not in picked]
+        cmd.undo()
+        assert _ids(parent) == before
+
+
+def test_bulk_remove_keeps_embed_index_current(screens):
+    parent, embedded = screens
+    embeds = [c["instance_id"] for c in screen_service.get_screen(parent)["children"] if c.get("screen_id")]
+    partial = BulkRemoveChildrenCommand(parent, embeds[:-1])
+    partial.redo()
+    assert parent in screen_service._child_to_parents.get(embedded, ())
+    last = BulkRemoveChildrenCommand(parent, embeds[-1:])
+    last.redo()
+    assert parent not in screen_service._child_to_parents.get(embedded, ())
+    last.undo()
+    partial.undo()
+    assert parent in screen_service._child_to_parents.get(embedded, ())
+
+
+def test_bulk_add_undo_removes_only_added(screens):
+    parent, _embedded = screens
+    before = _ids(parent)
+    new = [_child() for _ in range(5)]
+    cmd = BulkAddChildrenCommand(parent, new)
+    cmd.redo()
+    assert _ids(parent) == before + [c["instance_id"] for c in new]
+    cmd.undo()
+    assert _ids(parent) == before
+
+
+def test_bulk_move_round_trip(screens):
+    parent, _embedded = screens
+    ids = _ids(parent)[:3]
+    moves = [(i, {"x": n * 10, "y": n * 20}, {"x": 0, "y": 0}) for n, i in enumerate(ids, 1)]
+    cmd = BulkMoveChildCommand(parent, moves)
+
+    def positions():
+        children = {c["instance_id"]: c for c in screen_service.get_screen(parent)["children"]}
+        return [children[i]["properties"]["position"] for i in ids]
+
+    cmd.redo()
+    assert positions() == [{"x": 10, "y": 20}, {"x": 20, "y": 40}, {"x": 30, "y": 60}]
+    cmd.undo()
+    assert positions() == [{"x": 0, "y": 0}] * 3
+
+
+def test_bulk_resize_round_trip_keeps_embedded_geometry_on_instance(screens):
+    parent, embedded = screens
+    button_id = _ids(parent)[1]
+    embed = {
+        "instance_id": str(uuid.uuid4()),
+        "screen_id": embedded,
+        "position": {"x": 0, "y": 0},
+        "size": {"width": 200, "height": 150},
+    }
+    screen_service.get_screen(parent)["children"].append(embed)
+    cmd = BulkResizeChildCommand(
+        parent,
+        [
+            (button_id, (5, 6, 120, 50), (0, 0, 100, 40)),
+            (embed["instance_id"], (10, 20, 300, 250), (0, 0, 200, 150)),
+        ],
+    )
+    children = {c["instance_id"]: c for c in screen_service.get_screen(parent)["children"]}
+    button = children[button_id]
+
+    cmd.redo()
+    assert button["properties"]["size"] == {"width": 120, "height": 50}
+    assert embed["size"] == {"width": 300, "height": 250}
+    assert embed["position"] == {"x": 10, "y": 20}
+    assert "properties" not in embed
+    cmd.undo()
+    assert button["properties"]["position"] == {"x": 0, "y": 0}
+    assert embed["size"] == {"width": 200, "height": 150}
@@ -0,0 +1,31 @@
+from runtime_simulator.data_manager import DataManager
+from runtime_simulator.widgets.button_runtime import ButtonRuntimeController
+
+
+def _controller(condition):
+    data_mgr = DataManager()
+    data_mgr.set("A", 0)
+    data_mgr.set("B", 0)
+    config = {
+        "instance_id": "b1",
+        "properties": {
+            "background_color": "#000000",
+            "conditional_styles": [
+                {"style_id": "hot", "condition": condition, "properties": {"background_color": "#ff0000"}},
+            ],
+        },
+    }
+    return data_mgr, ButtonRuntimeController(data_mgr, config)
+
+
+def test_evaluations_count_only_changes_to_style_inputs():
+    data_mgr, ctrl = _controller("A > 1")
+    ctrl.refresh_style()
+    assert ctrl.style_evaluations == 1
+    data_mgr.set("B", 5)
+    assert ctrl.style_evaluations == 1
+    data_mgr.set("A", 5)
+    assert ctrl.style_evaluations == 2
+    assert ctrl.evaluate_style()["background_color"] == "#ff0000"
+    # evaluate_style is a query; it is not counted
+    assert ctrl.style_evaluations == 2
@@ -0,0 +1,103 @@
+import random
+import uuid
+
+import pytest
+
+from services.commands import AddChildCommand, BulkRemoveChildrenCommand, MoveChildCommand
+from services.data_context import data_context
+from services.screen_data_service import ChildrenDelta, screen_service
+
+
+def _child():
+    return {
+        "instance_id": str(uuid.uuid4()),
+        "properties": {"position": {"x": 0, "y": 0}, "size": {"width": 100, "height": 40}},
+    }
+
+
+@pytest.fixture
+def screen():
+    screen_id = screen_service._perform_add_screen(
+        {"type": "base", "number": 9010, "children": [_child() for _ in range(10)]}
+    )
+    yield screen_id
+    screen_service._perform_remove_screen(screen_id)
+
+
+@pytest.fixture
+def deltas(screen):
+    events = []
+
+    def on_event(event):
+        if event.get("screen_id") == screen:
+            events.append(event.get("delta"))
+
+    data_context.screens_changed.connect(on_event)
+    yield events
+    data_context.screens_changed.disconnect(on_event)
+
+
+def _ids(screen_id):
+    return [c["instance_id"] for c in screen_service.get_screen(screen_id)["children"]]
+
+
+def _run(cmd):
+    cmd.redo()
+    cmd.notify()
+
+
+def _undo(cmd):
+    cmd.undo()
+    cmd.notify()
+
+
+def test_add_and_undo_report_the_child(screen, deltas):
+    child = _child()
+    cmd = AddChildCommand(screen, child)
+    _run(cmd)
+    _undo(cmd)
+    assert deltas == [
+        ChildrenDelta(added=(child["instance_id"],)),
+        ChildrenDelta(removed=(child["instance_id"],)),
+    ]
+
+
+def test_move_reports_an_update_only(screen, deltas):
+    iid = _ids(screen)[3]
+    _run(MoveChildCommand(screen, iid, {"x": 5, "y": 5}, {"x": 0, "y": 0}))
+    assert deltas == [ChildrenDelta(updated=(iid,))]
+
+
+def test_bulk_remove_undo_reports_a_reorder(screen, deltas):
+    ids = _ids(screen)
+    removed = [ids[1], ids[4], ids[8]]
+    cmd = BulkRemoveChildrenCommand(screen, removed)
+    _run(cmd)
+    _undo(cmd)
+    assert deltas == [
+        ChildrenDelta(removed=tuple(removed)),
+        ChildrenDelta(added=tuple(removed), reordered=True),
+    ]
+    assert _ids(screen) == ids
+
+
+def test_delta_is_only_attached_during_its_notification(screen, deltas):
+    screen_service.notify_children_changed(screen, updated=("x",))
+    screen_service.screen_modified.emit(screen)
+    assert deltas == [ChildrenDelta(updated=("x",)), None]
+    assert screen_service._pending_deltas == {}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_add_children_restores_removed_indices(screen, seed):
+    rng = random.Random(seed)
+    ids = _ids(screen)
+    picked = rng.sample(ids, rng.randint(1, len(ids)))
+    removed = screen_service._perform_remove_children(screen, picked)
+    assert sorted(index for index, _ in removed) == sorted(ids.index(i) for i in picked)
+    # Indices need not arrive sorted
+    rng.shuffle(removed)
+    screen_service._perform_add_children(
+        screen, [child for _, child in removed], [index for index, _ in removed]
+    )
+    assert _ids(screen) == ids
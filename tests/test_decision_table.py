@@ -0,0 +1,135 @@
+import random
+
+import pytest
+
+from tools.button.actions.constants import TriggerMode
+from tools.button.conditional_style import ConditionalStyle, ConditionalStyleManager, StyleProperties
+from tools.button.conditional_style.safe_eval import _safe_eval
+
+_OPS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+}
+
+
+def _tag(name):
+    return {"source": "tag", "value": {"tag_name": name}}
+
+
+def _const(value):
+    return {"source": "constant", "value": value}
+
+
+def _value(data, tag_values):
+    """Operand lookup as the interpreting manager did it."""
+    if data.get("source") == "constant":
+        return float(data["value"])
+    return tag_values.get(data["value"]["tag_name"])
+
+
+def _reference_check(style, tag_values):
+    """First-match condition check of the manager before the decision table."""
+    cfg = style.condition_data
+    mode = cfg.get("mode", TriggerMode.ORDINARY.value)
+    if mode == TriggerMode.ORDINARY.value:
+        if style.condition is None:
+            return True, None
+        val, err = _safe_eval(style.condition, tag_values)
+        return (False, f"Expression error: {err}") if err else (bool(val), None)
+    value = _value(cfg["operand1"], tag_values)
+    if mode in (TriggerMode.ON.value, TriggerMode.OFF.value):
+        if value is None:
+            return False, "ON/OFF condition: operand1 tag value not found"
+        return bool(value) == (mode == TriggerMode.ON.value), None
+    if value is None:
+        return False, "RANGE condition: operand1 tag value not found"
+    operator = cfg["operator"]
+    if operator in ("between", "outside"):
+        lower = _value(cfg["lower_bound"], tag_values)
+        upper = _value(cfg["upper_bound"], tag_values)
+        inside = lower <= value <= upper
+        return inside if operator == "between" else not inside, None
+    other = _value(cfg["operand2"], tag_values)
+    if other is None:
+        return False, "RANGE condition: operand2 value not found"
+    return _OPS[operator](value, other), None
+
+
+def _reference_style(manager, tag_values, state, errors):
+    base = dict(manager.default_style)
+    for style in manager.conditional_styles:
+        match, err = _reference_check(style, tag_values)
+        if err:
+            errors.append(err)
+        if match:
+            props = base.copy()
+            props.update(style.properties.to_dict())
+            if state:
+                props.update(getattr(style, f"{state}_properties").to_dict())
+            if style.tooltip:
+                props["tooltip"] = style.tooltip
+            return props
+    return base
+
+
+def _style(n, mode, condition=None, **cond):
+    return ConditionalStyle(
+        style_id=f"s{n}",
+        condition=condition,
+        condition_data={"mode": mode, **cond},
+        properties=StyleProperties(background_color=f"#0000{n:02x}"),
+        hover_properties=StyleProperties(text_color=f"#00{n:02x}00"),
+        pressed_properties=StyleProperties(border_width=n),
+        tooltip=f"style {n}" if n % 2 else "",
+    )
+
+
+@pytest.fixture
+def manager():
+    m = ConditionalStyleManager()
+    m.default_style = {"background_color": "#ffffff", "text_color": "#000000"}
+    styles = [
+        _style(1, TriggerMode.ON.value, operand1=_tag("Run")),
+        _style(2, TriggerMode.RANGE.value, operand1=_tag("Level"), operator="between",
+               lower_bound=_const(10), upper_bound=_tag("High")),
+        _style(3, TriggerMode.RANGE.value, operand1=_tag("Level"), operator="outside",
+               lower_bound=_const(-5), upper_bound=_const(90)),
+        _style(4, TriggerMode.RANGE.value, operand1=_tag("Level"), operator=">=", operand2=_tag("Limit")),
+        _style(5, TriggerMode.OFF.value, operand1=_tag("Alarm")),
+        _style(6, TriggerMode.ORDINARY.value, condition="Mode == 2 and Level < 50"),
+    ]
+    for style in styles:
+        m.add_style(style)
+    return m
+
+
+def test_decision_table_matches_interpreting_manager(manager):
+    errors = []
+    manager.condition_error.connect(errors.append)
+    rng = random.Random(31)
+    seen, reported = set(), set()
+    for _ in range(500):
+        tag_values = {
+            "Run": rng.choice([0, 1, None]),
+            "Level": rng.choice([None, rng.randint(-20, 120)]),
+            "High": rng.randint(20, 80),
+            "Limit": rng.choice([None, rng.randint(0, 100)]),
+            "Alarm": rng.choice([False, True]),
+            "Mode": rng.randint(0, 3),
+        }
+        tag_values = {k: v for k, v in tag_values.items() if v is not None}
+        for state in (None, "hover", "pressed"):
+            expected_errors = []
+            expected = _reference_style(manager, tag_values, state, expected_errors)
+            errors.clear()
+            assert dict(manager.get_active_style(tag_values, state)) == expected, tag_values
+            assert errors == expected_errors
+            reported.update(errors)
+        seen.add(manager.get_active_style(tag_values)["background_color"])
+    # Every row, the default style and every kind of missing-value error were hit
+    assert len(seen) == 7
+    assert len(reported) == 4
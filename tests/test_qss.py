@@ -0,0 +1,24 @@
+from tools.button import qss
+from tools.button.conditional_style import FrozenStyle
+
+
+def _style(color="#ff0000"):
+    return FrozenStyle.of({"background_color": color, "border_width": 2, "font_size": 30})
+
+
+def test_rules_are_shared_within_a_size_bucket():
+    style = _style()
+    a = qss.runtime_rule(style, 80, 40)
+    b = qss.runtime_rule(style, 81, 41)
+    assert a is b
+    assert qss.runtime_rule(style, 160, 80) != a
+
+
+def test_equal_styles_share_a_rule():
+    assert qss.runtime_rule(_style(), 80, 40) is qss.runtime_rule(_style(), 80, 40)
+    assert qss.runtime_rule(_style("#00ff00"), 80, 40) != qss.runtime_rule(_style(), 80, 40)
+
+
+def test_unhashable_props_are_rendered_uncached():
+    props = {"background_color": "#ff0000", "border_width": 2, "font_size": 30}
+    assert qss.runtime_rule(props, 80, 40) == qss._build_rule(props, 80, 40)
@@ -0,0 +1,58 @@
+import pytest
+
+from runtime_simulator.data_manager import DataManager
+from runtime_simulator.recipe_manager import RecipeManager
+
+
+@pytest.fixture
+def recipes():
+    data_mgr = DataManager()
+    data_mgr.initialize(
+        {
+            "Speed": {"type": "INT", "init": 0},
+            "Temp": {"type": "REAL", "init": 0.0},
+            "Run": {"type": "BOOL", "init": False},
+            "Label": {"type": "STRING", "init": ""},
+        }
+    )
+    mgr = RecipeManager(data_mgr)
+    mgr.set_recipe("fast", {"Speed": 90, "Temp": 21.5, "Run": True, "Label": "fast, hot"})
+    mgr.set_recipe("slow", {"Speed": 10, "Run": False})
+    return mgr
+
+
+def test_apply_writes_in_one_transaction(recipes):
+    data_mgr = recipes.data_mgr
+    batches, singles = [], []
+    data_mgr.tags_changed.connect(batches.append)
+    data_mgr.tag_changed.connect(lambda name, value: singles.append(name))
+    assert recipes.apply_recipe("fast") == 4
+    assert batches == [{"Speed": 90, "Temp": 21.5, "Run": True, "Label": "fast, hot"}]
+    assert singles == []
+    assert data_mgr.get("Speed") == 90
+
+
+def test_apply_skips_tags_outside_the_recipe(recipes):
+    data_mgr = recipes.data_mgr
+    recipes.apply_recipe("fast")
+    assert recipes.apply_recipe("slow") == 2
+    assert data_mgr.get("Temp") == 21.5
+    assert recipes.apply_recipe("missing") == 0
+
+
+def test_csv_round_trip(recipes, tmp_path):
+    path = str(tmp_path / "recipes.csv")
+    assert recipes.export_csv(path)
+    loaded = RecipeManager(recipes.data_mgr)
+    loaded.import_csv(path)
+    assert loaded.recipe_names() == ["fast", "slow"]
+    for name in ("fast", "slow"):
+        assert loaded.get_recipe(name) == recipes.get_recipe(name)
+    assert type(loaded.get_recipe("fast")["Speed"]) is int
+
+
+def test_import_rejects_foreign_csv(recipes, tmp_path):
+    path = tmp_path / "other.csv"
+    path.write_text("Name,Value\nSpeed,1\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        recipes.import_csv(str(path))
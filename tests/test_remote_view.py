@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from runtime_simulator.remote_view import _MirrorServer
+
+_HANDSHAKE = (
+    "GET /ws HTTP/1.1\r\nHost: 127.0.0.1\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+    "Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\nSec-WebSocket-Version: 13\r\n{origin}\r\n"
+)
+
+
+async def _status(origin):
+    joined = []
+    server = _MirrorServer(joined.append, lambda writer: None)
+    port = await server.start("127.0.0.1", 0)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    header = f"Origin: {origin}\r\n" if origin else ""
+    writer.write(_HANDSHAKE.format(origin=header).encode())
+    status = (await reader.readline()).decode()
+    writer.close()
+    await server.close()
+    return status.split()[1], bool(joined)
+
+
+@pytest.mark.parametrize(
+    "origin, status",
+    [
+        ("http://127.0.0.1:8765", "101"),
+        ("http://localhost:8765", "101"),
+        (None, "101"),
+        ("https://attacker.example", "403"),
+        ("http://127.0.0.1.attacker.example", "403"),
+    ],
+)
+def test_handshake_origin(origin, status):
+    got, joined = asyncio.run(_status(origin))
+    assert got == status
+    assert joined == (status == "101")
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from tools.button.conditional_style.safe_eval import _interpret, _safe_eval, compile_expression
+
+NAMES = ("Temp", "Speed", "MotorRun", "Mode", "Level", "Missing")
+ENVIRONMENTS = [
+    {"Temp": 72.5, "Speed": 40, "MotorRun": True, "Mode": 2, "Level": 0},
+    {"Temp": -3.0, "Speed": 0, "MotorRun": False, "Mode": 3, "Level": 7},
+    {"Temp": 100, "Speed": 250, "MotorRun": 1, "Mode": 0, "Level": -2},
+]
+
+
+def _random_expression(rng: random.Random, depth: int = 0) -> str:
+    if depth > 3 or rng.random() < 0.25:
+        choice = rng.random()
+        if choice < 0.55:
+            return rng.choice(NAMES)
+        if choice < 0.8:
+            return str(rng.randint(-5, 100))
+        return rng.choice(("True", "False", "2.5", "0"))
+    kind = rng.randrange(4)
+    a = _random_expression(rng, depth + 1)
+    if kind == 0:
+        return f"({a} {rng.choice(('+', '-', '*', '/', '%'))} {_random_expression(rng, depth + 1)})"
+    if kind == 1:
+        return f"({rng.choice(('not ', '-', '+'))}{a})"
+    if kind == 2:
+        links = " ".join(
+            f"{rng.choice(('==', '!=', '<', '<=', '>', '>='))} {_random_expression(rng, depth + 1)}"
+            for _ in range(rng.randint(1, 3))
+        )
+        return f"({a} {links})"
+    parts = [a] + [_random_expression(rng, depth + 1) for _ in range(rng.randint(1, 3))]
+    return "(" + f" {rng.choice(('and', 'or'))} ".join(parts) + ")"
+
+
+def test_compiler_matches_interpreter():
+    rng = random.Random(1234)
+    for _ in range(2000):
+        expr = _random_expression(rng)
+        for variables in ENVIRONMENTS:
+            expected = _interpret(expr, variables)
+            got = _safe_eval(expr, variables)
+            assert got == expected, expr
+            assert type(got[0]) is type(expected[0]), expr
+
+
+@pytest.mark.parametrize(
+    "expr, message",
+    [
+        ("abs(Speed)", "Function calls are not allowed"),
+        ("Speed.real", "Attribute access is not allowed"),
+        ("Speed ** 2", "Unsupported binary operator"),
+    ],
+)
+def test_unsupported_constructs_are_rejected_up_front(expr, message):
+    with pytest.raises(ValueError, match=message):
+        compile_expression(expr)
+    assert _safe_eval(expr, ENVIRONMENTS[0]) == (None, message)
+
+
+def test_syntax_error():
+    assert _safe_eval("Speed >", ENVIRONMENTS[0]) == (None, "Invalid expression syntax")
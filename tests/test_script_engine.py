@@ -0,0 +1,56 @@
+import pytest
+
+from runtime_simulator.script_engine import _compile, _exec_guarded, restricted_globals
+
+# Walks from a generator frame up to _exec_guarded's module globals
+FRAME_WALK = """
+def f():
+    yield g.gi_frame.f_back.f_back
+g = f()
+for fr in g:
+    break
+cwd = fr.f_globals["sys"].modules["os"].getcwd()
+"""
+
+
+def test_frame_walk_escape_is_rejected():
+    with pytest.raises(ValueError):
+        _compile(FRAME_WALK)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "x = (lambda: 0).__code__",
+        "def f():\n    yield 1\nx = f().gi_code",
+        "x = int.mro()",
+        "def f():\n    pass\nx = f.func_globals",
+        "try:\n    1 / 0\nexcept Exception as e:\n    x = e.__traceback__.tb_frame",
+        "x = '{0.gi_frame}'.format(1)",
+        "x = '{a}'.format_map({'a': 1})",
+        "import os",
+        "x = __builtins__",
+    ],
+)
+def test_introspection_is_rejected(source):
+    with pytest.raises(ValueError):
+        _compile(source)
+
+
+def test_value_methods_are_allowed():
+    source = (
+        "items = []\n"
+        "items.append('a'.upper())\n"
+        "d = {'k': 1}\n"
+        "total = d.get('k', 0) + sum(d.values())\n"
+        "try:\n"
+        "    raise ValueError('bad')\n"
+        "except ValueError as e:\n"
+        "    msg = e.args[0]\n"
+    )
+    namespace = restricted_globals()
+    error, timed_out = _exec_guarded(_compile(source), namespace, 1.0)
+    assert error is None and not timed_out
+    assert namespace["items"] == ["A"]
+    assert namespace["total"] == 2
+    assert namespace["msg"] == "bad"
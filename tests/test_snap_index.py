@@ -0,0 +1,70 @@
+import random
+
+from PyQt6.QtCore import QRectF
+
+from components.screen.snap_index import SnapIndex
+
+
+def _brute_nearest(rects, value, threshold, axis):
+    best = None
+    for rect in rects.values():
+        if axis == "x":
+            lines = (rect.left(), rect.center().x(), rect.right())
+        else:
+            lines = (rect.top(), rect.center().y(), rect.bottom())
+        for line in lines:
+            d = abs(line - value)
+            if d < threshold and (best is None or d < abs(best - value)):
+                best = line
+    return best
+
+
+def _random_rect(rng):
+    return QRectF(rng.randint(0, 1000), rng.randint(0, 600), rng.randint(10, 200), rng.randint(10, 100))
+
+
+def test_nearest_lines_match_a_full_scan():
+    rng = random.Random(5)
+    rects = {i: _random_rect(rng) for i in range(200)}
+    index = SnapIndex()
+    index.rebuild(rects.items())
+    # Move, drop and add items incrementally
+    for i in range(0, 200, 3):
+        rects[i] = _random_rect(rng)
+        index.update(i, rects[i])
+    for i in range(1, 200, 7):
+        del rects[i]
+        index.discard(i)
+    for i in range(200, 230):
+        rects[i] = _random_rect(rng)
+        index.update(i, rects[i])
+    assert len(index) == len(rects)
+
+    for _ in range(500):
+        x, y = rng.uniform(-20, 1220), rng.uniform(-20, 720)
+        got_x, got_y = index.nearest_x(x, 5), index.nearest_y(y, 5)
+        want_x = _brute_nearest(rects, x, 5, "x")
+        want_y = _brute_nearest(rects, y, 5, "y")
+        # Ties may resolve to either line at the same distance
+        assert (got_x is None) == (want_x is None)
+        assert got_x is None or abs(got_x - x) == abs(want_x - x)
+        assert (got_y is None) == (want_y is None)
+        assert got_y is None or abs(got_y - y) == abs(want_y - y)
+
+
+def test_threshold_is_exclusive():
+    index = SnapIndex()
+    index.update("a", QRectF(100, 100, 50, 50))
+    assert index.nearest_x(95, 5) is None
+    assert index.nearest_x(96, 5) == 100
+    assert index.nearest_y(125.5, 1) == 125
+
+
+def test_discard_removes_all_lines():
+    index = SnapIndex()
+    index.update("a", QRectF(0, 0, 10, 10))
+    index.discard("a")
+    index.discard("a")
+    assert len(index) == 0
+    assert index.nearest_x(5, 100) is None
+    assert index.nearest_y(5, 100) is None
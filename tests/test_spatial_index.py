@@ -0,0 +1,86 @@
+import random
+
+from PyQt6.QtCore import QRectF
+
+from components.screen.spatial_index import GridIndex, subtract
+
+
+def _random_rect(rng, max_size=300):
+    return QRectF(rng.uniform(-500, 3000), rng.uniform(-500, 2000), rng.uniform(1, max_size), rng.uniform(1, max_size))
+
+
+def _area(rect):
+    return rect.width() * rect.height()
+
+
+def test_subtract_covers_the_difference_exactly():
+    rng = random.Random(11)
+    for _ in range(500):
+        a, b = _random_rect(rng, 800), _random_rect(rng, 800)
+        parts = subtract(a, b)
+        overlap = max(0.0, min(a.right(), b.right()) - max(a.left(), b.left())) * max(
+            0.0, min(a.bottom(), b.bottom()) - max(a.top(), b.top())
+        )
+        assert abs(sum(map(_area, parts)) - (_area(a) - overlap)) < 1e-6
+        for part in parts:
+            assert a.contains(part)
+            assert not part.intersects(b)
+        for i, p in enumerate(parts):
+            for q in parts[i + 1:]:
+                assert not p.intersects(q)
+
+
+def test_subtract_edge_cases():
+    a = QRectF(0, 0, 10, 10)
+    assert subtract(QRectF(), a) == []
+    assert len(subtract(a, QRectF())) == 1
+    assert subtract(a, QRectF(-5, -5, 20, 20)) == []
+
+
+def test_query_matches_a_full_scan():
+    rng = random.Random(3)
+    rects = {i: _random_rect(rng) for i in range(1000)}
+    index = GridIndex(cell_size=128)
+    index.rebuild(rects.items())
+    for i in range(0, 1000, 4):
+        rects[i] = _random_rect(rng)
+        index.update(i, rects[i])
+    for i in range(1, 1000, 9):
+        del rects[i]
+        index.discard(i)
+    assert len(index) == len(rects)
+    for _ in range(200):
+        q = _random_rect(rng, 900)
+        assert index.query(q) == {k for k, r in rects.items() if r.intersects(q)}
+
+
+def test_discard_leaves_no_empty_cells():
+    index = GridIndex(cell_size=10)
+    index.update("a", QRectF(0, 0, 35, 35))
+    index.discard("a")
+    assert "a" not in index
+    assert not index._cells
+
+
+def test_incremental_band_hits_match_containment():
+    # The canvas re-tests only items overlapping the band's change
+    rng = random.Random(9)
+    rects = {i: _random_rect(rng, 150) for i in range(2000)}
+    index = GridIndex()
+    index.rebuild(rects.items())
+    hits, previous = set(), QRectF()
+    ox, oy, x, y = 400.0, 300.0, 400.0, 300.0
+    for _ in range(200):
+        x += rng.uniform(-30, 50)
+        y += rng.uniform(-30, 50)
+        band = QRectF(min(ox, x), min(oy, y), abs(x - ox), abs(y - oy))
+        candidates = set()
+        for strip in subtract(band, previous) + subtract(previous, band):
+            candidates |= index.query(strip)
+        for key in candidates:
+            if band.contains(index.rect(key)):
+                hits.add(key)
+            else:
+                hits.discard(key)
+        previous = band
+        assert hits == {k for k, r in rects.items() if band.contains(r)}
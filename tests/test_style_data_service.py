@@ -0,0 +1,102 @@
+import uuid
+
+import pytest
+
+from services.commands import AddChildCommand
+from services.screen_data_service import screen_service
+from services.style_data_service import style_data_service
+
+
+def _button(style_id):
+    return {
+        "instance_id": str(uuid.uuid4()),
+        "tool_type": "button",
+        "properties": {"style_id": style_id, "background_color": "#000000", "label": "B"},
+    }
+
+
+def _style(color, **extra):
+    return {"name": "Test", "properties": {"background_color": color, "font_size": 12}, **extra}
+
+
+@pytest.fixture
+def style():
+    style_id = style_data_service.add_style(_style("#111111"))
+    yield style_id
+    style_data_service.remove_style(style_id)
+
+
+@pytest.fixture
+def screens(style):
+    first = screen_service._perform_add_screen(
+        {"type": "base", "number": 9020, "children": [_button(style), _button(style), _button("qt_default")]}
+    )
+    second = screen_service._perform_add_screen({"type": "base", "number": 9021, "children": [_button(style)]})
+    yield first, second
+    screen_service._perform_remove_screen(first)
+    screen_service._perform_remove_screen(second)
+
+
+@pytest.fixture
+def applied():
+    events = []
+
+    def on_applied(style_id, affected):
+        events.append((style_id, affected))
+
+    style_data_service.style_applied.connect(on_applied)
+    yield events
+    style_data_service.style_applied.disconnect(on_applied)
+
+
+def _children(screen_id):
+    return screen_service.get_screen(screen_id)["children"]
+
+
+def test_update_reaches_users_on_every_screen(style, screens, applied):
+    first, second = screens
+    style_data_service.update_style(style, _style("#222222", icon="qta:fa5s.bolt"))
+    users = _children(first)[:2] + _children(second)
+    for child in users:
+        assert child["properties"]["background_color"] == "#222222"
+        assert child["properties"]["icon"] == "qta:fa5s.bolt"
+    assert _children(first)[2]["properties"]["background_color"] == "#000000"
+    assert applied == [
+        (style, {first: [c["instance_id"] for c in _children(first)[:2]],
+                 second: [_children(second)[0]["instance_id"]]}),
+    ]
+    # Keys the style no longer sets are dropped again
+    style_data_service.update_style(style, _style("#333333"))
+    assert all("icon" not in child["properties"] for child in users)
+
+
+def test_children_added_later_are_indexed(style, screens, applied):
+    first, _second = screens
+    style_data_service.update_style(style, _style("#222222"))
+    late = _button(style)
+    cmd = AddChildCommand(first, late)
+    cmd.redo()
+    cmd.notify()
+    style_data_service.update_style(style, _style("#444444"))
+    assert late["instance_id"] in applied[-1][1][first]
+    assert _children(first)[-1]["properties"]["background_color"] == "#444444"
+
+
+def test_restyled_child_is_not_touched(style, screens, applied):
+    first, _second = screens
+    # Build the index, then switch one child to another style in place
+    style_data_service.update_style(style, _style("#222222"))
+    moved = _children(first)[0]
+    moved["properties"]["style_id"] = "qt_default"
+    style_data_service.update_style(style, _style("#555555"))
+    assert moved["properties"]["background_color"] == "#222222"
+    assert moved["instance_id"] not in applied[-1][1][first]
+
+
+def test_remove_moves_users_to_the_default_style(style, screens):
+    first, second = screens
+    style_data_service.remove_style(style)
+    users = _children(first)[:2] + _children(second)
+    default = style_data_service.get_default_style()["properties"]["background_color"]
+    assert all(child["properties"]["style_id"] == "qt_default" for child in users)
+    assert all(child["properties"]["background_color"] == default for child in users)
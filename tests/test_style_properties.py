@@ -0,0 +1,32 @@
+import gc
+
+from tools.button.style_properties import _OVERLAY_MEMO_SIZE, FrozenStyle
+
+
+def test_equal_styles_are_interned():
+    assert FrozenStyle.of({"a": 1, "b": [1, 2]}) is FrozenStyle.of({"b": [1, 2], "a": 1})
+
+
+def test_overlay_merges_and_is_memoized():
+    base = FrozenStyle.of({"a": 1, "b": 2})
+    merged = base.overlay({"b": 3})
+    assert dict(merged) == {"a": 1, "b": 3}
+    assert base.overlay({"b": 3}) is merged
+
+
+def test_overlay_memo_is_bounded():
+    base = FrozenStyle.of({"a": 1})
+    for i in range(_OVERLAY_MEMO_SIZE * 10):
+        base.overlay({"probe": i})
+    assert len(base._overlays) == _OVERLAY_MEMO_SIZE
+    gc.collect()
+    # Evicted overlays and their results are no longer kept alive
+    alive = [style for style in list(FrozenStyle._interned.values()) if "probe" in style]
+    assert len(alive) == 2 * _OVERLAY_MEMO_SIZE
+
+
+def test_overlay_interns_with_the_equivalent_flat_style():
+    base = FrozenStyle.of({"a": 1, "b": {"x": [1, 2]}, "c": True})
+    merged = base.overlay({"c": 1, "d": (3,)})
+    assert merged is FrozenStyle.of({"a": 1, "b": {"x": [1, 2]}, "c": 1, "d": (3,)})
+    assert type(merged["c"]) is int
@@ -0,0 +1,52 @@
+import random
+
+from runtime_simulator.background_tasks import TimerWheel
+
+
+def test_one_shot_timers_fire_on_their_tick():
+    wheel = TimerWheel(resolution_ms=1.0)
+    rng = random.Random(7)
+    fired = {}
+    expected = {}
+    # Delays span the first three wheel levels
+    for i in range(500):
+        delay = rng.choice((rng.randint(1, 63), rng.randint(64, 4095), rng.randint(4096, 200_000)))
+        expected[i] = delay
+        wheel.schedule(lambda timer, i=i: fired.setdefault(i, wheel.current_tick), delay)
+    assert len(wheel) == 500
+
+    tick = 0
+    while tick < 200_000:
+        # Advance in uneven steps
+        tick = min(200_000, tick + rng.randint(1, 5000))
+        wheel.advance_to(tick)
+    assert fired == expected
+    assert len(wheel) == 0
+
+
+def test_cancelled_timers_do_not_fire():
+    wheel = TimerWheel(resolution_ms=1.0)
+    fired = []
+    keep = wheel.schedule(lambda timer: fired.append("keep"), 10)
+    drop = wheel.schedule(lambda timer: fired.append("drop"), 5000)
+    wheel.cancel(drop)
+    wheel.cancel(drop)
+    assert len(wheel) == 1
+    wheel.advance_to(10_000)
+    assert fired == ["keep"]
+    # Fired one-shot timers are spent
+    assert keep.cancelled
+    assert len(wheel) == 0
+
+
+def test_periodic_timer_does_not_drift():
+    wheel = TimerWheel(resolution_ms=10.0)
+    ticks = []
+    timer = wheel.schedule(lambda t: ticks.append(wheel.current_tick), 30, period_ms=50)
+    wheel.advance_to(100)
+    assert ticks == list(range(3, 101, 5))
+    wheel.cancel(timer)
+    wheel.advance_to(200)
+    assert ticks[-1] == 98
+    assert len(wheel) == 0
+
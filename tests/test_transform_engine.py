@@ -0,0 +1,139 @@
+import uuid
+
+import pytest
+
+from components.screen import transform_engine as te
+from services.commands import BulkMoveChildCommand, BulkResizeChildCommand
+from services.screen_data_service import screen_service
+
+
+def _geometry(*rects):
+    geometry = te.SelectionGeometry()
+    for i, (x, y, w, h) in enumerate(rects):
+        geometry.ids.append(f"item{i}")
+        geometry.x.append(float(x))
+        geometry.y.append(float(y))
+        geometry.w.append(float(w))
+        geometry.h.append(float(h))
+    return geometry
+
+
+RECTS = _geometry((10, 50, 40, 20), (100, 10, 60, 30), (30, 200, 20, 80))
+
+
+def test_bounds():
+    assert RECTS.bounds() == (10, 10, 160, 280)
+
+
+@pytest.mark.parametrize(
+    "edge, axis, expected",
+    [
+        ("left", "x", [10, 10, 10]),
+        ("right", "x", [120, 100, 140]),
+        ("center", "x", [65, 55, 75]),
+        ("top", "y", [10, 10, 10]),
+        ("bottom", "y", [260, 250, 200]),
+        ("middle", "y", [135, 130, 105]),
+    ],
+)
+def test_align(edge, axis, expected):
+    result = te.align(RECTS, edge)
+    assert getattr(result, axis) == expected
+    # The other axis and the sizes are shared, not copied
+    other = "y" if axis == "x" else "x"
+    assert getattr(result, other) is getattr(RECTS, other)
+    assert result.w is RECTS.w and result.h is RECTS.h
+
+
+def test_align_rejects_unknown_edge():
+    with pytest.raises(ValueError):
+        te.align(RECTS, "diagonal")
+
+
+def test_distribute_spaces_gaps_evenly():
+    result = te.distribute(RECTS, "x")
+    order = sorted(range(3), key=result.x.__getitem__)
+    gaps = [result.x[b] - (result.x[a] + result.w[a]) for a, b in zip(order, order[1:])]
+    assert gaps[0] == pytest.approx(gaps[1])
+    # Outermost items stay put
+    assert min(result.x) == 10
+    assert max(x + w for x, w in zip(result.x, result.w)) == 160
+
+
+def test_distribute_needs_three_items():
+    two = _geometry((0, 0, 10, 10), (50, 0, 10, 10))
+    assert te.distribute(two, "y") is two
+
+
+def test_match_size():
+    result = te.match_size(RECTS, "width")
+    assert result.w == [60, 60, 60] and result.h is RECTS.h
+    result = te.match_size(RECTS, "both", reference="smallest")
+    assert result.w == [20, 20, 20] and result.h == [20, 20, 20]
+
+
+def test_grid_arrange_reading_order():
+    result = te.grid_arrange(RECTS, columns=2, spacing=5)
+    # Reading order by (y, x): item1, item0, item2; cells are 65 x 85
+    assert (result.x[1], result.y[1]) == (10, 10)
+    assert (result.x[0], result.y[0]) == (75, 10)
+    assert (result.x[2], result.y[2]) == (10, 95)
+
+
+@pytest.fixture
+def screen():
+    children = [
+        {
+            "instance_id": str(uuid.uuid4()),
+            "properties": {"position": {"x": x, "y": y}, "size": {"width": w, "height": h}},
+        }
+        for x, y, w, h in ((10, 50, 40, 20), (100, 10, 60, 30), (30, 200, 20, 80))
+    ]
+    screen_id = screen_service._perform_add_screen({"type": "base", "number": 9101, "children": children})
+    yield screen_id
+    screen_service._perform_remove_screen(screen_id)
+
+
+def _screen_geometry(screen_id):
+    geometry = te.SelectionGeometry()
+    for child in screen_service.get_screen(screen_id)["children"]:
+        props = child["properties"]
+        geometry.ids.append(child["instance_id"])
+        geometry.x.append(props["position"]["x"])
+        geometry.y.append(props["position"]["y"])
+        geometry.w.append(props["size"]["width"])
+        geometry.h.append(props["size"]["height"])
+    return geometry
+
+
+def test_command_for_unchanged_is_none(screen):
+    before = _screen_geometry(screen)
+    assert te.command_for(screen, before, before) is None
+    # Fewer than two items are left as they are
+    single = _geometry((5, 5, 10, 10))
+    assert te.command_for(screen, single, te.align(single, "left")) is None
+
+
+def test_command_for_moves_and_undoes(screen):
+    before = _screen_geometry(screen)
+    after = te.align(before, "left")
+    cmd = te.command_for(screen, before, after)
+    assert isinstance(cmd, BulkMoveChildCommand)
+    # Only items that actually move are recorded
+    assert len(cmd.move_list) == 2
+    cmd.redo()
+    assert _screen_geometry(screen).x == [10, 10, 10]
+    cmd.undo()
+    assert _screen_geometry(screen) == before
+
+
+def test_command_for_resizes_and_undoes(screen):
+    before = _screen_geometry(screen)
+    after = te.match_size(before, "both")
+    cmd = te.command_for(screen, before, after)
+    assert isinstance(cmd, BulkResizeChildCommand)
+    cmd.redo()
+    moved = _screen_geometry(screen)
+    assert moved.w == [60, 60, 60] and moved.h == [80, 80, 80]
+    cmd.undo()
+    assert _screen_geometry(screen) == before
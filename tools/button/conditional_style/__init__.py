@@ -4,7 +4,7 @@ from .models import (
     get_styles,
     get_style_by_id,
 )
-from ..style_properties import StyleProperties
+from ..style_properties import FrozenStyle, StyleProperties
 from .manager import ConditionalStyleManager
 from .widgets import SwitchButton, IconButton, PreviewButton
 from .editor_dialog import ConditionalStyleEditorDialog
@@ -13,6 +13,7 @@ __all__ = [
     "ConditionalStyle",
     "AnimationProperties",
     "StyleProperties",
+    "FrozenStyle",
     "ConditionalStyleManager",
     "ConditionalStyleEditorDialog",
     "SwitchButton",
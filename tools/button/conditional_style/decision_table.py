@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import ast
+import operator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from tools.button.actions.constants import TriggerMode
+from ..style_properties import FrozenStyle, StyleProperties
+from .safe_eval import _get_compiled
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .models import ConditionalStyle
+
+# Shared results so condition checks allocate nothing on the common path
+_MATCH: Tuple[bool, Optional[str]] = (True, None)
+_NO_MATCH: Tuple[bool, Optional[str]] = (False, None)
+
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+# States with a dedicated ``<state>_properties`` overlay on ConditionalStyle
+_STATES = ("hover", "pressed", "disabled")
+
+Check = Callable[[Dict[str, Any]], Tuple[bool, Optional[str]]]
+Accessor = Callable[[Dict[str, Any]], Any]
+
+
+def _none(tag_values: Dict[str, Any]) -> Any:
+    return None
+
+
+def _bind_operand(data: Optional[Dict[str, Any]]) -> Accessor:
+    """Pre-bind an operand description to a ``tag_values -> value`` accessor.
+
+    Constants are converted to ``float`` once; tag operands become a single
+    dict lookup.  Anything unresolvable yields ``None``.
+    """
+    if not data:
+        return _none
+    if "source" in data:
+        source = data.get("source")
+        value = data.get("value")
+    else:
+        main = data.get("main_tag", {})
+        source = main.get("source")
+        value = main.get("value")
+    if source == "constant":
+        try:
+            const = float(value)
+        except Exception:
+            return _none
+        return lambda tag_values: const
+    if source == "tag" and isinstance(value, dict):
+        name = value.get("tag_name")
+        return lambda tag_values: tag_values.get(name)
+    return _none
+
+
+def _operand_tag(data: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Return the tag name an operand reads, if any (see :func:`_bind_operand`)."""
+    if not data:
+        return None
+    main = data if "source" in data else data.get("main_tag", {})
+    value = main.get("value")
+    if main.get("source") == "tag" and isinstance(value, dict):
+        return value.get("tag_name")
+    return None
+
+
+def condition_inputs(condition: Any) -> Optional[FrozenSet[str]]:
+    """Return the tag names ``condition`` reads.
+
+    ``None`` means the inputs cannot be known (callable conditions), so the
+    condition must be re-evaluated on any change.
+    """
+    if condition is None:
+        return frozenset()
+    if isinstance(condition, dict):
+        names = (
+            _operand_tag(condition.get(key))
+            for key in ("operand1", "tag", "operand2", "operand", "lower_bound",
+                        "lower", "upper_bound", "upper")
+        )
+        return frozenset(n for n in names if n)
+    if isinstance(condition, str):
+        try:
+            tree = ast.parse(condition, mode="eval")
+        except SyntaxError:
+            return frozenset()
+        return frozenset(n.id for n in ast.walk(tree) if isinstance(n, ast.Name))
+    if callable(condition):
+        return None
+    return frozenset()
+
+
+def _always(tag_values: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    return _MATCH
+
+
+def _constant(result: Tuple[bool, Optional[str]]) -> Check:
+    return lambda tag_values: result
+
+
+def compile_condition(condition: Any) -> Check:
+    """Compile a style condition into a ``tag_values -> (match, error)`` check.
+
+    ``condition`` may be ``None`` (always matches), a ``condition_data``
+    dict (ON/OFF/RANGE), a callable or a safe expression string.
+    """
+    if condition is None:
+        return _always
+
+    if isinstance(condition, dict):
+        cfg = condition
+        mode = cfg.get("mode", TriggerMode.ORDINARY.value)
+        if mode == TriggerMode.ORDINARY.value:
+            return _always
+        if mode in (TriggerMode.ON.value, TriggerMode.OFF.value):
+            get = _bind_operand(cfg.get("operand1", cfg.get("tag")))
+            want = mode == TriggerMode.ON.value
+            missing = (False, "ON/OFF condition: operand1 tag value not found")
+
+            def check_on_off(tag_values):
+                value = get(tag_values)
+                if value is None:
+                    return missing
+                return _MATCH if bool(value) == want else _NO_MATCH
+
+            return check_on_off
+        if mode == TriggerMode.RANGE.value:
+            get = _bind_operand(cfg.get("operand1", cfg.get("tag")))
+            missing = (False, "RANGE condition: operand1 tag value not found")
+            op_name = cfg.get("operator", "==")
+            if op_name in ("between", "outside"):
+                lower = _bind_operand(cfg.get("lower_bound", cfg.get("lower")))
+                upper = _bind_operand(cfg.get("upper_bound", cfg.get("upper")))
+                inside = op_name == "between"
+
+                def check_bounds(tag_values):
+                    value = get(tag_values)
+                    if value is None:
+                        return missing
+                    lo = lower(tag_values)
+                    hi = upper(tag_values)
+                    try:
+                        if inside:
+                            return _MATCH if lo <= value <= hi else _NO_MATCH
+                        return _MATCH if (value < lo or value > hi) else _NO_MATCH
+                    except Exception as exc:
+                        return False, f"RANGE condition error: {exc}"
+
+                return check_bounds
+
+            get2 = _bind_operand(cfg.get("operand2", cfg.get("operand")))
+            missing2 = (False, "RANGE condition: operand2 value not found")
+            op = _OPERATORS.get(op_name)
+            unsupported = (False, f"Unsupported operator: {op_name}")
+
+            def check_compare(tag_values):
+                value = get(tag_values)
+                if value is None:
+                    return missing
+                other = get2(tag_values)
+                if other is None:
+                    return missing2
+                if op is None:
+                    return unsupported
+                try:
+                    return _MATCH if op(value, other) else _NO_MATCH
+                except Exception as exc:
+                    return False, f"RANGE comparison error: {exc}"
+
+            return check_compare
+        return _constant((False, f"Unsupported mode: {mode}"))
+
+    if callable(condition):
+
+        def check_callable(tag_values):
+            try:
+                return _MATCH if condition(tag_values) else _NO_MATCH
+            except Exception as exc:
+                return False, f"Callable condition error: {exc}"
+
+        return check_callable
+
+    if isinstance(condition, str):
+        evaluator, err = _get_compiled(condition)
+        if evaluator is None:
+            return _constant((False, f"Expression error: {err}"))
+
+        def check_expr(tag_values):
+            try:
+                val = evaluator(tag_values)
+            except Exception as exc:
+                return False, f"Expression error: {exc}"
+            return _MATCH if val else _NO_MATCH
+
+        return check_expr
+
+    try:
+        return _constant(_MATCH if condition else _NO_MATCH)
+    except Exception as exc:
+        return _constant((False, f"Invalid condition type: {exc}"))
+
+
+def _overlay(props: Any) -> Dict[str, Any]:
+    if isinstance(props, StyleProperties):
+        return props.to_dict()
+    if isinstance(props, dict):
+        return props
+    return {}
+
+
+def merge_style(base: Dict[str, Any], style: "ConditionalStyle", state: Optional[str]) -> Dict[str, Any]:
+    """Merge ``style`` (and its ``state`` overlay) over ``base``."""
+    props = base.copy()
+    props.update(style.properties.to_dict())
+    if state:
+        props.update(_overlay(getattr(style, f"{state}_properties", StyleProperties())))
+    if style.tooltip:
+        props["tooltip"] = style.tooltip
+    # RuntimeConditionalStyle has no style sheet or animation
+    style_sheet = getattr(style, "style_sheet", "")
+    if style_sheet:
+        props["style_sheet"] = style_sheet
+    animation = getattr(style, "animation", None)
+    if animation is not None and animation.enabled:
+        props["animation"] = animation.to_dict()
+    return props
+
+
+def freeze_style(base: FrozenStyle, style: "ConditionalStyle", state: Optional[str]) -> FrozenStyle:
+    """Interned equivalent of :func:`merge_style` built from cached overlays."""
+    props = base.overlay(style.properties)
+    if state:
+        props = props.overlay(getattr(style, f"{state}_properties", StyleProperties()))
+    extra = {}
+    if style.tooltip:
+        extra["tooltip"] = style.tooltip
+    style_sheet = getattr(style, "style_sheet", "")
+    if style_sheet:
+        extra["style_sheet"] = style_sheet
+    animation = getattr(style, "animation", None)
+    if animation is not None and animation.enabled:
+        extra["animation"] = animation.to_dict()
+    return props.overlay(extra)
+
+
+@dataclass(slots=True)
+class _Row:
+    check: Check
+    style: "ConditionalStyle"
+    # Inputs of this row and all rows before it (None: unknown)
+    inputs: Optional[FrozenSet[str]] = frozenset()
+    results: Dict[Optional[str], FrozenStyle] = field(default_factory=dict)
+
+
+class StyleDecisionTable:
+    """
+    Flat, precompiled form of a manager's conditional styles.
+
+    Each row holds a pre-bound condition check and the interned
+    :class:`FrozenStyle` for every state.  Rows after an unconditional style
+    are dropped since they can never be selected.  :meth:`evaluate` returns
+    shared read-only mappings and does not allocate on the common path;
+    buttons with identical styles share the same result objects.
+
+    The result when row ``i`` matches only depends on the tags read by rows
+    ``0..i``; :meth:`inputs_for` exposes that set so callers can skip
+    re-evaluation when unrelated tags change.
+    """
+
+    __slots__ = ("styles", "count", "default", "rows", "all_inputs", "_base", "_on_error")
+
+    def __init__(
+        self,
+        styles: List["ConditionalStyle"],
+        default_style: Any,
+        on_error: Callable[[str], None],
+    ):
+        self.styles = styles
+        self.count = len(styles)
+        self._on_error = on_error
+        base = FrozenStyle.of(default_style)
+        self._base = base
+        self.default: FrozenStyle = base
+        self.rows: List[_Row] = []
+        inputs: Optional[FrozenSet[str]] = frozenset()
+        for style in styles:
+            cond_cfg = getattr(style, "condition_data", {"mode": TriggerMode.ORDINARY.value})
+            condition = (
+                cond_cfg
+                if cond_cfg.get("mode", TriggerMode.ORDINARY.value)
+                != TriggerMode.ORDINARY.value
+                else style.condition
+            )
+            check = compile_condition(condition)
+            row_inputs = condition_inputs(condition)
+            inputs = None if inputs is None or row_inputs is None else inputs | row_inputs
+            row = _Row(check, style, inputs)
+            row.results[None] = freeze_style(base, style, None)
+            for state in _STATES:
+                row.results[state] = freeze_style(base, style, state)
+            self.rows.append(row)
+            if check is _always:
+                break
+        self.all_inputs: Optional[FrozenSet[str]] = inputs
+
+    def is_current(self, styles: List["ConditionalStyle"]) -> bool:
+        return styles is self.styles and len(styles) == self.count
+
+    def match(self, tag_values: Dict[str, Any]) -> int:
+        """Return the index of the first matching row, or -1."""
+        index = 0
+        for row in self.rows:
+            matched, err = row.check(tag_values)
+            if err:
+                self._on_error(err)
+            if matched:
+                return index
+            index += 1
+        return -1
+
+    def result(self, index: int, state: Optional[str] = None) -> Mapping[str, Any]:
+        """Return the frozen style for row ``index`` (``-1``: default style)."""
+        if index < 0:
+            return self.default
+        row = self.rows[index]
+        result = row.results.get(state or None)
+        if result is None:
+            # Unusual state name: merge once and keep it
+            result = freeze_style(self._base, row.style, state)
+            row.results[state] = result
+        return result
+
+    def inputs_for(self, index: int) -> Optional[FrozenSet[str]]:
+        """Return the tags the outcome of ``match() == index`` depends on."""
+        return self.all_inputs if index < 0 else self.rows[index].inputs
+
+    def evaluate(self, tag_values: Dict[str, Any], state: Optional[str] = None) -> Mapping[str, Any]:
+        return self.result(self.match(tag_values), state)
@@ -62,6 +62,7 @@ from .models import (
     _GRADIENT_STYLES,
 )
 from ..style_properties import StyleProperties
+from ..qss import ButtonQssParams, button_qss
 from .widgets import PreviewButton, SwitchButton, IconButton
 
 logger = logging.getLogger(__name__)
@@ -1806,11 +1807,6 @@ class ConditionalStyleEditorDialog(QDialog):
             except Exception:
                 alpha_pct = 100
 
-        # Helper to format QColor with alpha for QSS (rgba with 0-255 alpha)
-        def rgba_str(c: QColor, pct: int) -> str:
-            a = max(0, min(255, round(pct * 255 / 100)))
-            return f"rgba({c.red()}, {c.green()}, {c.blue()}, {a})"
-
         if component_type == "Circle Button":
             size = max(width, height)
             radius = size // 2
@@ -1823,113 +1819,34 @@ class ConditionalStyleEditorDialog(QDialog):
         else:
             self.preview_button.setFixedSize(width, height)
 
-        main_qss, hover_qss = [], []
-
-        main_qss.extend(
-            [
-                f"padding: {padding}px;",
-                f"border-top-left-radius: {tl_radius}px;",
-                f"border-top-right-radius: {tr_radius}px;",
-                f"border-bottom-right-radius: {br_radius}px;",
-                f"border-bottom-left-radius: {bl_radius}px;",
-                f"color: {text_color};",
-                f"font-size: {font_size}pt;",
-                f"font-family: '{font_family}';",
-                f"font-weight: {font_weight};",
-                f"font-style: {font_style};",
-                f"text-decoration: {text_decoration};",
-            ]
-        )
-
-        if shape_style == "Glass":
-            light_color = rgba_str(bg_color.lighter(150), alpha_pct)
-            dark_color = rgba_str(bg_color, alpha_pct)
-            border_c = self._border_color.name()
-            main_qss.append(
-                f"background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {light_color}, stop:1 {dark_color});"
-            )
-            main_qss.append(f"border: 1px solid {border_c};")
-            hover_qss.extend(
-                [
-                    f"background-color: {rgba_str(hover_bg_color, alpha_pct)};",
-                    f"color: {hover_text_color};",
-                ]
-            )
-        elif shape_style == "3D":
-            main_qss.extend(
-                [
-                    f"border-width: {border_width}px;",
-                    f"border-color: {border_color.name()};",
-                    "border-style: outset;",
-                ]
-            )
-            if bg_type == "Solid":
-                main_qss.append(f"background-color: {rgba_str(bg_color, alpha_pct)};")
-            else:
-                x1, y1, x2, y2 = (
-                    self.x1_spin.value(),
-                    self.y1_spin.value(),
-                    self.x2_spin.value(),
-                    self.y2_spin.value(),
-                )
-                main_qss.append(
-                    f"background-color: qlineargradient(x1:{x1}, y1:{y1}, x2:{x2}, y2:{y2}, stop:0 {rgba_str(bg_color, alpha_pct)}, stop:1 {rgba_str(self._bg_color2, alpha_pct)});"
-                )
-            hover_qss.extend(
-                [
-                    f"background-color: {rgba_str(hover_bg_color, alpha_pct)};",
-                    f"color: {hover_text_color};",
-                ]
-            )
-        elif shape_style == "Outline":
-            main_qss.extend(
-                [
-                    "background-color: transparent;",
-                    f"border: {border_width}px solid {bg_color.name()};",
-                    f"color: {text_color};",
-                ]
-            )
-            # Keep hover in outline style as well: transparent fill, update border/text
-            hover_qss.extend(
-                [
-                    "background-color: transparent;",
-                    f"border: {border_width}px solid {hover_bg_color.name()};",
-                    f"color: {hover_text_color};",
-                ]
-            )
-        else:
-            main_qss.extend(
-                [
-                    f"border-width: {border_width}px;",
-                    f"border-style: {border_style};",
-                    f"border-color: {border_color.name()};",
-                ]
-            )
-            if bg_type == "Solid":
-                main_qss.append(f"background-color: {rgba_str(bg_color, alpha_pct)};")
-            else:
-                x1, y1, x2, y2 = (
+        return button_qss(
+            ButtonQssParams(
+                shape_style=shape_style,
+                bg_type=bg_type,
+                padding=padding,
+                radii=(tl_radius, tr_radius, br_radius, bl_radius),
+                border_width=border_width,
+                border_style=border_style,
+                border_color=border_color.name(),
+                bg_color=bg_color.name(),
+                bg_color2=self._bg_color2.name(),
+                hover_bg_color=hover_bg_color.name(),
+                alpha_pct=alpha_pct,
+                gradient=(
                     self.x1_spin.value(),
                     self.y1_spin.value(),
                     self.x2_spin.value(),
                     self.y2_spin.value(),
-                )
-                main_qss.append(
-                    f"background-color: qlineargradient(x1:{x1}, y1:{y1}, x2:{x2}, y2:{y2}, stop:0 {rgba_str(bg_color, alpha_pct)}, stop:1 {rgba_str(self._bg_color2, alpha_pct)});"
-                )
-            hover_qss.extend(
-                [
-                    f"background-color: {rgba_str(hover_bg_color, alpha_pct)};",
-                    f"color: {hover_text_color};",
-                ]
+                ),
+                text_color=text_color,
+                hover_text_color=hover_text_color,
+                font_size=font_size,
+                font_family=font_family,
+                font_weight=font_weight,
+                font_style=font_style,
+                text_decoration=text_decoration,
             )
-
-        main_qss_str = "\n    ".join(main_qss)
-        hover_qss_str = "\n    ".join(hover_qss) if hover_qss else ""
-        final_qss = f"QPushButton {{\n    {main_qss_str}\n}}\n"
-        if hover_qss_str:
-            final_qss += f"QPushButton:hover {{\n    {hover_qss_str}\n}}\n"
-        return final_qss
+        )
 
     def update_preview(self):
         component_type = self.component_type_combo.currentText()
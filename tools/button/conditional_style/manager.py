@@ -2,14 +2,13 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from tools.button.actions.constants import TriggerMode
 from .models import ConditionalStyle
 from ..style_properties import StyleProperties
-from .safe_eval import _safe_eval
+from .decision_table import StyleDecisionTable, merge_style
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +21,34 @@ class ConditionalStyleManager(QObject):
     parent: Optional[QObject] = None
     conditional_styles: List[ConditionalStyle] = field(default_factory=list)
     _default_style: StyleProperties = field(default_factory=StyleProperties)
+    _table: Optional[StyleDecisionTable] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         QObject.__init__(self, self.parent)
-        
+
     def renumber_styles(self) -> None:
         for idx, style in enumerate(self.conditional_styles, 1):
             style.style_id = str(idx)
+        # Every in-place edit of ``conditional_styles`` ends with a renumber
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop the compiled decision table; it is rebuilt on next use."""
+        self._table = None
+
+    def compile(self) -> StyleDecisionTable:
+        """Return the decision table for the current styles, compiling if stale."""
+        table = self._table
+        if table is None or not table.is_current(self.conditional_styles):
+            table = StyleDecisionTable(
+                self.conditional_styles, self._default_style, self._report_condition_error
+            )
+            self._table = table
+        return table
+
+    def _report_condition_error(self, err: str) -> None:
+        self.condition_error.emit(err)
+        logger.warning("Condition evaluation error: %s", err)
 
     def add_style(self, style: ConditionalStyle):
         if isinstance(style.properties, dict):
@@ -101,44 +121,17 @@ class ConditionalStyleManager(QObject):
             if key not in base:
                 base[key] = defaults.get(key, "")
         self._default_style = StyleProperties.from_dict(base)
+        self.invalidate()
 
     def get_active_style(
         self, tag_values: Optional[Dict[str, Any]] = None, state: Optional[str] = None
-    ) -> Dict[str, Any]:
-        tag_values = tag_values or {}
-        base = (
-            self.default_style.to_dict()
-            if isinstance(self.default_style, StyleProperties)
-            else dict(self.default_style)
-        )
-        for style in self.conditional_styles:
-            cond_cfg = getattr(style, "condition_data", {"mode": TriggerMode.ORDINARY.value})
-            cond = style.condition
-            condition = (
-                cond_cfg
-                if cond_cfg.get("mode", TriggerMode.ORDINARY.value)
-                != TriggerMode.ORDINARY.value
-                else cond
-            )
-            match, err = self._evaluate_condition(condition, tag_values)
-            if err:
-                self.condition_error.emit(err)
-                logger.warning("Condition evaluation error: %s", err)
-            if match:
-                props = base.copy()
-                props.update(style.properties.to_dict())
-                if state:
-                    hover = getattr(style, f"{state}_properties", StyleProperties())
-                    if isinstance(hover, StyleProperties):
-                        props.update(hover.to_dict())
-                    elif isinstance(hover, dict):
-                        props.update(hover)
-                if style.tooltip:
-                    props["tooltip"] = style.tooltip
-                if style.style_sheet:
-                    props["style_sheet"] = style.style_sheet
-                return props
-        return base
+    ) -> Mapping[str, Any]:
+        """Return the merged style of the first matching conditional style.
+
+        The result is a shared read-only mapping from the compiled decision
+        table; copy it with ``dict()`` before modifying.
+        """
+        return self.compile().evaluate(tag_values or {}, state)
 
     def get_style_by_index(
         self, index: int, state: Optional[str] = None
@@ -159,122 +152,7 @@ class ConditionalStyleManager(QObject):
         if not (0 <= index < len(self.conditional_styles)):
             return base
 
-        style = self.conditional_styles[index]
-        props = base.copy()
-        props.update(style.properties.to_dict())
-
-        if state:
-            hover = getattr(style, f"{state}_properties", StyleProperties())
-            if isinstance(hover, StyleProperties):
-                props.update(hover.to_dict())
-            elif isinstance(hover, dict):
-                props.update(hover)
-
-        if style.tooltip:
-            props["tooltip"] = style.tooltip
-        if style.style_sheet:
-            props["style_sheet"] = style.style_sheet
-
-        return props
-
-    def _evaluate_condition(
-        self, condition: Any, tag_values: Dict[str, Any]
-    ) -> Tuple[bool, Optional[str]]:
-        if condition is None:
-            return True, None
-
-        if isinstance(condition, dict):
-            cfg = condition
-            mode = cfg.get("mode", TriggerMode.ORDINARY.value)
-            if mode == TriggerMode.ORDINARY.value:
-                return True, None
-            if mode in (TriggerMode.ON.value, TriggerMode.OFF.value):
-                op1 = cfg.get("operand1", cfg.get("tag"))
-                tag_val = self._extract_value(op1, tag_values)
-                if tag_val is None:
-                    return False, "ON/OFF condition: operand1 tag value not found"
-                return (
-                    bool(tag_val) if mode == TriggerMode.ON.value else not bool(tag_val)
-                ), None
-            if mode == TriggerMode.RANGE.value:
-                op1 = cfg.get("operand1", cfg.get("tag"))
-                tag_val = self._extract_value(op1, tag_values)
-                if tag_val is None:
-                    return False, "RANGE condition: operand1 tag value not found"
-                operator = cfg.get("operator", "==")
-                if operator in ["between", "outside"]:
-                    lower = self._extract_value(
-                        cfg.get("lower_bound", cfg.get("lower")), tag_values
-                    )
-                    upper = self._extract_value(
-                        cfg.get("upper_bound", cfg.get("upper")), tag_values
-                    )
-                    try:
-                        if operator == "between":
-                            return (lower <= tag_val <= upper), None
-                        else:
-                            return (tag_val < lower or tag_val > upper), None
-                    except Exception as exc:
-                        return False, f"RANGE condition error: {exc}"
-                else:
-                    operand = self._extract_value(
-                        cfg.get("operand2", cfg.get("operand")), tag_values
-                    )
-                    if operand is None:
-                        return False, "RANGE condition: operand2 value not found"
-                    try:
-                        if operator == "==":
-                            return (tag_val == operand), None
-                        if operator == "!=":
-                            return (tag_val != operand), None
-                        if operator == ">":
-                            return (tag_val > operand), None
-                        if operator == ">=":
-                            return (tag_val >= operand), None
-                        if operator == "<":
-                            return (tag_val < operand), None
-                        if operator == "<=":
-                            return (tag_val <= operand), None
-                    except Exception as exc:
-                        return False, f"RANGE comparison error: {exc}"
-                    return False, f"Unsupported operator: {operator}"
-            return False, f"Unsupported mode: {mode}"
-
-        if callable(condition):
-            try:
-                return bool(condition(tag_values)), None
-            except Exception as exc:
-                return False, f"Callable condition error: {exc}"
-
-        if isinstance(condition, str):
-            val, err = _safe_eval(condition, tag_values)
-            if err:
-                return False, f"Expression error: {err}"
-            return bool(val), None
-
-        try:
-            return bool(condition), None
-        except Exception as exc:
-            return False, f"Invalid condition type: {exc}"
-
-    def _extract_value(self, data: Optional[Dict[str, Any]], tag_values: Dict[str, Any]):
-        if not data:
-            return None
-        if "source" in data:
-            source = data.get("source")
-            value = data.get("value")
-        else:
-            main = data.get("main_tag", {})
-            source = main.get("source")
-            value = main.get("value")
-        if source == "constant":
-            try:
-                return float(value)
-            except Exception:
-                return None
-        if source == "tag" and isinstance(value, dict):
-            return tag_values.get(value.get("tag_name"))
-        return None
+        return merge_style(base, self.conditional_styles[index], state)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
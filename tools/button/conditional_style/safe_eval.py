@@ -1,15 +1,54 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 import ast
 import logging
+import operator
 from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+Evaluator = Callable[[Dict[str, Any]], Any]
+
 _AST_CACHE: "OrderedDict[str, ast.AST]" = OrderedDict()
 _AST_CACHE_MAXSIZE = 128
 
+# expr -> (evaluator, None) or (None, error message)
+_COMPILED_CACHE: "OrderedDict[str, Tuple[Optional[Evaluator], Optional[str]]]" = OrderedDict()
+_COMPILED_CACHE_MAXSIZE = 128
+
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+}
+_UNARY_OPS = {
+    ast.Not: operator.not_,
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_CMP_OPS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+
+def set_cache_size(size: int) -> None:
+    """Set how many expressions are kept parsed and compiled (LRU)."""
+    global _AST_CACHE_MAXSIZE, _COMPILED_CACHE_MAXSIZE
+    size = max(1, int(size))
+    _AST_CACHE_MAXSIZE = _COMPILED_CACHE_MAXSIZE = size
+    while len(_AST_CACHE) > size:
+        _AST_CACHE.popitem(last=False)
+    while len(_COMPILED_CACHE) > size:
+        _COMPILED_CACHE.popitem(last=False)
+
 
 def _get_parsed_ast(expr: str) -> ast.AST:
     node = _AST_CACHE.get(expr)
@@ -23,11 +62,10 @@ def _get_parsed_ast(expr: str) -> ast.AST:
     return node
 
 
-def _safe_eval(expr: str, variables: Dict[str, Any]) -> Tuple[Any, Optional[str]]:
-    """Safely evaluate a small Python expression.
+def _interpret(expr: str, variables: Dict[str, Any]) -> Tuple[Any, Optional[str]]:
+    """Reference tree-walking evaluator; same contract as :func:`_safe_eval`.
 
-    Returns (value, error).  On success error is None, otherwise value is None
-    and error contains a message.
+    Kept for benchmarking and cross-checking the compiler.
     """
     try:
         tree = _get_parsed_ast(expr)
@@ -114,3 +152,141 @@ def _safe_eval(expr: str, variables: Dict[str, Any]) -> Tuple[Any, Optional[str]
     except Exception as exc:
         logger.debug("Condition evaluation error for '%s': %s", expr, exc)
         return None, str(exc)
+
+
+def _compile_node(node: ast.AST) -> Evaluator:
+    """Translate a whitelisted AST node into a closure ``variables -> value``.
+
+    Raises ``ValueError`` with the interpreter's messages for anything
+    outside the whitelist.  Semantics follow :func:`_interpret`: boolean
+    operators evaluate every operand and return a ``bool``; comparisons
+    return ``bool`` and stop at the first false link.
+    """
+    if isinstance(node, ast.Expression):
+        return _compile_node(node.body)
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda variables: value
+    if isinstance(node, ast.Name):
+        key = node.id
+
+        def name(variables):
+            if key in variables:
+                return variables[key]
+            raise ValueError(f"Unknown variable '{key}'")
+
+        return name
+    if isinstance(node, ast.BoolOp):
+        parts = tuple(_compile_node(v) for v in node.values)
+        if isinstance(node.op, ast.And):
+            if len(parts) == 2:
+                a, b = parts
+
+                def and2(variables):
+                    x = a(variables)
+                    y = b(variables)
+                    return True if x and y else False
+
+                return and2
+            return lambda variables: all([p(variables) for p in parts])
+        if isinstance(node.op, ast.Or):
+            if len(parts) == 2:
+                a, b = parts
+
+                def or2(variables):
+                    x = a(variables)
+                    y = b(variables)
+                    return True if x or y else False
+
+                return or2
+            return lambda variables: any([p(variables) for p in parts])
+        raise ValueError("Unsupported boolean operator")
+    if isinstance(node, ast.BinOp):
+        op = _BIN_OPS.get(type(node.op))
+        if op is None:
+            raise ValueError("Unsupported binary operator")
+        left = _compile_node(node.left)
+        right = _compile_node(node.right)
+        return lambda variables: op(left(variables), right(variables))
+    if isinstance(node, ast.UnaryOp):
+        op = _UNARY_OPS.get(type(node.op))
+        if op is None:
+            raise ValueError("Unsupported unary operator")
+        operand = _compile_node(node.operand)
+        return lambda variables: op(operand(variables))
+    if isinstance(node, ast.Compare):
+        ops = []
+        for cmp_op in node.ops:
+            fn = _CMP_OPS.get(type(cmp_op))
+            if fn is None:
+                raise ValueError("Unsupported comparison operator")
+            ops.append(fn)
+        first = _compile_node(node.left)
+        rest = tuple(_compile_node(c) for c in node.comparators)
+        if len(ops) == 1:
+            op, right = ops[0], rest[0]
+            return lambda variables: True if op(first(variables), right(variables)) else False
+        links = tuple(zip(ops, rest))
+
+        def chain(variables):
+            left = first(variables)
+            for op, comparator in links:
+                right = comparator(variables)
+                if not op(left, right):
+                    return False
+                left = right
+            return True
+
+        return chain
+    if isinstance(node, ast.Call):
+        raise ValueError("Function calls are not allowed")
+    if isinstance(node, ast.Attribute):
+        raise ValueError("Attribute access is not allowed")
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+
+def compile_expression(expr: str) -> Evaluator:
+    """Validate ``expr`` once and return a single-call evaluator.
+
+    Raises ``SyntaxError`` for invalid syntax and ``ValueError`` for
+    constructs outside the whitelist (calls, attributes, ...).
+    """
+    return _compile_node(ast.parse(expr, mode="eval"))
+
+
+def _get_compiled(expr: str) -> Tuple[Optional[Evaluator], Optional[str]]:
+    entry = _COMPILED_CACHE.get(expr)
+    if entry is not None:
+        _COMPILED_CACHE.move_to_end(expr)
+        return entry
+    try:
+        entry = (compile_expression(expr), None)
+    except SyntaxError as exc:
+        logger.warning("Condition syntax error: %s", exc)
+        entry = (None, "Invalid expression syntax")
+    except ValueError as exc:
+        entry = (None, str(exc))
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.exception("Unexpected error parsing condition")
+        entry = (None, f"Parse error: {exc}")
+    _COMPILED_CACHE[expr] = entry
+    if len(_COMPILED_CACHE) > _COMPILED_CACHE_MAXSIZE:
+        _COMPILED_CACHE.popitem(last=False)
+    return entry
+
+
+def _safe_eval(expr: str, variables: Dict[str, Any]) -> Tuple[Any, Optional[str]]:
+    """Safely evaluate a small Python expression.
+
+    Returns (value, error).  On success error is None, otherwise value is None
+    and error contains a message.  Expressions are validated and compiled
+    once, then cached (see :func:`set_cache_size`).
+    """
+    evaluator, err = _get_compiled(expr)
+    if evaluator is None:
+        return None, err
+    try:
+        return evaluator(variables), None
+    except Exception as exc:
+        logger.debug("Condition evaluation error for '%s': %s", expr, exc)
+        return None, str(exc)
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 from typing import Optional
-import os
 
 from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, pyqtProperty, Qt, QSize, QPoint
 from PyQt6.QtWidgets import QPushButton, QLabel
 from PyQt6.QtGui import QColor, QPixmap, QIcon, QPainter, QBrush
-from PyQt6.QtSvg import QSvgRenderer
 
 from utils.icon_manager import IconManager
+from utils.icon_raster import icon_raster
 from utils.dpi import dpi_scale
 
 
@@ -150,23 +149,7 @@ class IconButton(QPushButton):
         if src.startswith("qta:"):
             name = src.split(":", 1)[1]
             return IconManager.create_pixmap(name, self.icon_size.width(), color=color)
-        ext = os.path.splitext(src)[1].lower()
-        if ext == ".svg":
-            renderer = QSvgRenderer(src)
-            if renderer.isValid():
-                pixmap = QPixmap(self.icon_size)
-                pixmap.fill(Qt.GlobalColor.transparent)
-                painter = QPainter(pixmap)
-                renderer.render(painter)
-                painter.end()
-                return pixmap
-            return QPixmap()
-        pix = QPixmap(src)
-        if pix and not pix.isNull():
-            return pix.scaled(
-                self.icon_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-            )
-        return QPixmap()
+        return icon_raster.pixmap(src, self.icon_size.width())
 
     def _update_icon_geometry(self):
         pix = self._icon_label.pixmap()
@@ -0,0 +1,216 @@
+"""Shared stylesheet generation for push buttons.
+
+Both the conditional style editor and the runtime simulator build button
+QSS here.  Generated text is cached: editor stylesheets by their (frozen)
+parameters, runtime rules by style fingerprint and size bucket, so buttons
+sharing a style and a similar size share one string.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Hashable, Mapping, Tuple
+
+from PyQt6.QtGui import QColor
+
+from utils.percentage import percent_to_value
+
+# Widths/heights are rounded to this many pixels before scaling styles, so
+# buttons of nearly equal size share generated rules
+SIZE_BUCKET_PX = 4
+_RULE_CACHE_SIZE = 1024
+
+
+def size_bucket(width: int, height: int) -> Tuple[int, int]:
+    step = SIZE_BUCKET_PX
+    return (
+        max(step, int(round(width / step)) * step),
+        max(step, int(round(height / step)) * step),
+    )
+
+
+# --- Editor preview stylesheet -----------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class ButtonQssParams:
+    """Resolved inputs of the editor preview stylesheet.
+
+    Colours are ``QColor`` names (``#rrggbb``); sizes are in pixels except
+    ``font_size`` (points).
+    """
+
+    shape_style: str = "Flat"
+    bg_type: str = "Solid"
+    padding: int = 0
+    radii: Tuple[int, int, int, int] = (0, 0, 0, 0)  # tl, tr, br, bl
+    border_width: int = 0
+    border_style: str = "solid"
+    border_color: str = "#000000"
+    bg_color: str = "#5a6270"
+    bg_color2: str = "#5a6270"
+    hover_bg_color: str = "#5a6270"
+    alpha_pct: int = 100
+    gradient: Tuple[float, float, float, float] = (0, 0, 0, 1)  # x1, y1, x2, y2
+    text_color: str = "#ffffff"
+    hover_text_color: str = "#ffffff"
+    font_size: int = 0
+    font_family: str = ""
+    font_weight: str = "normal"
+    font_style: str = "normal"
+    text_decoration: str = "none"
+
+
+def _rgba(name: str, pct: int) -> str:
+    c = QColor(name)
+    a = max(0, min(255, round(pct * 255 / 100)))
+    return f"rgba({c.red()}, {c.green()}, {c.blue()}, {a})"
+
+
+def _gradient(p: ButtonQssParams) -> str:
+    x1, y1, x2, y2 = p.gradient
+    return (
+        f"background-color: qlineargradient(x1:{x1}, y1:{y1}, x2:{x2}, y2:{y2}, "
+        f"stop:0 {_rgba(p.bg_color, p.alpha_pct)}, stop:1 {_rgba(p.bg_color2, p.alpha_pct)});"
+    )
+
+
+@lru_cache(maxsize=256)
+def button_qss(p: ButtonQssParams) -> str:
+    """Return the full ``QPushButton`` stylesheet (normal and hover)."""
+    tl, tr, br, bl = p.radii
+    main_qss = [
+        f"padding: {p.padding}px;",
+        f"border-top-left-radius: {tl}px;",
+        f"border-top-right-radius: {tr}px;",
+        f"border-bottom-right-radius: {br}px;",
+        f"border-bottom-left-radius: {bl}px;",
+        f"color: {p.text_color};",
+        f"font-size: {p.font_size}pt;",
+        f"font-family: '{p.font_family}';",
+        f"font-weight: {p.font_weight};",
+        f"font-style: {p.font_style};",
+        f"text-decoration: {p.text_decoration};",
+    ]
+    hover_qss = [
+        f"background-color: {_rgba(p.hover_bg_color, p.alpha_pct)};",
+        f"color: {p.hover_text_color};",
+    ]
+
+    if p.shape_style == "Glass":
+        light_color = _rgba(QColor(p.bg_color).lighter(150).name(), p.alpha_pct)
+        dark_color = _rgba(p.bg_color, p.alpha_pct)
+        main_qss.append(
+            f"background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {light_color}, stop:1 {dark_color});"
+        )
+        main_qss.append(f"border: 1px solid {p.border_color};")
+    elif p.shape_style == "Outline":
+        main_qss.extend(
+            [
+                "background-color: transparent;",
+                f"border: {p.border_width}px solid {p.bg_color};",
+                f"color: {p.text_color};",
+            ]
+        )
+        # Keep hover in outline style as well: transparent fill, update border/text
+        hover_qss = [
+            "background-color: transparent;",
+            f"border: {p.border_width}px solid {p.hover_bg_color};",
+            f"color: {p.hover_text_color};",
+        ]
+    else:
+        border_style = "outset" if p.shape_style == "3D" else p.border_style
+        main_qss.extend(
+            [
+                f"border-width: {p.border_width}px;",
+                f"border-style: {border_style};",
+                f"border-color: {p.border_color};",
+            ]
+        )
+        if p.bg_type == "Solid":
+            main_qss.append(f"background-color: {_rgba(p.bg_color, p.alpha_pct)};")
+        else:
+            main_qss.append(_gradient(p))
+
+    main_qss_str = "\n    ".join(main_qss)
+    hover_qss_str = "\n    ".join(hover_qss)
+    return (
+        f"QPushButton {{\n    {main_qss_str}\n}}\n"
+        f"QPushButton:hover {{\n    {hover_qss_str}\n}}\n"
+    )
+
+
+# --- Runtime rules -------------------------------------------------------
+
+_rules: "OrderedDict[Tuple[Hashable, int, int], str]" = OrderedDict()
+
+
+def _build_rule(props: Mapping, w: int, h: int) -> str:
+    min_dim = min(w, h)
+    default_style = props.get("default_style", {}) or {}
+    bg = props.get("background_color") or default_style.get("background_color", "#5a6270")
+    fg = props.get("text_color") or default_style.get("text_color", "#ffffff")
+    bw = percent_to_value(props.get("border_width", 0) or 0, min_dim)
+    bc = props.get("border_color", "#000000")
+
+    corners = ("border_radius_tl", "border_radius_tr", "border_radius_br", "border_radius_bl")
+    if any(props.get(k, 0) for k in corners):
+        tl, tr, br, bl = (percent_to_value(props.get(k, 0) or 0, min_dim) for k in corners)
+        radius_css = (
+            f"border-top-left-radius:{tl}px;"
+            f"border-top-right-radius:{tr}px;"
+            f"border-bottom-right-radius:{br}px;"
+            f"border-bottom-left-radius:{bl}px;"
+        )
+    else:
+        radius = percent_to_value(props.get("border_radius", 0) or 0, min_dim)
+        radius_css = f"border-radius:{radius}px;"
+
+    font_css = f"font-size:{percent_to_value(props.get('font_size', 0) or 0, h)}px;"
+    font_family = props.get("font_family")
+    if font_family:
+        font_css += f"font-family:'{font_family}';"
+    if props.get("bold"):
+        font_css += "font-weight:bold;"
+    if props.get("italic"):
+        font_css += "font-style:italic;"
+    if props.get("underline"):
+        font_css += "text-decoration:underline;"
+
+    return (
+        f"background-color:{bg};color:{fg};"
+        f"border:{bw}px solid {bc};"
+        f"{radius_css}{font_css}"
+    )
+
+
+def runtime_rule(props: Mapping, width: int, height: int) -> str:
+    """Return the declaration block for a runtime button.
+
+    ``props`` should be a hashable resolved style (``FrozenStyle``); other
+    mappings are rendered without caching.
+    """
+    w, h = size_bucket(width, height)
+    try:
+        key = (props, w, h)
+        rule = _rules.get(key)
+    except TypeError:
+        return _build_rule(props, w, h)
+    if rule is None:
+        rule = _build_rule(props, w, h)
+        _rules[key] = rule
+        if len(_rules) > _RULE_CACHE_SIZE:
+            _rules.popitem(last=False)
+    else:
+        _rules.move_to_end(key)
+    return rule
+
+
+def cache_info() -> Dict[str, int]:
+    info = button_qss.cache_info()
+    return {
+        "runtime_rules": len(_rules),
+        "editor_hits": info.hits,
+        "editor_misses": info.misses,
+    }
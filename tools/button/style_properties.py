@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import MISSING, dataclass, field, fields
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterator, Tuple
 import copy
+import weakref
 
 
 @dataclass(slots=True)
@@ -40,31 +43,47 @@ class StyleProperties:
     extra: Dict[str, Any] = field(default_factory=dict)
 
     # --- dict-like helpers ---------------------------------------------------
-    def _field_names(self) -> Iterable[str]:
-        return [f.name for f in fields(self) if f.name != "extra"]
+    def _field_names(self) -> Tuple[str, ...]:
+        return _FIELD_NAMES
 
     def _as_dict(self) -> Dict[str, Any]:
-        data = {name: getattr(self, name) for name in self._field_names()}
+        data = {name: getattr(self, name) for name in _FIELD_NAMES}
         data.update(self.extra)
         return data
 
     def to_dict(self) -> Dict[str, Any]:
-        return copy.deepcopy(self._as_dict())
+        data = self._as_dict()
+        # Only nested containers need copying; scalars are immutable
+        for key, value in data.items():
+            if isinstance(value, (dict, list)):
+                data[key] = copy.deepcopy(value)
+        return data
+
+    def freeze(self) -> "FrozenStyle":
+        """Return the interned, immutable form of these properties."""
+        return FrozenStyle.of(self._as_dict())
 
     # Mapping protocol --------------------------------------------------------
     def __getitem__(self, key):
-        if key in self._field_names():
+        if key in _FIELD_SET:
             return getattr(self, key)
         return self.extra[key]
 
     def __setitem__(self, key, value):
-        if key in self._field_names():
+        if key in _FIELD_SET:
             setattr(self, key, value)
         else:
             self.extra[key] = value
 
+    def __delitem__(self, key):
+        if key in _FIELD_SET:
+            # Fields cannot be removed; fall back to the declared default
+            setattr(self, key, _field_default(key))
+        else:
+            del self.extra[key]
+
     def get(self, key, default=None):
-        if key in self._field_names():
+        if key in _FIELD_SET:
             return getattr(self, key)
         return self.extra.get(key, default)
 
@@ -73,7 +92,7 @@ class StyleProperties:
             self[k] = v
 
     def __contains__(self, key):
-        return key in self._field_names() or key in self.extra
+        return key in _FIELD_SET or key in self.extra
 
     def __iter__(self):
         return iter(self.to_dict())
@@ -124,18 +143,160 @@ class StyleProperties:
         if not data:
             return cls()
         data = cls._normalize(dict(data))
-        known = {}
-        for field in fields(cls):
-            if field.name == "extra":
-                continue
-            default_value = (
-                field.default
-                if field.default is not MISSING
-                else field.default_factory()
-                if field.default_factory is not MISSING
-                else None
-            )
-            known[field.name] = data.pop(field.name, default_value)
+        known = {name: data.pop(name, _field_default(name)) for name in _FIELD_NAMES}
         inst = cls(**known)
         inst.extra = data
         return inst
+
+
+# Field index, computed once instead of per lookup via ``dataclasses.fields``
+_FIELD_NAMES: Tuple[str, ...] = tuple(
+    f.name for f in fields(StyleProperties) if f.name != "extra"
+)
+_FIELD_SET = frozenset(_FIELD_NAMES)
+_FIELD_DEFAULTS: Dict[str, Any] = {
+    f.name: f.default for f in fields(StyleProperties) if f.default is not MISSING
+}
+_FIELD_FACTORIES = {
+    f.name: f.default_factory
+    for f in fields(StyleProperties)
+    if f.default_factory is not MISSING
+}
+
+
+def _field_default(name: str) -> Any:
+    if name in _FIELD_DEFAULTS:
+        return _FIELD_DEFAULTS[name]
+    factory = _FIELD_FACTORIES.get(name)
+    return factory() if factory is not None else None
+
+
+def _freeze_value(value: Any) -> Any:
+    """Return a hashable stand-in for ``value`` (used for interning only).
+
+    Leaves are tagged with their type so that e.g. ``True`` and ``1`` or a
+    list and a tuple never intern to the same style.
+    """
+    if isinstance(value, dict):
+        return dict, frozenset((k, _freeze_value(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = (_freeze_value(v) for v in value)
+        return type(value), frozenset(items) if isinstance(value, (set, frozenset)) else tuple(items)
+    return type(value), value
+
+
+# Overlay results remembered per base style.  Bounded so an interned style
+# does not keep every style ever overlaid on it alive.
+_OVERLAY_MEMO_SIZE = 8
+
+
+class FrozenStyle(Mapping):
+    """
+    Immutable, hashable, interned set of style properties.
+
+    Instances are created through :meth:`of`, which returns the same object
+    for equal property sets, so identical styles across many buttons share
+    one mapping and compare by identity.  :meth:`overlay` keeps the last
+    few merges per base style, so repeated overlays are computed once.
+    Merged styles are flat copies rather than layered views: lookups are
+    what renderers do most, and a flat dict keeps them direct.
+
+    Nested values (e.g. ``comment_ref``) are copied on creation and must be
+    treated as read-only.
+    """
+
+    __slots__ = ("_data", "_key", "_hash", "_overlays", "__weakref__")
+
+    _interned: "weakref.WeakValueDictionary[Any, FrozenStyle]" = weakref.WeakValueDictionary()
+
+    def __init__(self, data: Dict[str, Any], key: Any):
+        self._data = data
+        self._key = key
+        self._hash = hash(key)
+        self._overlays: "OrderedDict[FrozenStyle, FrozenStyle]" = OrderedDict()
+
+    @classmethod
+    def of(cls, data: Any) -> "FrozenStyle":
+        """Return the interned style for ``data`` (a mapping or StyleProperties)."""
+        if isinstance(data, FrozenStyle):
+            return data
+        if isinstance(data, StyleProperties):
+            data = data._as_dict()
+        key = _freeze_value(data)
+        try:
+            return cls._interned[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable leaf value: keep the style, just don't share it
+            inst = cls(copy.deepcopy(dict(data)), id(data))
+            return inst
+        return cls._intern(copy.deepcopy(dict(data)), key)
+
+    @classmethod
+    def _intern(cls, data: Dict[str, Any], key: Any) -> "FrozenStyle":
+        """Return the interned style for ``key``, creating it from ``data``."""
+        inst = cls._interned.get(key)
+        if inst is None:
+            inst = cls(data, key)
+            cls._interned[key] = inst
+        return inst
+
+    def overlay(self, other: Any) -> "FrozenStyle":
+        """Return this style with ``other``'s keys laid over it."""
+        if not other:
+            return self
+        top = FrozenStyle.of(other)
+        merged = self._overlays.get(top)
+        if merged is not None:
+            self._overlays.move_to_end(top)
+            return merged
+        # Values of interned styles are private copies and never mutated, so
+        # a shallow merge is safe; the key is merged from the frozen pairs
+        # instead of refreezing every value
+        data = self._data.copy()
+        data.update(top._data)
+        if isinstance(self._key, tuple) and isinstance(top._key, tuple):
+            pairs = [pair for pair in self._key[1] if pair[0] not in top._data]
+            pairs.extend(top._key[1])
+            merged = FrozenStyle._intern(data, (dict, frozenset(pairs)))
+        else:
+            merged = FrozenStyle.of(data)
+        self._overlays[top] = merged
+        if len(self._overlays) > _OVERLAY_MEMO_SIZE:
+            self._overlays.popitem(last=False)
+        return merged
+
+    def to_dict(self) -> Dict[str, Any]:
+        return copy.deepcopy(self._data)
+
+    # Mapping protocol --------------------------------------------------------
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, FrozenStyle):
+            return self._key == other._key and self._data == other._data
+        if isinstance(other, Mapping):
+            return self._data == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FrozenStyle({self._data!r})"
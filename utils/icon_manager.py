@@ -1,31 +1,132 @@
-from typing import List, Optional, Any, Dict, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, List, Optional, Any, Dict, Tuple
 from PyQt6.QtCore import QObject
-from PyQt6.QtGui import QIcon, QPixmap, QMovie
+from PyQt6.QtGui import QIcon, QPixmap, QMovie, QPixmapCache
 import qtawesome as qta
 
 
-_ICON_CACHE: Dict[Tuple[str, Optional[str], Optional[str]], QIcon] = {}
-"""Cache for generated :class:`QIcon` objects.
+@dataclass(slots=True)
+class IconCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
 
-The cache is unbounded and will grow until cleared via
-``IconManager.clear_cache``.
-"""
 
-_PIXMAP_CACHE: Dict[Tuple[str, int, Optional[str], Optional[str]], QPixmap] = {}
-"""Cache for generated :class:`QPixmap` objects.
+class _LruCache:
+    """LRU cache bounded by entry count and/or total cost.
+
+    ``max_bytes`` may be a callable so the budget can follow a limit owned
+    elsewhere (e.g. ``QPixmapCache.cacheLimit()``).
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[Any] = None,
+        cost: Optional[Callable[[Any], int]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._cost = cost
+        self._data: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any):
+        cost = self._cost(value) if self._cost else 0
+        old = self._data.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._data[key] = (value, cost)
+        self._bytes += cost
+        self.trim()
+
+    def trim(self):
+        budget = self.max_bytes() if callable(self.max_bytes) else self.max_bytes
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (budget is not None and self._bytes > budget)
+        ):
+            _key, (_value, cost) = self._data.popitem(last=False)
+            self._bytes -= cost
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+        self._bytes = 0
+
+    def stats(self) -> IconCacheStats:
+        return IconCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self._data),
+            bytes=self._bytes,
+        )
+
+
+def _pixmap_bytes(pix: QPixmap) -> int:
+    return pix.width() * pix.height() * 4
+
+
+def _pixmap_budget() -> int:
+    """Default pixmap budget: a quarter of Qt's ``QPixmapCache`` limit."""
+    return QPixmapCache.cacheLimit() * 1024 // 4
 
-This cache has no eviction policy.
-"""
+
+DEFAULT_MAX_ICONS = 2048
+
+_ICON_CACHE = _LruCache(max_entries=DEFAULT_MAX_ICONS)
+"""Cache for generated :class:`QIcon` objects, keyed by
+``(icon_name, color, active_color)`` and bounded by entry count."""
+
+_PIXMAP_CACHE = _LruCache(max_bytes=_pixmap_budget, cost=_pixmap_bytes)
+"""Cache for generated :class:`QPixmap` objects, keyed by
+``(icon_name, size, color, active_color)`` and bounded by pixel memory
+(``width * height * 4``)."""
 
 
 class IconManager:
     """Centralized manager for creating and converting icons.
 
     Icons are cached by ``(icon_name, color, active_color)`` and pixmaps by
-    ``(icon_name, size, color, active_color)``. Call :meth:`clear_cache` to
-    release memory.
+    ``(icon_name, size, color, active_color)`` in LRU caches: icons are
+    bounded by entry count, pixmaps by byte size (by default a quarter of
+    the ``QPixmapCache`` limit set at startup).  See :meth:`configure_cache`
+    and :meth:`cache_stats`.
     """
 
+    @staticmethod
+    def configure_cache(
+        max_icons: Optional[int] = None, max_pixmap_bytes: Optional[int] = None
+    ):
+        """Set the icon entry budget and/or the pixmap byte budget."""
+        if max_icons is not None:
+            _ICON_CACHE.max_entries = max(0, int(max_icons))
+            _ICON_CACHE.trim()
+        if max_pixmap_bytes is not None:
+            _PIXMAP_CACHE.max_bytes = max(0, int(max_pixmap_bytes))
+            _PIXMAP_CACHE.trim()
+
+    @staticmethod
+    def cache_stats() -> Dict[str, IconCacheStats]:
+        """Return hit/miss/eviction counters for the icon and pixmap caches."""
+        return {"icons": _ICON_CACHE.stats(), "pixmaps": _PIXMAP_CACHE.stats()}
+
     @staticmethod
     def create_icon(
         icon_name: str,
@@ -51,8 +152,9 @@ class IconManager:
             QIcon: A PyQt6-compatible ``QIcon``.
         """
         key = (icon_name, color, active_color)
-        if key in _ICON_CACHE:
-            return _ICON_CACHE[key]
+        cached = _ICON_CACHE.get(key)
+        if cached is not None:
+            return cached
 
         try:
             base_color = color if color is not None else "#DADADA"
@@ -77,7 +179,7 @@ class IconManager:
             print(f"Error creating icon {icon_name}: {str(e)}")
             result = QIcon()
 
-        _ICON_CACHE[key] = result
+        _ICON_CACHE.put(key, result)
         return result
 
     @staticmethod
@@ -101,8 +203,9 @@ class IconManager:
             QPixmap: A PyQt6-compatible ``QPixmap``.
         """
         key = (icon_name, size, color, active_color)
-        if key in _PIXMAP_CACHE:
-            return _PIXMAP_CACHE[key]
+        cached = _PIXMAP_CACHE.get(key)
+        if cached is not None:
+            return cached
 
         try:
             base_color = color if color is not None else "#FFFFFF"
@@ -124,7 +227,7 @@ class IconManager:
             print(f"Error creating pixmap {icon_name}: {str(e)}")
             result = QPixmap()
 
-        _PIXMAP_CACHE[key] = result
+        _PIXMAP_CACHE.put(key, result)
         return result
 
     @staticmethod
@@ -149,8 +252,8 @@ class IconManager:
     def clear_cache():
         """Clear cached icons and pixmaps.
 
-        The caches are unbounded and may consume memory over time. Call
-        this method to release stored ``QIcon`` and ``QPixmap`` instances.
+        The caches are bounded, so this is only needed to release memory
+        eagerly (e.g. after closing the icon picker).
         """
         _ICON_CACHE.clear()
         _PIXMAP_CACHE.clear()
@@ -0,0 +1,296 @@
+"""Process-wide rasterization cache for file icons (SVG and bitmap).
+
+Shared by the designer canvas, the runtime simulator and the icon picker so
+an icon file is parsed once and each ``(path, size, color, dpr)`` raster is
+produced once.  Parsed SVG renderers are kept in a small LRU; rasters are
+evicted by total byte size.  Entries are dropped when the file's mtime
+changes.
+
+Large icon sets can be rasterized on the global ``QThreadPool`` via
+:meth:`IconRasterService.request`; workers render into ``QImage`` (safe off
+the GUI thread) and the GUI thread converts the result to ``QPixmap``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QIcon, QImage, QPainter, QPixmap
+
+try:
+    from PyQt6.QtSvg import QSvgRenderer  # type: ignore
+except Exception:  # pragma: no cover - optional at runtime
+    QSvgRenderer = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+RasterKey = Tuple[str, int, Optional[str], float]
+
+# Paths rendered per worker task when rasterizing in the background
+_BATCH_SIZE = 32
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _is_svg(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() == ".svg"
+
+
+def _render_image(
+    path: str,
+    size: int,
+    color: Optional[str],
+    dpr: float,
+    renderer=None,
+) -> QImage:
+    """Rasterize ``path`` into a premultiplied ARGB image (thread-safe)."""
+    px = max(1, int(round(size * dpr)))
+    if _is_svg(path):
+        if QSvgRenderer is None:
+            return QImage()
+        if renderer is None:
+            renderer = QSvgRenderer(path)
+        if not renderer.isValid():
+            return QImage()
+        image = QImage(px, px, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        renderer.render(painter)
+        painter.end()
+    else:
+        source = QImage(path)
+        if source.isNull():
+            return QImage()
+        image = source.scaled(
+            px,
+            px,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        ).convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    if color:
+        # Tint: keep the alpha mask, replace the colour
+        painter = QPainter(image)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(image.rect(), QColor(color))
+        painter.end()
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+@dataclass(slots=True)
+class IconRasterStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    bytes: int = 0
+    entries: int = 0
+    renderers: int = 0
+
+
+class _RasterSignals(QObject):
+    done = pyqtSignal(object, object)  # RasterKey, QImage
+
+
+class _RasterRunnable(QRunnable):
+    def __init__(self, keys: List[RasterKey], signals: _RasterSignals):
+        super().__init__()
+        self.keys = keys
+        self.signals = signals
+
+    def run(self):
+        for key in self.keys:
+            path, size, color, dpr = key
+            try:
+                image = _render_image(path, size, color, dpr)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("Failed to rasterize icon '%s': %s", path, exc)
+                image = QImage()
+            self.signals.done.emit(key, image)
+
+
+class IconRasterService(QObject):
+    """Shared, bounded cache of rasterized icon files.
+
+    ``ready(path, size)`` is emitted on the GUI thread when a raster queued
+    through :meth:`request` becomes available.
+    """
+
+    ready = pyqtSignal(str, int)
+
+    def __init__(self, max_renderers: int = 64, budget_bytes: int = 32 * 1024 * 1024):
+        super().__init__()
+        self._max_renderers = max(1, int(max_renderers))
+        self._budget = max(0, int(budget_bytes))
+        # path -> (mtime, QSvgRenderer)
+        self._renderers: "OrderedDict[str, Tuple[Optional[int], object]]" = OrderedDict()
+        # key -> (mtime, QPixmap, cost)
+        self._pixmaps: "OrderedDict[RasterKey, Tuple[Optional[int], QPixmap, int]]" = OrderedDict()
+        self._bytes = 0
+        self._pending: set = set()
+        self._signals = _RasterSignals()
+        self._signals.done.connect(self._on_rendered)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    # --- Configuration / stats ------------------------------------------
+    def set_budget(self, budget_bytes: int):
+        self._budget = max(0, int(budget_bytes))
+        self._evict()
+
+    def stats(self) -> IconRasterStats:
+        return IconRasterStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            bytes=self._bytes,
+            entries=len(self._pixmaps),
+            renderers=len(self._renderers),
+        )
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop cached data for ``path`` (or everything)."""
+        if path is None:
+            self._renderers.clear()
+            self._pixmaps.clear()
+            self._bytes = 0
+            return
+        self._renderers.pop(path, None)
+        for key in [k for k in self._pixmaps if k[0] == path]:
+            self._bytes -= self._pixmaps.pop(key)[2]
+        self._invalidations += 1
+
+    # --- Lookup -----------------------------------------------------------
+    @staticmethod
+    def _key(path: str, size: int, color: Optional[str], dpr: float) -> RasterKey:
+        return (str(path), max(1, int(size)), color or None, round(float(dpr or 1.0), 2))
+
+    def _lookup(self, key: RasterKey, mtime: Optional[int]) -> Optional[QPixmap]:
+        entry = self._pixmaps.get(key)
+        if entry is None:
+            return None
+        if entry[0] != mtime:
+            # File changed (or vanished) since it was rasterized
+            self.invalidate(key[0])
+            return None
+        self._pixmaps.move_to_end(key)
+        self._hits += 1
+        return entry[1]
+
+    def _renderer(self, path: str, mtime: Optional[int]):
+        entry = self._renderers.get(path)
+        if entry is not None and entry[0] == mtime:
+            self._renderers.move_to_end(path)
+            return entry[1]
+        renderer = QSvgRenderer(path)
+        self._renderers[path] = (mtime, renderer)
+        while len(self._renderers) > self._max_renderers:
+            self._renderers.popitem(last=False)
+        return renderer
+
+    def _store(self, key: RasterKey, mtime: Optional[int], image: QImage) -> QPixmap:
+        pix = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+        cost = max(1, pix.width() * pix.height() * 4)
+        old = self._pixmaps.pop(key, None)
+        if old is not None:
+            self._bytes -= old[2]
+        self._pixmaps[key] = (mtime, pix, cost)
+        self._bytes += cost
+        self._evict()
+        return pix
+
+    def _evict(self):
+        while self._bytes > self._budget and self._pixmaps:
+            _key, (_mtime, _pix, cost) = self._pixmaps.popitem(last=False)
+            self._bytes -= cost
+            self._evictions += 1
+
+    def pixmap(
+        self, path: str, size: int, color: Optional[str] = None, dpr: float = 1.0
+    ) -> QPixmap:
+        """Return the raster of ``path`` at ``size`` logical pixels.
+
+        SVGs fill a ``size`` square; bitmaps are scaled to fit it keeping
+        their aspect ratio.  A null pixmap is returned for missing or
+        invalid files.
+        """
+        key = self._key(path, size, color, dpr)
+        mtime = _mtime(key[0])
+        cached = self._lookup(key, mtime)
+        if cached is not None:
+            return cached
+        self._misses += 1
+        if mtime is None:
+            return QPixmap()
+        renderer = self._renderer(key[0], mtime) if _is_svg(key[0]) and QSvgRenderer else None
+        image = _render_image(key[0], key[1], key[2], key[3], renderer)
+        return self._store(key, mtime, image)
+
+    def icon(
+        self, path: str, size: int, color: Optional[str] = None, dpr: float = 1.0
+    ) -> QIcon:
+        pix = self.pixmap(path, size, color, dpr)
+        return QIcon(pix) if not pix.isNull() else QIcon()
+
+    def cached(
+        self, path: str, size: int, color: Optional[str] = None, dpr: float = 1.0
+    ) -> Optional[QPixmap]:
+        """Return the cached, current raster or ``None``; never renders."""
+        key = self._key(path, size, color, dpr)
+        return self._lookup(key, _mtime(key[0]))
+
+    def request(
+        self, path: str, size: int, color: Optional[str] = None, dpr: float = 1.0
+    ) -> Optional[QPixmap]:
+        """Return the cached raster, or queue it and return ``None``.
+
+        :attr:`ready` fires once the background raster is stored.  For many
+        files, use :meth:`cached` and one :meth:`prefetch` of the misses.
+        """
+        cached = self.cached(path, size, color, dpr)
+        if cached is not None:
+            return cached
+        self.prefetch([path], size, color, dpr)
+        return None
+
+    def prefetch(
+        self,
+        paths: Iterable[str],
+        size: int,
+        color: Optional[str] = None,
+        dpr: float = 1.0,
+    ):
+        """Rasterize ``paths`` on the global thread pool."""
+        keys = []
+        for path in paths:
+            key = self._key(path, size, color, dpr)
+            if key in self._pending or key in self._pixmaps:
+                continue
+            self._pending.add(key)
+            keys.append(key)
+        pool = QThreadPool.globalInstance()
+        for i in range(0, len(keys), _BATCH_SIZE):
+            pool.start(_RasterRunnable(keys[i:i + _BATCH_SIZE], self._signals))
+
+    def _on_rendered(self, key: RasterKey, image: QImage):
+        self._pending.discard(key)
+        self._misses += 1
+        self._store(key, _mtime(key[0]), image)
+        self.ready.emit(key[0], key[1])
+
+
+# Shared by the designer, the runtime simulator and the icon picker
+icon_raster = IconRasterService()